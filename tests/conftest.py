@@ -0,0 +1,119 @@
+import http.server
+import json
+import threading
+import time
+
+import pytest
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    """ Serves the pages that the tests crawl and records how they were requested """
+
+    protocol_version = "HTTP/1.1"
+
+    # Requests by path, and current and highest number of concurrent requests
+    hits = {}
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        path = self.path
+
+        with self.lock:
+            Handler.hits[path] = Handler.hits.get(path, 0) + 1
+            Handler.active += 1
+            Handler.max_active = max(Handler.max_active, Handler.active)
+
+        try:
+            # Hold slow pages open so that concurrent requests overlap
+            "/slow/" in path and time.sleep(0.1)
+
+            # Answer revalidations of ETag pages without a body or Content-Type
+            if path.startswith("/etag/") and self.headers.get("If-None-Match"):
+                self.send_response(304)
+                self.send_header("ETag", '"v1"')
+                self.send_header("Content-Length", "0")
+                return self.end_headers()
+
+            # Reset the connection after the headers and part of the body
+            if path.startswith("/reset/"):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html")
+                self.send_header("Content-Length", "1000")
+                self.end_headers()
+                self.wfile.write(b"<html>")
+                self.wfile.flush()
+                self.close_connection = True
+                return
+
+            if path.startswith("/img/"):
+                body, content_type = b"\x89PNG", "image/png"
+            elif path.startswith("/api/"):
+                data = {"path": path, "cookie": self.headers.get("Cookie")}
+                body, content_type = json.dumps(data).encode(), "application/json"
+            elif path.startswith("/big/"):
+                body, content_type = b"<html>" + b"x" * 100000, "text/html"
+            else:
+                body = f"<html><body><h1>{path}</h1></body></html>".encode()
+                content_type = "text/html"
+
+            self.send_response(503 if path.startswith("/fail/") else 200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+
+            # Set a cookie that only a session requester keeps
+            path.startswith("/cookie/") and self.send_header("Set-Cookie", "seen=1")
+
+            # ETag pages must be revalidated while other pages stay fresh
+            if path.startswith("/etag/"):
+                self.send_header("ETag", '"v1"')
+                self.send_header("Cache-Control", "no-cache")
+            else:
+                self.send_header("Cache-Control", "max-age=60")
+
+            self.end_headers()
+            self.wfile.write(body)
+
+        finally:
+            with self.lock:
+                Handler.active -= 1
+
+
+class Server(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Clients that stop reading a body early reset their connection
+        pass
+
+
+@pytest.fixture(scope="session")
+def http_server():
+    server = Server(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+
+
+@pytest.fixture
+def server(http_server):
+    """ Returns a function that builds URLs of the test server, with reset stats """
+
+    Handler.hits, Handler.active, Handler.max_active = {}, 0, 0
+
+    def url(path):
+        return f"http://127.0.0.1:{http_server.server_port}{path}"
+
+    url.handler = Handler
+    return url
+
+
+@pytest.fixture(autouse=True)
+def in_tmp_path(tmp_path, monkeypatch):
+    """ Keeps the databases, caches and archives of each test in its own directory """
+
+    monkeypatch.chdir(tmp_path)
@@ -0,0 +1,94 @@
+import json
+
+from types import SimpleNamespace
+
+from yank import Yanker
+from yank.archive import Archive
+from yank.handoff import Handoff
+from yank.request import Request
+from yank.target import Target
+
+
+class ArchiveYanker(Yanker):
+    archive_path = "archive.yar"
+    content_types = ["text/html"]
+
+    def yank(self, target):
+        for path in self.paths:
+            self.enqueue(self.urljoin(target.url, path), self.yank_archived_pages)
+        yield from ()
+
+    @Yanker.interface(title=str)
+    def yank_archived_pages(self, target):
+        yield {"title": target.soup.select_one("h1").text}
+
+
+def test_replay_serves_recorded_responses_without_network(server):
+    recorder = ArchiveYanker(db_name="record", start_urls=[server("/start/0")])
+    recorder.paths = ["/archived/0", "/archived/1", "/img/0"]
+    recorder.yank()
+    assert recorder.archive.file.closed
+    assert recorder.tables["archived_page"].count() == 2
+    hits = dict(server.handler.hits)
+
+    # Replay an extra page that was never recorded
+    replayer = ArchiveYanker(
+        db_name="replay", start_urls=[server("/start/0")], archive_mode=Archive.REPLAY
+    )
+    replayer.paths = recorder.paths + ["/archived/new"]
+    replayer.yank()
+
+    # Nothing is fetched, the unrecorded page is skipped and the image stays aborted
+    assert server.handler.hits == hits
+    titles = {item.title for item in replayer.tables["archived_page"].all()}
+    assert titles == {"/archived/0", "/archived/1"}
+
+
+def captured(url, body, content_type):
+    """ Returns a request captured by a driver, answered by a Selenium Wire response """
+
+    request = Request(url)
+    request.set_response(
+        SimpleNamespace(
+            status_code=200,
+            headers={"Content-Type": content_type},
+            body=body,
+            request=SimpleNamespace(method="GET", headers={"Accept": "*/*"}),
+        )
+    )
+    return request
+
+
+def test_replay_restores_driver_pages_with_their_captured_requests():
+    page, api = "http://a.com/item/1", "http://api.a.com/items/1"
+    archive = Archive("archive.yar", Archive.RECORD)
+    for title in ("old", "new"):
+        data = json.dumps({"title": title}).encode()
+        archive.record_page(
+            page,
+            f"<html><h1>{title}</h1></html>",
+            final_url=page + "/",
+            cookies=[{"name": "sid", "value": "1"}],
+            requests=[
+                captured(page, b"<html></html>", "text/html"),
+                captured(api, data, "application/json"),
+            ],
+        )
+    archive.close()
+
+    archive = Archive("archive.yar", Archive.REPLAY)
+    handoff = Handoff()
+    target = Target(page, ArchiveYanker())
+    target.replay(archive, handoff=handoff)
+
+    # Only the requests captured with the latest page are restored
+    assert [request.url for request in target.requests] == [page, api]
+    assert target.requests[1].response.json == {"title": "new"}
+
+    # The page is read as a string, as from a live driver
+    assert target.response.html == "<html><h1>new</h1></html>"
+    assert target.response.url == page + "/"
+
+    # The endpoint is rediscovered from the captured requests
+    assert target.handoff_request.url == api
+    assert handoff.cookies == {"sid": "1"}
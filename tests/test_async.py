@@ -0,0 +1,51 @@
+import threading
+
+import pytest
+
+from yank import Yanker
+
+
+class AsyncYanker(Yanker):
+    retry_attempts = 1
+    retry_backoff_ms = 1
+    threads = set()
+
+    async def yank(self, target):
+        for i in range(3):
+            self.enqueue(self.urljoin(target.url, f"/async/{i}"), self.yank_async_pages)
+
+    @Yanker.interface(title=str)
+    async def yank_async_pages(self, target):
+        yield {"title": target.soup.select_one("h1").text}
+
+    def clean_async_pages(self, interface, item):
+        self.threads.add(threading.current_thread())
+
+
+def test_async_methods_run_without_an_async_requester(server):
+    yanker = AsyncYanker(db_name="blocking", start_urls=[server("/start/0")])
+    yanker.yank()
+    titles = {item.title for item in yanker.tables["async_page"].all()}
+    assert titles == {f"/async/{i}" for i in range(3)}
+
+
+def test_async_requester_fetches_and_items_are_stored_off_the_event_loop(server):
+    httpx = pytest.importorskip("httpx")
+    AsyncYanker.threads.clear()
+    yanker = AsyncYanker(db_name="httpx", start_urls=[server("/start/0")])
+    yanker.requester_async = httpx.AsyncClient()
+    yanker.yank()
+    assert yanker.tables["async_page"].count() == 3
+    assert server.handler.hits["/async/0"] == 1
+    assert threading.main_thread() not in AsyncYanker.threads
+
+
+def test_async_requester_connection_errors_are_retried_and_skipped(server):
+    httpx = pytest.importorskip("httpx")
+    yanker = AsyncYanker(
+        db_name="refused", start_urls=["http://127.0.0.1:1/", server("/start/0")]
+    )
+    yanker.requester_async = httpx.AsyncClient()
+    yanker.yank()
+    assert yanker.stats["failures"] == 1
+    assert yanker.tables["async_page"].count() == 3
@@ -0,0 +1,56 @@
+import threading
+import time
+
+from yank.auto_throttle import AutoThrottle
+
+URL = "http://a.example.com/page"
+
+
+def test_healthy_responses_speed_a_domain_up_additively():
+    throttle = AutoThrottle(start_ms=1000, step_ms=100, max_per_domain=3)
+    for _ in range(5):
+        throttle.record(URL, 0.1, 200)
+    state = throttle.states["example.com"]
+    assert state["throttle_ms"] == 500
+    assert state["concurrency"] == 3
+
+
+def test_throttled_responses_slow_a_domain_down_once_per_round_trip():
+    throttle = AutoThrottle(start_ms=100, max_ms=1000, max_per_domain=4)
+    throttle.get_domain_state("example.com").concurrency = 4
+    throttle.record(URL, 0.1, 429)
+    throttle.record(URL, 0.1, 429)
+    assert throttle.states["example.com"] == {"throttle_ms": 200, "concurrency": 2}
+
+    # A failure after the round trip slows the domain down again, within bounds
+    throttle.get_domain_state("example.com").decreased_at -= 10
+    throttle.record(URL, 0.1, None)
+    assert throttle.states["example.com"] == {"throttle_ms": 400, "concurrency": 1}
+
+
+def test_rising_latency_counts_as_overload():
+    throttle = AutoThrottle(start_ms=1000, step_ms=100, latency_tolerance=3)
+    throttle.record(URL, 0.01, 200)
+    assert throttle.states["example.com"]["throttle_ms"] == 900
+    for _ in range(5):
+        throttle.record(URL, 1, 200)
+    assert throttle.states["example.com"]["throttle_ms"] == 1800
+
+
+def test_slots_bound_concurrent_fetches_of_a_domain():
+    throttle = AutoThrottle(start_ms=0, min_per_domain=2, max_per_domain=2)
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def fetch():
+        with throttle.slot(URL):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+
+    threads = [threading.Thread(target=fetch) for _ in range(6)]
+    [thread.start() for thread in threads]
+    [thread.join() for thread in threads]
+    assert peak[0] == 2
@@ -0,0 +1,37 @@
+from types import SimpleNamespace
+
+from yank.block_profile import BlockProfile
+
+
+def test_resource_types_block_their_extensions_with_or_without_a_query():
+    profile = BlockProfile([BlockProfile.IMAGE, BlockProfile.STYLESHEET])
+    assert profile.is_blocked("http://a.com/logo.png")
+    assert profile.is_blocked("http://a.com/logo.png?v=2")
+    assert profile.is_blocked("http://a.com/site.css")
+    assert not profile.is_blocked("http://a.com/page.html")
+    assert not profile.is_blocked("http://a.com/app.js")
+
+
+def test_trackers_and_url_patterns_are_blocked():
+    profile = BlockProfile([BlockProfile.TRACKER, "*://ads.a.com/*"])
+    assert profile.is_blocked("https://www.google-analytics.com/collect")
+    assert profile.is_blocked("https://ads.a.com/banner")
+    assert not profile.is_blocked("https://www.a.com/banner")
+
+
+def test_intercept_aborts_blocked_requests():
+    profile = BlockProfile([BlockProfile.FONT])
+    aborted = []
+    for url in ("http://a.com/font.woff2", "http://a.com/index.html"):
+        profile.intercept(SimpleNamespace(url=url, abort=lambda: aborted.append(1)))
+    assert aborted == [1]
+
+
+def test_question_marks_are_literal_on_both_blocking_paths():
+    profile = BlockProfile([BlockProfile.STYLESHEET, "*://a.com/ad?id=*"])
+
+    # CDP matches ? literally, so fnmatch must not treat it as a wildcard
+    assert "*.css?*" in profile.patterns
+    assert not profile.is_blocked("http://a.com/site.cssx")
+    assert not profile.is_blocked("http://a.com/adXid=1")
+    assert profile.is_blocked("http://a.com/ad?id=1")
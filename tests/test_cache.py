@@ -0,0 +1,65 @@
+import time
+
+from yank import Yanker
+from yank.cache import ResponseCache
+
+
+class CacheYanker(Yanker):
+    cache_dir = "cache"
+
+    def yank(self, target):
+        for path in ("/fresh/0", "/etag/0"):
+            self.enqueue(self.urljoin(target.url, path), self.yank_cached_pages)
+        yield from ()
+
+    @Yanker.interface(title=str)
+    def yank_cached_pages(self, target):
+        yield {"title": target.soup.select_one("h1").text}
+
+
+def test_cache_serves_fresh_and_revalidated_responses(server):
+    counts = []
+    for run in range(2):
+        yanker = CacheYanker(db_name=f"run_{run}", start_urls=[server("/start/0")])
+        yanker.yank()
+        counts.append(yanker.tables["cached_page"].count())
+
+    # The fresh page is served from the cache and the ETag page is revalidated
+    hits = server.handler.hits
+    assert hits["/fresh/0"] == 1
+    assert hits["/etag/0"] == 2
+    assert yanker.cache_hits == 3
+
+    # A 304 yields the cached page
+    assert counts == [2, 2]
+    titles = {item.title for item in yanker.tables["cached_page"].all()}
+    assert titles == {"/fresh/0", "/etag/0"}
+
+
+def test_cache_freshness_follows_cache_control():
+    cache = ResponseCache("cache", ttl=30)
+    assert cache.get_ttl("no-cache, max-age=60") == 0
+    assert cache.get_ttl("public, max-age=60") == 60
+    assert cache.get_ttl("") == 30
+    assert cache.load("GET", "http://a.com/") is None
+
+
+def test_cache_hits_skip_the_throttle(server):
+    class ThrottledCacheYanker(Yanker):
+        cache_dir = "cache"
+        throttle_ms = 300
+        start_urls = [server(f"/throttled/{i}") for i in range(3)]
+
+        def yank(self, target):
+            yield from ()
+
+    elapsed = []
+    for run in range(2):
+        started_at = time.monotonic()
+        ThrottledCacheYanker(db_name=f"run_{run}").yank()
+        elapsed.append(time.monotonic() - started_at)
+
+    # Only the first run sends requests and waits between them
+    assert all(server.handler.hits[f"/throttled/{i}"] == 1 for i in range(3))
+    assert elapsed[0] >= 0.6
+    assert elapsed[1] < 0.3
@@ -0,0 +1,27 @@
+from types import SimpleNamespace
+
+from yank.capture_scope import CaptureScope
+
+
+def response(content_type):
+    return SimpleNamespace(headers={"Content-Type": content_type})
+
+
+def test_scopes_always_include_the_target_url():
+    scope = CaptureScope(urls=["/api/"])
+    scopes = scope.get_scopes("http://a.com/p?q=1")
+    assert scopes == [r"^http://a\.com/p\?q=1$", "/api/"]
+    assert CaptureScope().get_scopes("http://a.com/p") == []
+
+
+def test_requests_are_kept_by_url_and_content_type():
+    scope = CaptureScope(urls=["/api/"], content_types=["application/json"])
+    json_response = response("application/json; charset=utf-8")
+    assert scope.is_captured("http://a.com/api/items", json_response)
+    assert not scope.is_captured("http://a.com/api/items", response("text/html"))
+    assert not scope.is_captured("http://a.com/static/app.js", json_response)
+    assert not scope.is_captured("http://a.com/api/items")
+
+
+def test_empty_scope_keeps_everything():
+    assert CaptureScope().is_captured("http://a.com/any", response("image/png"))
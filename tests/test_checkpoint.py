@@ -0,0 +1,69 @@
+import pytest
+
+from yank import Yanker
+from yank.frontier import Frontier
+
+
+class CheckpointYanker(Yanker):
+    def yank(self, target):
+        yield from ()
+
+
+def test_checkpoint_marks_completed_urls_done():
+    yanker = CheckpointYanker()
+    yanker.checkpoint.complete("http://a/1", "yank_a", yanker.tables)
+    assert yanker.frontier.get_done_urls("yank_a") == set()
+    yanker.checkpoint.write(yanker.tables)
+    assert yanker.frontier.get_done_urls("yank_a") == {"http://a/1"}
+
+
+def test_frontier_requeues_active_entries_on_resume_and_clears_otherwise():
+    frontier = CheckpointYanker().frontier
+    frontier.push("http://a/1", "yank_a")
+    frontier.pop()
+    frontier.prepare(resume=True)
+    assert frontier.count(Frontier.PENDING) == 1
+    frontier.prepare()
+    assert frontier.count() == 0
+
+
+def test_resume_continues_an_interrupted_crawl(server):
+    class ResumeYanker(Yanker):
+        start_urls = [server("/start/0")]
+        interrupt = True
+
+        def yank(self, target):
+            for i in range(5):
+                self.enqueue(server(f"/resume/{i}"), self.yank_resume_pages)
+            yield from ()
+
+        @Yanker.interface(title=str)
+        def yank_resume_pages(self, target):
+            if self.interrupt and target.url.endswith("/3"):
+                raise KeyboardInterrupt
+            yield {"title": target.url}
+
+    yanker = ResumeYanker()
+    yanker.yank()
+    assert yanker.tables["resume_page"].count() == 3
+
+    yanker = ResumeYanker()
+    yanker.interrupt = False
+    yanker.yank(resume=True)
+    assert yanker.tables["resume_page"].count() == 5
+    assert yanker.tables["resume_page"].session_count == 5
+    assert server.handler.hits["/start/0"] == 1
+    assert server.handler.hits["/resume/0"] == 1
+
+
+def test_failed_checkpoint_flush_keeps_completed_urls():
+    yanker = CheckpointYanker()
+
+    def fail():
+        raise RuntimeError
+
+    yanker.checkpoint.item_writer.flush = fail
+    yanker.checkpoint.complete("http://a/1", "yank_a", yanker.tables)
+    with pytest.raises(RuntimeError):
+        yanker.checkpoint.write(yanker.tables)
+    assert yanker.checkpoint.completed == [("http://a/1", "yank_a")]
@@ -0,0 +1,31 @@
+from yank import Yanker
+
+
+def crawl(server, **kwargs):
+    class ConcurrencyYanker(Yanker):
+        start_urls = [server(f"/slow/{i}") for i in range(8)]
+
+        def yank(self, target):
+            yield from ()
+
+    yanker = ConcurrencyYanker(**kwargs)
+    yanker.yank()
+    return server.handler
+
+
+def test_max_workers_bounds_concurrent_requests(server):
+    handler = crawl(server, max_workers=3)
+    assert len(handler.hits) == 8
+    assert 1 < handler.max_active <= 3
+
+
+def test_max_per_domain_bounds_concurrent_requests_to_a_host(server):
+    handler = crawl(server, max_workers=8, max_per_domain=2)
+    assert len(handler.hits) == 8
+    assert handler.max_active <= 2
+
+
+def test_sequential_yanker_sends_one_request_at_a_time(server):
+    handler = crawl(server)
+    assert len(handler.hits) == 8
+    assert handler.max_active == 1
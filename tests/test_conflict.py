@@ -0,0 +1,78 @@
+import pytest
+
+from sqlalchemy.exc import IntegrityError
+
+from yank import Yanker
+from yank.exceptions import UnsupportedConflictPolicyError
+
+
+def fields():
+    return {"title": {"cast": str, "unique": True}, "seen": int, "note": str}
+
+
+class ConflictYanker(Yanker):
+    def yank(self, target):
+        yield from ()
+
+    @Yanker.interface(**fields())
+    def yank_strict_rows(self, target):
+        yield from ()
+
+    @Yanker.interface(**fields(), __on_conflict="ignore")
+    def yank_ignored_rows(self, target):
+        yield from ()
+
+    @Yanker.interface(**fields(), __on_conflict="replace")
+    def yank_replaced_rows(self, target):
+        yield from ()
+
+    @Yanker.interface(**fields(), __on_conflict=["seen"])
+    def yank_updated_rows(self, target):
+        yield from ()
+
+
+def write_twice(name):
+    yanker = ConflictYanker()
+    interface = yanker.tables[name]
+    for seen in (1, 2):
+        for title in ("a", "b"):
+            row = {"title": title, "seen": seen, "note": f"{title}{seen}"}
+            yanker.item_writer.add(interface, row)
+    items = interface.all()
+    return sorted((item.id, item.title, item.seen, item.note) for item in items)
+
+
+def test_conflict_without_policy_raises():
+    with pytest.raises(IntegrityError):
+        write_twice("strict_row")
+
+
+def test_ignore_keeps_existing_items():
+    assert write_twice("ignored_row") == [(1, "a", 1, "a1"), (2, "b", 1, "b1")]
+
+
+def test_replace_overwrites_existing_items_in_place():
+    assert write_twice("replaced_row") == [(1, "a", 2, "a2"), (2, "b", 2, "b2")]
+
+
+def test_ignored_rows_do_not_count_toward_the_session():
+    yanker = ConflictYanker()
+    interface = yanker.tables["ignored_row"]
+    interface.session_count = 0
+    yanker.item_writer.start()
+    for title in ("a", "b", "a", "c"):
+        yanker.item_writer.add(interface, {"title": title, "seen": 1})
+    yanker.item_writer.stop()
+    assert interface.count() == interface.session_count == 3
+
+
+def test_field_list_updates_only_those_fields():
+    assert write_twice("updated_row") == [(1, "a", 2, "a1"), (2, "b", 2, "b1")]
+
+
+def test_unknown_conflict_policy_is_rejected():
+    with pytest.raises(UnsupportedConflictPolicyError):
+
+        @Yanker.interface(**fields(), __on_conflict="merge")
+        def yank_rejected_rows(self, target):
+            yield from ()
@@ -0,0 +1,34 @@
+import pytest
+
+from yank import Yanker
+from yank.exceptions import UnsupportedDBProfileError
+
+
+class ProfileYanker(Yanker):
+    def yank(self, target):
+        yield from ()
+
+
+def get_pragma(yanker, pragma):
+    with yanker.db_engine.connect() as connection:
+        return connection.exec_driver_sql(f"pragma {pragma}").scalar()
+
+
+def test_profiles_set_their_pragmas_on_every_connection():
+    yanker = ProfileYanker(db_profile=Yanker.BULK_INGEST)
+    assert get_pragma(yanker, "journal_mode") == "wal"
+    assert get_pragma(yanker, "synchronous") == 0
+    assert get_pragma(yanker, "cache_size") == -65536
+
+    yanker = ProfileYanker(db_name="safe", db_profile=Yanker.SAFE)
+    assert get_pragma(yanker, "synchronous") == 2
+
+
+def test_default_profile_keeps_sqlite_defaults():
+    yanker = ProfileYanker()
+    assert get_pragma(yanker, "journal_mode") == "delete"
+
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(UnsupportedDBProfileError):
+        ProfileYanker(db_profile="fast")
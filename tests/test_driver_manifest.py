@@ -0,0 +1,77 @@
+import os
+import time
+
+import pytest
+
+from yank.driver_manifest import DriverManifest
+from yank.exceptions import DriverNotFound
+
+
+class FakeManifest(DriverManifest):
+    installs = 0
+    fail = False
+
+    def install(self, slug):
+        if self.fail:
+            raise ConnectionError
+        type(self).installs += 1
+        path = os.path.join(self.driver_dir, "1.2.3", slug)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        open(path, "w").close()
+        return path
+
+
+@pytest.fixture
+def manifest_class(tmp_path):
+    class Manifest(FakeManifest):
+        installs = 0
+
+    return Manifest
+
+
+def test_binaries_are_resolved_once_and_shared(manifest_class, tmp_path):
+    manifest = manifest_class(driver_dir=str(tmp_path))
+    entry = manifest.resolve("chrome")
+    assert entry["version"] == "1.2.3"
+    assert manifest_class(driver_dir=str(tmp_path)).resolve("chrome") == entry
+    assert manifest_class.installs == 1
+
+
+def test_get_path_resolves_once_per_process(manifest_class, tmp_path):
+    manifest = manifest_class(driver_dir=str(tmp_path))
+    path = manifest.get_path("chrome")
+    os.remove(manifest.path)
+    assert manifest.get_path("chrome") == path
+    assert manifest_class.installs == 1
+
+
+def test_stale_entries_are_resolved_again_or_kept_if_that_fails(
+    manifest_class, tmp_path
+):
+    manifest = manifest_class(driver_dir=str(tmp_path), max_age_days=1)
+    manifest.resolve("chrome")
+    entries = manifest.read()
+    entries["chrome:latest"]["resolved_at"] = time.time() - 2 * 86400
+    manifest.write(entries)
+
+    # A failed resolution falls back to the stale binary
+    manifest.fail = True
+    assert manifest.resolve("chrome")["path"] == entries["chrome:latest"]["path"]
+    assert manifest_class.installs == 1
+
+    manifest.fail = False
+    manifest.resolve("chrome")
+    assert manifest_class.installs == 2
+
+
+def test_pinned_versions_are_keyed_apart(manifest_class, tmp_path):
+    manifest = manifest_class(driver_dir=str(tmp_path), version="1.2.3")
+    manifest.resolve("chrome")
+    assert set(manifest.read()) == {"chrome:1.2.3"}
+
+
+def test_offline_manifest_never_resolves(manifest_class, tmp_path):
+    manifest = manifest_class(driver_dir=str(tmp_path), offline=True)
+    with pytest.raises(DriverNotFound):
+        manifest.resolve("chrome")
+    assert manifest_class.installs == 0
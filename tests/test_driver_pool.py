@@ -0,0 +1,144 @@
+import threading
+import time
+
+import pytest
+
+from selenium.common.exceptions import WebDriverException
+
+from yank import Yanker
+from yank.browser import Browser
+from yank.driver_pool import DriverPool
+
+
+class FakeDriver:
+    def __init__(self):
+        self.alive = True
+        self.quit_count = 0
+
+    @property
+    def window_handles(self):
+        if not self.alive:
+            raise WebDriverException("gone")
+        return ["main"]
+
+    def quit(self):
+        self.quit_count += 1
+
+
+def test_checkout_reuses_an_idle_driver():
+    pool = DriverPool(FakeDriver, size=2)
+    with pool.checkout() as first:
+        pass
+    with pool.checkout() as second:
+        pass
+    assert first is second
+    assert pool.count == 1
+
+
+def test_size_bounds_drivers_checked_out_at_once():
+    pool = DriverPool(FakeDriver, size=2)
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def page():
+        with pool.checkout():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+
+    threads = [threading.Thread(target=page) for _ in range(6)]
+    [thread.start() for thread in threads]
+    [thread.join() for thread in threads]
+    assert peak[0] == 2
+    assert pool.count == 2
+
+
+def test_drivers_are_recycled_after_a_number_of_pages():
+    pool = DriverPool(FakeDriver, recycle_after=2)
+    drivers = []
+    for _ in range(4):
+        with pool.checkout() as driver:
+            drivers.append(driver)
+    assert drivers[0] is drivers[1] and drivers[1] is not drivers[2]
+    assert drivers[0].quit_count == 1
+    assert pool.replaced == 2
+
+
+def test_dead_drivers_are_replaced():
+    pool = DriverPool(FakeDriver)
+    with pool.checkout() as driver:
+        pass
+    driver.alive = False
+    with pool.checkout() as replacement:
+        pass
+    assert replacement is not driver
+    assert pool.replaced == 1
+
+    # A driver that dies during a page is discarded with the exception
+    with pytest.raises(RuntimeError):
+        with pool.checkout() as driver:
+            driver.alive = False
+            raise RuntimeError
+    assert pool.count == 0 and pool.replaced == 2
+
+
+def test_close_quits_idle_drivers():
+    pool = DriverPool(FakeDriver)
+    with pool.checkout() as driver:
+        pass
+    pool.close()
+    assert driver.quit_count == 1
+    assert pool.count == 0 and pool.replaced == 0
+
+
+class PageDriver(FakeDriver):
+    page_source = "<html><h1>page</h1></html>"
+
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+
+    def get(self, url):
+        self.current_url = url
+
+    def get_cookies(self):
+        return []
+
+
+class DriverYanker(Yanker):
+    default_browser = Browser.FIREFOX
+
+    def yank(self, target):
+        yield from ()
+
+    def yank_driven_pages(self, target):
+        yield from ()
+
+    def yank_driven_pages__driver(self, driver):
+        pass
+
+
+def test_targets_do_not_keep_their_pooled_driver():
+    yanker = DriverYanker()
+    yanker.browser.pool = DriverPool(PageDriver)
+    target = yanker.get("http://a.com/", driver_callback=lambda driver: None)
+
+    # The driver is back in the pool, where another page may take it
+    assert target._driver is None
+    assert len(yanker.browser.pool.idle) == 1
+
+
+def test_driver_replacements_count_both_pools():
+    browser = DriverYanker().browser
+    browser.pool = DriverPool(FakeDriver, recycle_after=1)
+    browser.pool_quick = DriverPool(FakeDriver, recycle_after=1)
+    for quick in (False, True, True):
+        with browser.checkout(quick=quick):
+            pass
+    assert browser.replaced == 3
+
+    # A quick driver mode shares one pool, which is counted once
+    browser.pool_quick = browser.pool
+    assert browser.replaced == 1
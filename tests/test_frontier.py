@@ -0,0 +1,77 @@
+from yank import Yanker
+from yank.frontier import Frontier
+
+
+class FrontierYanker(Yanker):
+    def yank(self, target):
+        yield from ()
+
+
+def test_frontier_pops_by_priority_once_per_method():
+    frontier = FrontierYanker().frontier
+    assert frontier.push("http://a/1", "yank_a")
+    assert frontier.push("http://a/2", "yank_a", priority=5)
+    assert not frontier.push("http://a/1", "yank_a")
+    assert frontier.push("http://a/1", "yank_b")
+    assert frontier.pop() == ("http://a/2", "yank_a")
+    assert frontier.count(Frontier.PENDING) == 2
+    assert frontier.count(Frontier.ACTIVE) == 1
+    frontier.clear()
+    assert frontier.pop() is None
+
+
+def test_crawl_follows_priorities_and_skips_duplicates(server):
+    class PriorityYanker(Yanker):
+        start_urls = [server("/start/0")]
+        yanked = []
+
+        def yank(self, target):
+            for i in range(3):
+                self.enqueue(server(f"/low/{i}"), self.yank_low)
+                self.enqueue(server("/high/0"), self.yank_high, priority=10)
+            yield from ()
+
+        def yank_low(self, target):
+            self.yanked.append(target.url)
+            yield from ()
+
+        def yank_high(self, target):
+            self.yanked.append(target.url)
+            yield from ()
+
+    PriorityYanker().yank()
+    paths = ["/high/0", "/low/0", "/low/1", "/low/2"]
+    assert PriorityYanker.yanked == [server(path) for path in paths]
+
+
+def test_frontier_pops_around_excluded_methods():
+    frontier = FrontierYanker().frontier
+    frontier.push("http://a/1", "yank_a", priority=5)
+    frontier.push("http://a/1", "yank_b")
+    assert frontier.pop(excluded_methods={"yank_a"}) == ("http://a/1", "yank_b")
+    assert frontier.pop(excluded_methods={"yank_a"}) is None
+    assert frontier.count(Frontier.PENDING, excluded_methods={"yank_a"}) == 0
+
+
+def test_session_limit_stops_only_the_frontier_of_its_method(server):
+    class LimitYanker(Yanker):
+        start_urls = [server("/start/0")]
+
+        def yank(self, target):
+            for i in range(5):
+                self.enqueue(server(f"/limited/{i}"), self.yank_limited_pages)
+                self.enqueue(server(f"/unlimited/{i}"), self.yank_unlimited_pages)
+            yield from ()
+
+        @Yanker.interface(title=str, __session_limit=2)
+        def yank_limited_pages(self, target):
+            yield {"title": target.url}
+
+        @Yanker.interface(title=str)
+        def yank_unlimited_pages(self, target):
+            yield {"title": target.url}
+
+    yanker = LimitYanker()
+    yanker.yank()
+    assert yanker.tables["limited_page"].count() == 2
+    assert yanker.tables["unlimited_page"].count() == 5
@@ -0,0 +1,106 @@
+import json
+
+from types import SimpleNamespace
+
+from yank import Yanker
+from yank.handoff import Handoff
+from yank.response import Response
+from yank.target import Target
+
+
+def captured(url, data, method="GET", content_type="application/json"):
+    """ Returns a captured driver request in the shape of a Target request """
+
+    response = SimpleNamespace(
+        status_code=200,
+        headers={"Content-Type": content_type},
+        body=json.dumps(data).encode(),
+        request=SimpleNamespace(method=method),
+    )
+    headers = {"Accept": "application/json", "Cookie": "sid=1", "X-Token": "t"}
+    return SimpleNamespace(
+        url=url, headers=headers, response=Response(request=None, response=response)
+    )
+
+
+def discover(handoff):
+    return handoff.discover(
+        "http://a.com/item/42?lang=en",
+        [
+            captured("http://a.com/static/app.js", {}, content_type="text/js"),
+            captured("http://api.a.com/v1/track", {"ok": 1}, method="POST"),
+            captured("http://api.a.com/v1/items/42?lang=en&full=1", {"id": 42}),
+        ],
+        cookies=[{"name": "sid", "value": "1"}],
+    )
+
+
+def test_discovered_endpoint_is_templated_from_the_target_url():
+    handoff = Handoff()
+    assert handoff.get_url("http://a.com/item/7") is None
+    request = discover(handoff)
+    assert request.url.startswith("http://api.a.com/v1/items/42")
+    assert handoff.get_url("http://a.com/item/7?lang=fr") == (
+        "http://api.a.com/v1/items/7?lang=fr&full=1"
+    )
+
+    # A target without the tokens the endpoint needs cannot be handed off
+    assert handoff.get_url("http://a.com/item") is None
+
+
+def test_discovery_keeps_headers_without_cookies_and_the_driver_cookies():
+    handoff = Handoff()
+    discover(handoff)
+    assert handoff.headers == {"Accept": "application/json", "X-Token": "t"}
+    assert handoff.cookies == {"sid": "1"}
+
+
+def test_pattern_picks_the_endpoint():
+    handoff = Handoff("/nothing/")
+    assert discover(handoff) is None
+    assert not handoff.is_discovered
+
+
+def test_endpoint_responses_must_resemble_the_original():
+    handoff = Handoff()
+    discover(handoff)
+
+    def response(status_code, data):
+        return SimpleNamespace(status_code=status_code, json=lambda: data)
+
+    assert handoff.is_valid(response(200, {"id": 7, "name": "x"}))
+    assert not handoff.is_valid(response(200, {"error": "gone"}))
+    assert not handoff.is_valid(response(404, {"id": 7}))
+    assert not handoff.is_valid(None)
+
+
+class HandoffYanker(Yanker):
+    retry_attempts = 1
+    retry_backoff_ms = 1
+
+    def yank(self, target):
+        yield from ()
+
+
+def test_hand_off_calls_the_endpoint_with_the_driver_cookies(server):
+    handoff = Handoff()
+    handoff.discover(
+        server("/item/42"),
+        [captured(server("/api/items/42"), {"path": "", "cookie": ""})],
+        cookies=[{"name": "sid", "value": "1"}],
+    )
+
+    # A transient requester rejects stored cookies, so they are sent per request
+    target = Target(server("/item/7"), HandoffYanker())
+    assert target.hand_off(handoff)
+    assert target.json == {"path": "/api/items/7", "cookie": "sid=1"}
+    assert handoff.hits == 1
+
+
+def test_failing_endpoint_is_retried_before_falling_back(server):
+    handoff = Handoff()
+    handoff.discover(server("/item/42"), [captured(server("/fail/items/42"), {})])
+    target = Target(server("/item/7"), HandoffYanker())
+    assert not target.hand_off(handoff)
+    assert server.handler.hits["/fail/items/7"] == 2
+    assert handoff.fallbacks == 1
@@ -0,0 +1,68 @@
+import json
+import time
+
+from yank.identity import IdentityStore
+
+
+def test_saved_identity_is_loaded_until_it_expires():
+    store = IdentityStore("identity.json", ttl=60)
+    assert store.load() is None
+    store.save(headers={"Accept": "*/*"}, user_agent="UA")
+    identity = IdentityStore("identity.json", ttl=60).load()
+    assert identity["headers"] == {"Accept": "*/*"}
+    assert identity["user_agent"] == "UA"
+    assert IdentityStore("identity.json", ttl=0).load() is None
+
+
+def test_saves_merge_harvested_values():
+    store = IdentityStore("identity.json")
+    store.save(headers={"Accept": "*/*"})
+    store.save(user_agent="UA")
+    identity = IdentityStore("identity.json").load()
+    assert identity["headers"] == {"Accept": "*/*"}
+    assert identity["user_agent"] == "UA"
+
+
+def test_expired_cookies_are_dropped_on_load():
+    now = time.time()
+    cookies = [
+        {"name": "old", "value": "1", "expiry": now - 10},
+        {"name": "new", "value": "2", "expiry": now + 3600},
+        {"name": "session", "value": "3"},
+    ]
+    IdentityStore("identity.json").save(cookies=cookies)
+    identity = IdentityStore("identity.json").load()
+    assert [c["name"] for c in identity["cookies"]] == ["new", "session"]
+
+
+def test_corrupt_identity_is_ignored():
+    with open("identity.json", "w") as f:
+        f.write("{")
+    assert IdentityStore("identity.json").load() is None
+    IdentityStore("identity.json").save(user_agent="UA")
+    with open("identity.json") as f:
+        assert json.load(f)["user_agent"] == "UA"
+
+
+def test_unchanged_identity_is_not_rewritten(monkeypatch):
+    store = IdentityStore("identity.json")
+    cookies = [{"name": "sid", "value": "1", "expiry": 100}]
+    store.save(user_agent="UA", cookies=cookies)
+    writes = []
+    monkeypatch.setattr("yank.identity.os.replace", lambda *a: writes.append(a))
+
+    # Refreshed cookie expiries do not change an identity
+    store.save(user_agent="UA", cookies=[{**cookies[0], "expiry": 200}])
+    assert not writes
+
+    store.save(user_agent="UA", cookies=[{"name": "sid", "value": "2"}])
+    assert len(writes) == 1
+
+
+def test_expired_identity_is_rewritten_unchanged(monkeypatch):
+    store = IdentityStore("identity.json", ttl=0)
+    store.save(user_agent="UA")
+    writes = []
+    monkeypatch.setattr("yank.identity.os.replace", lambda *a: writes.append(a))
+    store.save(user_agent="UA")
+    assert len(writes) == 1
@@ -0,0 +1,43 @@
+from sqlalchemy import inspect
+
+from yank import Yanker
+
+
+class IndexedYanker(Yanker):
+    def yank(self, target):
+        yield from ()
+
+    @Yanker.interface(
+        title={"cast": str, "index": True},
+        price=int,
+        brand=str,
+        __skip_by_url=True,
+        __indexes=[("brand", "price"), "price"],
+    )
+    def yank_indexed_products(self, target):
+        yield from ()
+
+
+def test_field_composite_and_url_indexes_are_created():
+    yanker = IndexedYanker()
+    indexes = {
+        index["name"]: index["column_names"]
+        for index in inspect(yanker.db_engine).get_indexes("indexed_product")
+    }
+    assert indexes["ix_indexed_product_title"] == ["title"]
+    assert indexes["ix_indexed_product_url"] == ["url"]
+    assert indexes["ix_indexed_product_brand_price"] == ["brand", "price"]
+    assert indexes["ix_indexed_product_price"] == ["price"]
+
+
+def get_index_names(yanker):
+    return [i["name"] for i in inspect(yanker.db_engine).get_indexes("indexed_product")]
+
+
+def test_indexes_are_added_to_existing_tables():
+    yanker = IndexedYanker()
+    with yanker.db_engine.begin() as connection:
+        connection.exec_driver_sql("drop index ix_indexed_product_brand_price")
+    assert "ix_indexed_product_brand_price" not in get_index_names(yanker)
+    yanker = IndexedYanker()
+    assert "ix_indexed_product_brand_price" in get_index_names(yanker)
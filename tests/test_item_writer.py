@@ -0,0 +1,120 @@
+import threading
+
+import pytest
+
+from sqlalchemy.exc import IntegrityError
+
+from yank import Yanker
+from yank.exceptions import SessionLimitReached
+from yank.item_writer import ItemWriter
+
+
+class WriterYanker(Yanker):
+    def yank(self, target):
+        yield from ()
+
+    @Yanker.interface(title={"cast": str, "unique": True}, __skip_by_url=True)
+    def yank_written_rows(self, target):
+        yield from ()
+
+
+def make_writer(**kwargs):
+    yanker = WriterYanker()
+    writer = ItemWriter(yanker.db_session, yanker.db_lock, **kwargs)
+    interface = yanker.tables["written_row"]
+    interface.session_count = 0
+    return writer, interface
+
+
+def test_writer_thread_writes_batches_on_flush_and_stop():
+    writer, interface = make_writer(batch_size=3, interval=60)
+    writer.start()
+    for i in range(4):
+        writer.add(interface, {"title": str(i), "url": f"http://a/{i}"})
+    assert writer.has_url(interface, "http://a/3")
+    writer.flush()
+    assert interface.count() == 4
+    assert not writer.has_url(interface, "http://a/3")
+    assert interface.has_url("http://a/3")
+    writer.add(interface, {"title": "4"})
+    writer.stop()
+    assert not writer.is_running
+    assert interface.count() == interface.session_count == 5
+
+
+def test_failed_batch_keeps_good_rows_and_counts_only_committed_ones():
+    writer, interface = make_writer(batch_size=10, interval=60)
+    writer.start()
+    for title in ("a", "b", "a", "c"):
+        writer.add(interface, {"title": title, "url": f"http://a/{title}"})
+    with pytest.raises(IntegrityError):
+        writer.flush()
+    writer.stop()
+    assert sorted(item.title for item in interface.all()) == ["a", "b", "c"]
+    assert interface.session_count == 3
+    assert writer.get_session_count(interface) == 3
+
+
+def test_unstarted_writer_raises_at_once():
+    writer, interface = make_writer()
+    writer.add(interface, {"title": "a"})
+    with pytest.raises(IntegrityError):
+        writer.add(interface, {"title": "a"})
+    assert interface.count() == interface.session_count == 1
+
+
+def test_pending_rows_count_toward_session_limit():
+    writer, interface = make_writer(batch_size=10, interval=60)
+    writer.start()
+    writer.add(interface, {"title": "a"}, session_limit=2)
+    writer.add(interface, {"title": "b"}, session_limit=2)
+    with pytest.raises(SessionLimitReached):
+        writer.add(interface, {"title": "c"}, session_limit=2)
+    writer.stop()
+    assert interface.count() == 2
+
+
+def within_timeout(function):
+    """ Calls a function in a thread and returns its errors once it has returned """
+
+    errors = []
+
+    def call():
+        try:
+            function()
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=call, daemon=True)
+    thread.start()
+    thread.join(5)
+    assert not thread.is_alive()
+    return errors
+
+
+def fail(*args):
+    raise RuntimeError
+
+
+def test_indexing_errors_are_raised_and_committed_rows_still_counted(monkeypatch):
+    writer, interface = make_writer(batch_size=10, interval=60)
+    writer.start()
+    monkeypatch.setattr(interface, "add_url", fail)
+    writer.add(interface, {"title": "a", "url": "http://a/a"})
+    assert [type(e) for e in within_timeout(writer.flush)] == [RuntimeError]
+    assert writer.get_session_count(interface) == interface.session_count == 1
+    assert not writer.has_url(interface, "http://a/a")
+    assert within_timeout(writer.stop) == []
+
+
+def test_writer_thread_survives_errors_and_still_answers_flush_and_stop(monkeypatch):
+    writer, interface = make_writer(batch_size=10, interval=60)
+    writer.start()
+    monkeypatch.setattr(writer, "write", fail)
+    writer.add(interface, {"title": "a"})
+    assert [type(e) for e in within_timeout(writer.flush)] == [RuntimeError]
+
+    # The thread is still running and writes the row once writes succeed again
+    monkeypatch.undo()
+    assert within_timeout(writer.stop) == []
+    assert interface.count() == 1
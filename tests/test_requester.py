@@ -0,0 +1,39 @@
+import time
+
+from yank import Yanker
+from yank.requester import Requester
+
+
+def test_transient_requester_pools_connections_but_not_cookies(server):
+    requester = Requester(transient=True)
+    for i in range(5):
+        requester.get(server(f"/cookie/{i}"))
+    assert requester.connection_reuses == 4
+    assert not requester.cookies
+
+
+def test_session_requester_keeps_cookies(server):
+    requester = Requester()
+    requester.get(server("/cookie/0"))
+    assert requester.cookies.get("seen") == "1"
+
+
+def test_idle_pooled_connections_are_closed(server):
+    requester = Requester(pool_idle_timeout=0.01)
+    for i in range(3):
+        requester.get(server(f"/page/{i}"))
+        time.sleep(0.05)
+    assert requester.connection_reuses == 0
+
+
+def test_transient_yanker_reuses_connections(server):
+    class PooledYanker(Yanker):
+        start_urls = [server(f"/page/{i}") for i in range(5)]
+
+        def yank(self, target):
+            yield from ()
+
+    yanker = PooledYanker()
+    yanker.yank()
+    assert yanker.requester.transient
+    assert yanker.requester.connection_reuses == 4
@@ -0,0 +1,114 @@
+from urllib.parse import urlparse
+
+import pytest
+
+from yank import Yanker
+from yank.exceptions import CircuitOpen
+from yank.retry import CircuitBreaker, RetryPolicy
+from yank.target import Target
+
+
+class Response:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def test_retry_policy_retries_statuses_within_backoff_bounds():
+    policy = RetryPolicy(statuses=(503,), backoff_ms=100, backoff_max_ms=1000)
+    assert policy.is_retryable(Response(503))
+    assert not policy.is_retryable(Response(404))
+    assert all(0 <= policy.get_delay(attempt) <= 1 for attempt in range(10))
+
+
+def test_retry_policy_honours_retry_after_up_to_max_backoff():
+    policy = RetryPolicy(backoff_max_ms=5000)
+    assert policy.get_delay(0, Response(429, {"Retry-After": "2"})) == 2
+    assert policy.get_delay(0, Response(429, {"Retry-After": "60"})) == 5
+    assert RetryPolicy.get_retry_after(Response(429, {"Retry-After": "soon"})) is None
+
+
+def test_circuit_breaker_opens_after_threshold_and_lets_one_trial_through():
+    breaker = CircuitBreaker(threshold=2, cooldown=0.05)
+    url = "http://a/1"
+    for _ in range(2):
+        breaker.check(url)
+        breaker.record(url, success=False)
+    assert breaker.get_state("a") == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpen):
+        breaker.check(url)
+    assert breaker.rejections == 1
+
+    # After the cooldown a single trial is let through and closes on success
+    breaker.opened_at["a"] -= 1
+    breaker.check(url)
+    with pytest.raises(CircuitOpen):
+        breaker.check(url)
+    breaker.record(url, success=True)
+    assert breaker.get_state("a") == CircuitBreaker.CLOSED
+
+
+def test_released_trial_lets_another_trial_through():
+    breaker = CircuitBreaker(threshold=1, cooldown=0)
+    url = "http://a/1"
+    breaker.record(url, success=False)
+    breaker.check(url)
+    breaker.release(url)
+    breaker.check(url)
+    assert breaker.get_state("a") == CircuitBreaker.HALF_OPEN
+
+
+def make_yanker(server, threshold, path="/fail/"):
+    class RetryYanker(Yanker):
+        start_urls = [server(f"{path}{i}") for i in range(3)]
+        retry_attempts = 2
+        retry_backoff_ms = 1
+        breaker_threshold = threshold
+
+        def yank(self, target):
+            yield from ()
+
+    return RetryYanker()
+
+
+def test_failing_urls_are_retried_up_to_the_attempts(server):
+    yanker = make_yanker(server, threshold=0)
+    yanker.yank()
+    assert all(server.handler.hits[f"/fail/{i}"] == 3 for i in range(3))
+    assert yanker.stats["retries"] == 6
+    assert yanker.stats["failures"] == 3
+
+
+def test_open_circuit_rejects_requests_to_a_failing_host(server):
+    yanker = make_yanker(server, threshold=2)
+    yanker.yank()
+
+    # The circuit opens within the retries of the first URL and rejects the rest
+    assert sum(server.handler.hits.values()) == 2
+    host = urlparse(server("")).netloc
+    assert yanker.stats["circuits"] == {host: CircuitBreaker.OPEN}
+    assert yanker.stats["circuit_rejections"] >= 3
+
+
+def test_connection_resets_are_retried_and_skipped(server):
+    yanker = make_yanker(server, threshold=0, path="/reset/")
+    yanker.yank()
+    assert all(server.handler.hits[f"/reset/{i}"] == 3 for i in range(3))
+    assert yanker.stats["failures"] == 3
+
+
+def test_unexpected_error_of_a_trial_request_does_not_keep_the_circuit_open(server):
+    yanker = make_yanker(server, threshold=1)
+    yanker.circuit_breaker.cooldown = 0
+    target = Target(server("/page/0"), yanker)
+    yanker.circuit_breaker.record(target.url, success=False)
+
+    def fail():
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        target.retry(fail)
+    assert target.retry(lambda: yanker.requester.get(target.url)).status_code == 200
+    assert yanker.circuit_breaker.get_state(urlparse(target.url).netloc) == (
+        CircuitBreaker.CLOSED
+    )
@@ -0,0 +1,32 @@
+import pytest
+
+from yank.request import Request
+from yank.response import Response
+from yank.snapshot import Snapshot
+
+
+def test_snapshot_cannot_be_changed():
+    snapshot = Snapshot("<html></html>", url="http://a.com/")
+    with pytest.raises(AttributeError):
+        snapshot.url = "http://b.com/"
+    with pytest.raises(AttributeError):
+        snapshot.extra = True
+    assert snapshot.url == "http://a.com/"
+
+
+def test_snapshot_keeps_page_source_and_cookies():
+    source = "<html><h1>Hi</h1>" + "x" * 10000 + "</html>"
+    cookies = [{"name": "sid", "value": "1", "domain": "a.com"}]
+    snapshot = Snapshot(source, cookies=cookies)
+    assert snapshot.page_source == source
+    assert len(snapshot._source) < len(source) / 10
+    assert snapshot.cookies == {"sid": "1"}
+
+
+def test_response_reads_html_from_snapshot():
+    snapshot = Snapshot("<html><h1>Hi</h1></html>", url="http://a.com/final")
+    request = Request("http://a.com/", snapshot=snapshot)
+    response = Response(request=request, response=None)
+    assert response.html == "<html><h1>Hi</h1></html>"
+    assert response.url == "http://a.com/final"
+    assert response.soup.h1.text == "Hi"
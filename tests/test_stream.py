@@ -0,0 +1,76 @@
+from yank import Yanker
+
+
+class StreamYanker(Yanker):
+    def yank(self, target):
+        yield from ()
+
+
+def test_max_bytes_truncates_the_body(server):
+    target = StreamYanker().get(server("/big/0"), max_bytes=1000)
+    assert target.truncated
+    assert len(target.response.html) == 1000
+
+
+def test_disallowed_content_types_are_not_read(server):
+    yanker = StreamYanker()
+    target = yanker.get(server("/img/0"), content_types=["text/html"])
+    assert target.aborted
+    assert target.response.html == b""
+    target = yanker.get(server("/page/0"), content_types=["text/html"])
+    assert not target.aborted
+    assert target.soup.h1.text == "/page/0"
+
+
+def test_stream_callback_stops_reading_once_it_has_enough(server):
+    target = StreamYanker().get(
+        server("/big/0"), stream_callback=lambda content: b"<html>" in content
+    )
+    assert target.truncated
+    assert len(target.response.html) < 100000
+
+
+def test_truncated_bodies_are_not_cached(server):
+    yanker = StreamYanker(cache_dir="cache")
+    for _ in range(2):
+        yanker.get(server("/big/0"), max_bytes=1000)
+    assert server.handler.hits["/big/0"] == 2
+
+
+def test_aborted_targets_never_reach_their_yank_method(server):
+    class ContentTypeYanker(Yanker):
+        start_urls = [server("/page/0"), server("/img/0")]
+        content_types = ["text/html"]
+        yanked = []
+
+        def yank(self, target):
+            self.yanked.append(target.url)
+            yield from ()
+
+    ContentTypeYanker().yank()
+    assert ContentTypeYanker.yanked == [server("/page/0")]
+
+
+def test_revalidated_pages_pass_the_content_type_check(server):
+    class RevalidatedYanker(Yanker):
+        start_urls = [server("/start/0")]
+        cache_dir = "cache"
+        content_types = ["text/html"]
+
+        def yank(self, target):
+            self.enqueue(server("/etag/0"), self.yank_revalidated_pages)
+            yield from ()
+
+        @Yanker.interface(title=str)
+        def yank_revalidated_pages(self, target):
+            yield {"title": target.soup.h1.text}
+
+    counts = []
+    for run in range(2):
+        yanker = RevalidatedYanker(db_name=f"run_{run}")
+        yanker.yank()
+        counts.append(yanker.tables["revalidated_page"].count())
+
+    # The second run gets a 304 without a Content-Type and keeps the cached page
+    assert server.handler.hits["/etag/0"] == 2
+    assert counts == [1, 1]
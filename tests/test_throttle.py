@@ -0,0 +1,44 @@
+from yank.throttle import Throttle, TokenBucket
+
+
+def test_token_bucket_allows_a_burst_then_spaces_requests_out():
+    bucket = TokenBucket(1000, burst=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert 0.9 < bucket.reserve() <= 1
+    assert 1.9 < bucket.reserve() <= 2
+
+
+def test_unthrottled_domains_never_wait():
+    throttle = Throttle()
+    assert throttle.reserve("http://example.com/") == 0
+    assert throttle.reserve("http://example.com/") == 0
+    assert throttle.states == {}
+
+
+def test_subdomains_share_the_bucket_of_their_registered_domain():
+    throttle = Throttle(1000)
+    assert throttle.reserve("http://a.example.com/") == 0
+    assert throttle.reserve("http://b.example.com/") > 0.9
+    assert list(throttle.states) == ["example.com"]
+
+
+def test_throttle_map_matches_hosts_before_registered_domains():
+    throttle = Throttle(
+        1000,
+        domain_map={"api.example.com": {"throttle_ms": 5000}, "other.com": None},
+    )
+    throttle.reserve("http://api.example.com/1")
+    assert throttle.reserve("http://api.example.com:8000/2") > 4.9
+
+    # Other hosts of the domain keep the default throttle in a bucket of their own
+    assert throttle.reserve("http://www.example.com/") == 0
+    assert throttle.reserve("http://example.com/") > 0.9
+
+    # A registered domain key still covers all of its hosts
+    assert throttle.reserve("http://www.other.com/") == 0
+    assert throttle.reserve("http://www.other.com/") == 0
+    assert throttle.states == {
+        "api.example.com": {"throttle_ms": 5000},
+        "example.com": {"throttle_ms": 1000},
+    }
@@ -0,0 +1,53 @@
+from sqlalchemy import event
+
+from yank import Yanker
+from yank.url_index import BloomFilter, URLSet
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(1000)
+    urls = [f"http://a/{i}" for i in range(1000)]
+    bloom.update(urls)
+    assert all(url in bloom for url in urls)
+    assert sum(f"http://b/{i}" in bloom for i in range(1000)) < 50
+    assert not bloom.exact and URLSet.exact
+
+
+def test_empty_url_index_is_built_once():
+    class EmptyIndexYanker(Yanker):
+        def yank(self, target):
+            yield from ()
+
+        @Yanker.interface(title=str, __skip_by_url=True)
+        def yank_empty_indexes(self, target):
+            yield from ()
+
+    yanker = EmptyIndexYanker()
+    queries = []
+    event.listen(
+        yanker.db_engine, "before_cursor_execute", lambda *a: queries.append(a)
+    )
+    interface = yanker.tables["empty_index"]
+    assert not any(interface.has_url(f"http://a/{i}") for i in range(100))
+    assert len(queries) == 1
+
+
+def test_skip_by_url_does_not_refetch_stored_urls(server):
+    class SkipYanker(Yanker):
+        start_urls = [server("/start/0")]
+
+        def yank(self, target):
+            for i in range(3):
+                self.enqueue(server(f"/indexed/{i}"), self.yank_indexed_pages)
+            yield from ()
+
+        @Yanker.interface(title=str, __skip_by_url=True, __url_index="bloom")
+        def yank_indexed_pages(self, target):
+            yield {"title": target.url}
+
+    for _ in range(2):
+        yanker = SkipYanker()
+        yanker.yank()
+
+    assert yanker.tables["indexed_page"].count() == 3
+    assert all(server.handler.hits[f"/indexed/{i}"] == 1 for i in range(3))
@@ -0,0 +1,57 @@
+from yank.wait import NetworkIdle, RequestCaptured, WaitCondition
+
+
+class NavigatingDriver:
+    """ A quick driver whose previous page stays live for a few polls after get """
+
+    def __init__(self):
+        self.document = {"url": "http://a.com/old", "marked": False, "polls": 0}
+        self.pending, self.countdown = None, 0
+        self.requests = []
+        self.stopped_on = None
+
+    def get(self, url):
+        self.pending, self.countdown = url, 3
+
+    def execute_script(self, script, *args):
+        if self.pending:
+            self.countdown -= 1
+            if not self.countdown:
+                self.document = {"url": self.pending, "marked": False, "polls": 0}
+                self.pending = None
+        document = self.document
+        if script == WaitCondition.MARK_SCRIPT:
+            document["marked"] = True
+        elif script == WaitCondition.IS_PREVIOUS_SCRIPT:
+            return document["marked"]
+        elif script == NetworkIdle.SCRIPT:
+            document["polls"] += 1
+            return ["loading", 0] if document["polls"] < 2 else ["complete", 1000]
+        elif script == RequestCaptured.SCRIPT:
+            return True
+        elif script == "window.stop();":
+            self.stopped_on = document["url"]
+
+
+def test_network_idle_waits_for_the_new_page_to_replace_the_previous_one():
+    driver = NavigatingDriver()
+    WaitCondition.mark(driver)
+    driver.get("http://a.com/new")
+    WaitCondition.wait(driver, NetworkIdle(), 5)
+    assert driver.stopped_on == "http://a.com/new"
+    assert driver.document["polls"] == 2
+
+
+def test_conditions_are_checked_at_once_on_a_driver_without_a_previous_page():
+    driver = NavigatingDriver()
+    WaitCondition.wait(driver, RequestCaptured("/api/"), 5)
+    assert driver.stopped_on == "http://a.com/old"
+
+
+def test_network_idle_waits_for_captured_requests_without_a_response():
+    driver = NavigatingDriver()
+    driver.document["polls"] = 1
+    driver.requests = [type("Request", (), {"response": None})()]
+    assert not NetworkIdle()(driver)
+    driver.requests[0].response = object()
+    assert NetworkIdle()(driver)
@@ -9,3 +9,5 @@ __version__ = "0.1.0"
 # └────────────────────────────────────────────────────────────────────────────────────┘
 
 from yank.yanker import Yanker  # noqa
+from yank.block_profile import BlockProfile  # noqa
+from yank.wait import NetworkIdle, RequestCaptured, SelectorPresent  # noqa
@@ -0,0 +1,351 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import json
+import os
+import struct
+import threading
+import zlib
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ PROJECT IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import yank.constants as _c
+
+from yank.cache import CacheEntry
+from yank.exceptions import ArchiveMiss
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ ARCHIVE                                                                            │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class Archive:
+    """
+    An append-only file of recorded responses that can be replayed without network
+    Each record is a header of two lengths, a JSON metadata line and a zlib body
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CONSTANTS                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Modes
+    RECORD = _c.RECORD
+    REPLAY = _c.REPLAY
+
+    # Define record header of metadata and body lengths
+    HEADER = struct.Struct(">II")
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, path, mode):
+        """ Init Method """
+
+        # Set path
+        self.path = path
+
+        # Set mode
+        self.mode = mode
+
+        # Initialize lock
+        self.lock = threading.Lock()
+
+        # Initialize offsets of the latest record of each method and URL
+        self.offsets = {}
+
+        # Initialize offsets of the requests captured with the latest page of a URL
+        self.captured = {}
+
+        # Initialize file
+        self.file = None
+
+        # Open archive
+        self.open()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ OPEN                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def open(self):
+        """ Opens the archive file unless it is already open """
+
+        # Return if file is already open
+        if self.file and not self.file.closed:
+            return
+
+        # Get path
+        path = self.path
+
+        # Check if mode is replay
+        if self.mode == self.REPLAY:
+
+            # Open archive for reading
+            self.file = open(path, "rb")
+
+            # Index records
+            self.index()
+
+        # Otherwise handle case of record
+        else:
+
+            # Create archive directory
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+            # Open archive for appending
+            self.file = open(path, "ab")
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ IS REPLAY                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @property
+    def is_replay(self):
+        """ Returns a boolean of whether the archive serves recorded responses """
+
+        # Return True if mode is replay
+        return self.mode == self.REPLAY
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INDEX                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def index(self):
+        """ Scans record headers and metadata, skipping over bodies """
+
+        # Get file
+        f = self.file
+
+        # Get header struct
+        header = self.HEADER
+
+        # Get archive size
+        size = os.fstat(f.fileno()).st_size
+
+        # Iterate over records
+        while True:
+
+            # Get record offset
+            offset = f.tell()
+
+            # Read header
+            data = f.read(header.size)
+
+            # Break if end of archive was reached
+            if len(data) < header.size:
+                break
+
+            # Unpack metadata and body lengths
+            meta_size, body_size = header.unpack(data)
+
+            # Break if the final record was truncated by an interrupted write
+            if offset + header.size + meta_size + body_size > size:
+                break
+
+            # Read metadata
+            meta = json.loads(f.read(meta_size))
+
+            # Skip body
+            f.seek(body_size, os.SEEK_CUR)
+
+            # Get URL of the page that a captured request was recorded with
+            captured_by = meta.get("captured_by")
+
+            # Check if record is a captured request
+            if captured_by:
+
+                # Add offset to the captured requests of its page
+                self.captured.setdefault(captured_by, []).append(offset)
+
+                # Continue as a captured request is never loaded by its own URL
+                continue
+
+            # Set offset of method and URL, replacing earlier records
+            self.offsets[(meta["method"], meta["url"])] = offset
+
+            # Check if record is a driver page
+            if meta.get("page"):
+
+                # Clear requests captured with an earlier page of the URL
+                # Those captured with this page are recorded right after it
+                self.captured[meta["url"]] = []
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RECORD                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def record(self, meta, content):
+        """ Appends a response's metadata and body to the archive """
+
+        # Check if content is a string such as a driver page source
+        if type(content) is str:
+
+            # Encode content
+            content = content.encode()
+
+        # Encode metadata
+        meta = json.dumps(meta).encode()
+
+        # Compress content
+        content = zlib.compress(content or b"")
+
+        # Acquire lock
+        with self.lock:
+
+            # Write record
+            self.file.write(self.HEADER.pack(len(meta), len(content)))
+            self.file.write(meta)
+            self.file.write(content)
+
+            # Flush so that an interrupted crawl keeps its records
+            self.file.flush()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RECORD RESPONSE                                                                │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def record_response(
+        self, method, url, response, handoff_url=None, aborted=False, truncated=False
+    ):
+        """
+        Appends a requests or httpx response to the archive
+        A response fetched from a handoff endpoint is recorded under its target URL
+        """
+
+        # Record response
+        self.record(
+            {
+                "method": method.upper(),
+                "url": url,
+                "status_code": response.status_code,
+                "headers": dict(response.headers),
+                "request_headers": dict(response.request.headers),
+                "encoding": getattr(response, "encoding", None),
+                "handoff_url": handoff_url,
+                "aborted": aborted,
+                "truncated": truncated,
+            },
+            response.content,
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RECORD PAGE                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def record_page(
+        self, url, page_source, response=None, final_url=None, cookies=None, requests=()
+    ):
+        """
+        Appends a driver's final page source and captured response if any, followed by
+        the requests that the driver captured along with the page
+        """
+
+        # Record page source with the status and headers of the captured response
+        self.record(
+            {
+                "method": _c.GET.upper(),
+                "url": url,
+                "status_code": response.status_code if response is not None else 200,
+                "headers": dict(response.headers) if response is not None else {},
+                "request_headers": (
+                    dict(response.request.headers) if response is not None else {}
+                ),
+                "encoding": "utf-8",
+                "page": True,
+                "final_url": final_url,
+                "cookies": cookies,
+            },
+            page_source,
+        )
+
+        # Iterate over captured requests
+        for request in requests:
+
+            # Get response
+            response = request.response
+
+            # Continue if request was not answered
+            if response is None:
+                continue
+
+            # Record captured request and its decoded body under the page's URL
+            self.record(
+                {
+                    "method": response._response.request.method,
+                    "url": request.url,
+                    "status_code": response.status_code,
+                    "headers": dict(response._response.headers),
+                    "request_headers": dict(request.headers or {}),
+                    "encoding": None,
+                    "captured_by": url,
+                },
+                response.content,
+            )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ LOAD                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def load(self, method, url):
+        """ Returns the latest recorded entry of a method and URL """
+
+        # Get offset
+        offset = self.offsets.get((method.upper(), url))
+
+        # Raise exception if URL was not recorded
+        if offset is None:
+            raise ArchiveMiss(f"{method.upper()} {url} is not in {self.path}")
+
+        # Return recorded entry
+        return self.read(offset)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ LOAD CAPTURED                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def load_captured(self, url):
+        """ Returns the entries of requests captured with the latest page of a URL """
+
+        # Return recorded entries in the order they were captured
+        return [self.read(offset) for offset in self.captured.get(url, [])]
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ READ                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def read(self, offset):
+        """ Returns the recorded entry at an offset """
+
+        # Get file
+        f = self.file
+
+        # Acquire lock
+        with self.lock:
+
+            # Seek to record
+            f.seek(offset)
+
+            # Unpack metadata and body lengths
+            meta_size, body_size = self.HEADER.unpack(f.read(self.HEADER.size))
+
+            # Read metadata and body
+            meta = json.loads(f.read(meta_size))
+            content = f.read(body_size)
+
+        # Return recorded entry
+        return CacheEntry(meta, zlib.decompress(content))
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CLOSE                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def close(self):
+        """ Closes the archive file """
+
+        # Close file
+        self.file.close()
@@ -0,0 +1,340 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import asyncio
+import threading
+import time
+
+from contextlib import asynccontextmanager, contextmanager
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ PROJECT IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import yank.constants as _c
+
+from yank.throttle import Throttle, TokenBucket
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ DOMAIN STATE                                                                       │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class DomainState:
+    """ The adaptive concurrency and observed latency of a single domain """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, concurrency):
+        """ Init Method """
+
+        # Set concurrency as a float so that it can grow by fractions
+        self.concurrency = float(concurrency)
+
+        # Initialize number of fetches in flight
+        self.active = 0
+
+        # Initialize smoothed and baseline latency in seconds
+        self.latency = None
+        self.latency_min = None
+
+        # Initialize last decreased timestamp
+        self.decreased_at = 0
+
+        # Initialize condition that fetches wait on for a free slot
+        self.condition = threading.Condition()
+
+        # Initialize async condition
+        self.condition_async = None
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ HAS SLOT                                                                       │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def has_slot(self):
+        """ Returns a boolean of whether another fetch may start """
+
+        # Return True if fewer fetches than the concurrency are in flight
+        return self.active < int(self.concurrency)
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ AUTO THROTTLE                                                                      │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class AutoThrottle(Throttle):
+    """
+    A throttle that adapts the delay and concurrency of each domain to its responses
+    Healthy responses additively speed a domain up, while 429s, 503s, exceptions and
+    rising latency multiplicatively slow it down (AIMD)
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CONSTANTS                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Define status codes that signal a domain is overloaded
+    THROTTLED_STATUSES = {429, 503}
+
+    # Define weight of the latest latency in the smoothed latency
+    LATENCY_WEIGHT = 0.2
+
+    # Define rate at which the baseline latency forgets an unusually fast response
+    LATENCY_MIN_DRIFT = 1.01
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(
+        self,
+        start_ms=1000,
+        min_ms=0,
+        max_ms=30000,
+        step_ms=100,
+        min_per_domain=1,
+        max_per_domain=1,
+        latency_tolerance=3,
+    ):
+        """ Init Method """
+
+        # Initialize throttle
+        super().__init__(throttle_ms=start_ms)
+
+        # Set delay bounds and additive step in ms
+        self.min_ms = min_ms
+        self.max_ms = max_ms
+        self.step_ms = step_ms
+
+        # Set concurrency bounds
+        self.min_per_domain = max(min_per_domain or 1, 1)
+        self.max_per_domain = max(max_per_domain or 1, self.min_per_domain)
+
+        # Set multiple of the baseline latency above which a domain is overloaded
+        self.latency_tolerance = latency_tolerance
+
+        # Initialize domain states
+        self.domain_states = {}
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET BUCKET                                                                     │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_bucket(self, domain):
+        """ Returns a cached or newly initialized token bucket of a domain """
+
+        # Acquire lock
+        with self.lock:
+
+            # Check if bucket is not cached
+            if domain not in self.buckets:
+
+                # Initialize bucket, even without a delay, so that one can be added
+                self.buckets[domain] = TokenBucket(self.throttle_ms or 0)
+
+            # Return bucket
+            return self.buckets[domain]
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET DOMAIN STATE                                                               │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_domain_state(self, domain):
+        """ Returns a cached or newly initialized state of a domain """
+
+        # Acquire lock
+        with self.lock:
+
+            # Check if domain state is not cached
+            if domain not in self.domain_states:
+
+                # Initialize domain state at the lowest concurrency
+                self.domain_states[domain] = DomainState(self.min_per_domain)
+
+            # Return domain state
+            return self.domain_states[domain]
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SLOT                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @contextmanager
+    def slot(self, url):
+        """ Holds one of the adaptive concurrent fetch slots of a URL's domain """
+
+        # Get domain state
+        state = self.get_domain_state(self.get_key(url))
+
+        # Acquire condition
+        with state.condition:
+
+            # Wait for a free slot
+            # A timeout picks up slots added by an increased concurrency
+            while not state.has_slot():
+                state.condition.wait(timeout=1)
+
+            # Take slot
+            state.active += 1
+
+        # Initialize try-finally block
+        try:
+
+            # Hold the slot for the duration of the fetch
+            yield
+
+        # Release slot
+        finally:
+
+            # Acquire condition
+            with state.condition:
+
+                # Free slot
+                state.active -= 1
+
+                # Wake a waiting fetch
+                state.condition.notify()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SLOT ASYNC                                                                     │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @asynccontextmanager
+    async def slot_async(self, url):
+        """ Holds one of the adaptive concurrent fetch slots of a URL's domain """
+
+        # Get domain state
+        state = self.get_domain_state(self.get_key(url))
+
+        # Get or initialize async condition
+        condition = state.condition_async = state.condition_async or asyncio.Condition()
+
+        # Acquire condition
+        async with condition:
+
+            # Wait for a free slot and take it
+            await condition.wait_for(state.has_slot)
+            state.active += 1
+
+        # Initialize try-finally block
+        try:
+
+            # Hold the slot for the duration of the fetch
+            yield
+
+        # Release slot
+        finally:
+
+            # Acquire condition
+            async with condition:
+
+                # Free slot and wake a waiting fetch
+                state.active -= 1
+                condition.notify()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RECORD                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def record(self, url, latency, status_code=None):
+        """ Adapts the delay and concurrency of a URL's domain to a request outcome """
+
+        # Get domain
+        domain = self.get_key(url)
+
+        # Get bucket and domain state
+        bucket = self.get_bucket(domain)
+        state = self.get_domain_state(domain)
+
+        # Acquire lock
+        with self.lock:
+
+            # ┌────────────────────────────────────────────────────────────────────────┐
+            # │ LATENCY                                                                │
+            # └────────────────────────────────────────────────────────────────────────┘
+
+            # Update smoothed latency
+            state.latency = (
+                latency
+                if state.latency is None
+                else state.latency + self.LATENCY_WEIGHT * (latency - state.latency)
+            )
+
+            # Update baseline latency, letting it drift upward over time
+            state.latency_min = min(
+                latency,
+                (state.latency_min or latency) * self.LATENCY_MIN_DRIFT,
+            )
+
+            # Determine if domain is overloaded
+            is_overloaded = (
+                status_code is None
+                or status_code in self.THROTTLED_STATUSES
+                or state.latency > state.latency_min * self.latency_tolerance
+            )
+
+            # ┌────────────────────────────────────────────────────────────────────────┐
+            # │ ADDITIVE INCREASE                                                      │
+            # └────────────────────────────────────────────────────────────────────────┘
+
+            # Check if domain is healthy
+            if not is_overloaded:
+
+                # Increase concurrency by one slot per window of healthy responses
+                state.concurrency = min(
+                    state.concurrency + 1 / state.concurrency, self.max_per_domain
+                )
+
+                # Decrease delay by one step
+                bucket.throttle_ms = max(bucket.throttle_ms - self.step_ms, self.min_ms)
+
+                # Return
+                return
+
+            # ┌────────────────────────────────────────────────────────────────────────┐
+            # │ MULTIPLICATIVE DECREASE                                                │
+            # └────────────────────────────────────────────────────────────────────────┘
+
+            # Get now
+            now = time.monotonic()
+
+            # Return if domain was slowed down within the last round trip
+            # Responses that were already in flight reflect the previous pace
+            if now - state.decreased_at < state.latency + bucket.throttle_ms / 1000:
+                return
+
+            # Set last decreased timestamp
+            state.decreased_at = now
+
+            # Halve concurrency
+            state.concurrency = max(state.concurrency / 2, self.min_per_domain)
+
+            # Double delay, starting from one step
+            bucket.throttle_ms = min(
+                max(bucket.throttle_ms * 2, self.step_ms), self.max_ms
+            )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ STATES                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @property
+    def states(self):
+        """ Returns a dict of domains and their current delay and concurrency """
+
+        # Acquire lock
+        with self.lock:
+
+            # Return delay and concurrency of each domain
+            return {
+                domain: {
+                    _c.THROTTLE_MS: self.buckets[domain].throttle_ms,
+                    "concurrency": int(state.concurrency),
+                }
+                for domain, state in self.domain_states.items()
+                if domain in self.buckets
+            }
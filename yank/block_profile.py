@@ -0,0 +1,133 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import re
+
+from fnmatch import fnmatchcase
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ PROJECT IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import yank.constants as _c
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ BLOCK PROFILE                                                                      │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class BlockProfile:
+    """
+    A declarative set of resources that a browser should not load
+    Each resource is either a resource type such as BlockProfile.IMAGE or a URL pattern
+    with * wildcards such as "*.example.com/ads/*"
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CONSTANTS                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Resource types
+    FONT = _c.FONT
+    IMAGE = _c.IMAGE
+    MEDIA = _c.MEDIA
+    STYLESHEET = _c.STYLESHEET
+    TRACKER = _c.TRACKER
+
+    # Define file extensions by resource type
+    EXTENSIONS = {
+        FONT: ["eot", "otf", "ttf", "woff", "woff2"],
+        IMAGE: ["avif", "bmp", "gif", "ico", "jpeg", "jpg", "png", "svg", "webp"],
+        MEDIA: ["flac", "m4a", "mp3", "mp4", "ogg", "wav", "webm"],
+        STYLESHEET: ["css"],
+    }
+
+    # Define tracker hosts
+    TRACKER_HOSTS = [
+        "doubleclick.net",
+        "facebook.net",
+        "google-analytics.com",
+        "googlesyndication.com",
+        "googletagmanager.com",
+        "hotjar.com",
+        "scorecardresearch.com",
+        "segment.io",
+    ]
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, resources):
+        """ Init Method """
+
+        # Set resources
+        self.resources = list(resources)
+
+        # Initialize URL patterns
+        patterns = []
+
+        # Iterate over resources
+        for resource in self.resources:
+
+            # Check if resource is a tracker type
+            if resource == self.TRACKER:
+
+                # Add a pattern for every tracker host
+                patterns += [f"*://*{host}/*" for host in self.TRACKER_HOSTS]
+
+            # Otherwise check if resource is a file type
+            elif resource in self.EXTENSIONS:
+
+                # Add a pattern for every extension, with and without a query string
+                for extension in self.EXTENSIONS[resource]:
+                    patterns += [f"*.{extension}", f"*.{extension}?*"]
+
+            # Otherwise handle URL pattern
+            else:
+
+                # Add URL pattern
+                patterns.append(resource)
+
+        # Set URL patterns as passed to CDP, where only * is a wildcard
+        self.patterns = patterns
+
+        # Set the same URL patterns escaped for fnmatch, where ? and [ are special too
+        # Both blocking paths then match exactly the same URLs
+        self.fnmatch_patterns = [self.escape(p) for p in patterns]
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ESCAPE                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @staticmethod
+    def escape(pattern):
+        """ Returns a URL pattern whose only fnmatch wildcard is * """
+
+        # Wrap ?, [ and ] in brackets so that fnmatch matches them literally
+        return re.sub(r"([?\[\]])", r"[\1]", pattern)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ IS BLOCKED                                                                     │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def is_blocked(self, url):
+        """ Returns a boolean of whether a URL matches any of the profile's patterns """
+
+        # Return True if URL matches a pattern
+        return any(fnmatchcase(url, pattern) for pattern in self.fnmatch_patterns)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INTERCEPT                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def intercept(self, request):
+        """ Aborts a Selenium Wire request that matches the profile """
+
+        # Check if request is blocked
+        if self.is_blocked(request.url):
+
+            # Abort request before it leaves the browser's proxy
+            request.abort()
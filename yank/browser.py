@@ -2,7 +2,7 @@
 # │ GENERAL IMPORTS                                                                    │
 # └────────────────────────────────────────────────────────────────────────────────────┘
 
-import os
+from functools import partial
 
 # ┌────────────────────────────────────────────────────────────────────────────────────┐
 # │ SELENIUM IMPORTS                                                                   │
@@ -13,10 +13,6 @@ from seleniumwire import webdriver as webdriver_wire
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.utils import ChromeType
 
 # ┌────────────────────────────────────────────────────────────────────────────────────┐
 # │ PROJECT IMPORTS                                                                    │
@@ -24,7 +20,10 @@ from webdriver_manager.utils import ChromeType
 
 import yank.constants as _c
 
+from yank.driver_manifest import DriverManifest
+from yank.driver_pool import DriverPool
 from yank.exceptions import UnsupportedBrowserError, UnsupportedDriverModeError
+from yank.wait import WaitCondition
 
 
 # ┌────────────────────────────────────────────────────────────────────────────────────┐
@@ -60,7 +59,14 @@ class Browser:
     # └────────────────────────────────────────────────────────────────────────────────┘
 
     def __init__(
-        self, slug, driver_mode=NORMAL, driver_headless=False, driver_requests=False
+        self,
+        slug,
+        driver_mode=NORMAL,
+        driver_headless=False,
+        driver_requests=False,
+        pool_size=1,
+        recycle_after=None,
+        driver_manifest=None,
     ):
         """ Init Method """
 
@@ -103,12 +109,33 @@ class Browser:
         # Set driver requests boolean
         self.driver_requests = driver_requests
 
+        # Set manifest of webdriver binaries
+        self.driver_manifest = driver_manifest or DriverManifest()
+
         # Initialize driver cache
         self._driver = None
 
         # Initialize quick driver cache
         self._driver_quick = None
 
+        # Initialize pool of drivers checked out by targets
+        self.pool = DriverPool(
+            partial(self.initialize_driver, slug, driver_mode, driver_headless),
+            size=pool_size,
+            recycle_after=recycle_after,
+        )
+
+        # Initialize pool of quick drivers, sharing the pool if driver mode is quick
+        self.pool_quick = (
+            self.pool
+            if driver_mode == self.QUICK
+            else DriverPool(
+                partial(self.initialize_driver, slug, _c.NONE, driver_headless),
+                size=pool_size,
+                recycle_after=recycle_after,
+            )
+        )
+
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │ DRIVER                                                                         │
     # └────────────────────────────────────────────────────────────────────────────────┘
@@ -171,6 +198,108 @@ class Browser:
         # Return quick driver
         return driver_quick
 
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ REPLACED                                                                       │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @property
+    def replaced(self):
+        """ Returns the number of dead or recycled drivers replaced across pools """
+
+        # Get driver pools, which are one and the same if driver mode is quick
+        pools = {self.pool, self.pool_quick}
+
+        # Return sum of replaced drivers
+        return sum(pool.replaced for pool in pools)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CHECKOUT                                                                       │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def checkout(self, quick=False):
+        """ Returns a context manager that holds a pooled driver for a single page """
+
+        # Return checkout of quick or normal driver pool
+        return (self.pool_quick if quick else self.pool).checkout()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CLOSE                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def close(self):
+        """ Quits the browser's cached and pooled drivers """
+
+        # Iterate over cached drivers
+        for driver in (self._driver, self._driver_quick):
+
+            # Quit driver if it was initialized
+            driver and driver.quit()
+
+        # Reset cached drivers
+        self._driver = self._driver_quick = None
+
+        # Close driver pools
+        self.pool.close()
+        self.pool_quick.close()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ BLOCK                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def block(self, driver, block_profile):
+        """ Stops a driver from loading the resources of a block profile """
+
+        # Get URL patterns
+        patterns = block_profile.patterns if block_profile else []
+
+        # Return if driver already blocks the same patterns
+        # Pooled drivers are shared by methods that may use different profiles
+        if getattr(driver, "blocked_patterns", []) == patterns:
+            return
+
+        # Handle case of Selenium Wire (driver_requests == True)
+        if self.driver_requests:
+
+            # Check if there are patterns to block
+            if block_profile:
+
+                # Abort matching requests in the Selenium Wire proxy
+                driver.request_interceptor = block_profile.intercept
+
+            # Otherwise remove interceptor
+            else:
+
+                # Remove interceptor
+                del driver.request_interceptor
+
+        # Otherwise check if driver supports Chrome DevTools commands
+        elif self.slug != self.FIREFOX:
+
+            # Enable network domain and block matching URLs
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+
+        # Set blocked patterns of driver
+        driver.blocked_patterns = patterns
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SCOPE                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def scope(self, driver, url, capture_scope=None):
+        """ Clears the requests captured by a driver and scopes its capture to a URL """
+
+        # Return if driver does not capture requests
+        if not self.driver_requests:
+            return
+
+        # Set Selenium Wire scopes so that other traffic is not captured at all
+        driver.scopes = capture_scope.get_scopes(url) if capture_scope else []
+
+        # Clear requests captured for previous targets
+        # Otherwise the capture buffer grows for as long as the driver lives
+        del driver.requests
+
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │ INITIALIZE DRIVER                                                              │
     # └────────────────────────────────────────────────────────────────────────────────┘
@@ -178,9 +307,9 @@ class Browser:
     def initialize_driver(self, slug, driver_mode, driver_headless):
         """ Initializes a Selenium webdriver instance based on the browser slug """
 
-        # Set log level to 0
-        # Silences webdriver manager log output
-        os.environ["WDM_LOG_LEVEL"] = "0"
+        # Get path of webdriver binary
+        # This is resolved once and then reused by every driver that is launched
+        executable_path = self.driver_manifest.get_path(slug)
 
         # Define desired capability args
         desired_capability_args = {"pageLoadStrategy": driver_mode}
@@ -205,7 +334,7 @@ class Browser:
 
                 # Initialize a Firefox driver
                 driver = webdriver_wire.Firefox(
-                    executable_path=GeckoDriverManager().install(),
+                    executable_path=executable_path,
                     options=options,
                     desired_capabilities=desired_capabilities,
                 )
@@ -215,7 +344,7 @@ class Browser:
 
                 # Initialize a Firefox driver
                 driver = webdriver.Firefox(
-                    executable_path=GeckoDriverManager().install(),
+                    executable_path=executable_path,
                     options=options,
                     desired_capabilities=desired_capabilities,
                 )
@@ -242,24 +371,14 @@ class Browser:
             # Set page load strategy to None
             desired_capabilities.update(desired_capability_args)
 
-            # Define Chrome driver kwargs
-            driver_kwargs = {}
-
-            # Check if browser is Chromium
-            if slug == _c.CHROMIUM:
-
-                # Add Chrome type to kwargs
-                driver_kwargs["chrome_type"] = ChromeType.CHROMIUM
-
             # Handle case of Selenium Wire (driver_requests == True)
             if self.driver_requests:
 
                 # Initialize a Chrome driver
                 driver = webdriver_wire.Chrome(
-                    executable_path=ChromeDriverManager().install(),
+                    executable_path=executable_path,
                     options=options,
                     desired_capabilities=desired_capabilities,
-                    **driver_kwargs,
                 )
 
             # Otherwise handle case of normal webdriver
@@ -267,15 +386,11 @@ class Browser:
 
                 # Initialize a Chrome driver
                 driver = webdriver.Chrome(
-                    executable_path=ChromeDriverManager().install(),
+                    executable_path=executable_path,
                     options=options,
                     desired_capabilities=desired_capabilities,
-                    **driver_kwargs,
                 )
 
-                # Initialize driver requests to an empty list
-                driver.requests = []
-
             # NOTE: We only use Selenium Wire when we want to capture HTTP requests
             # because Selenium Wire has a higher chance of getting blocked in some cases
 
@@ -293,6 +408,12 @@ class Browser:
                     "Network.setUserAgentOverride", {"userAgent": user_agent}
                 )
 
+        # Check if driver does not capture requests
+        if not self.driver_requests:
+
+            # Initialize driver requests to an empty list
+            driver.requests = []
+
         # Return driver
         return driver
 
@@ -300,20 +421,20 @@ class Browser:
     # │ STOP WHEN                                                                      │
     # └────────────────────────────────────────────────────────────────────────────────┘
 
-    def stop_when(condition, timeout=10):
+    def stop_when(condition, timeout=None):
         """ Stops a driver from loading further when a certain condition is met """
 
+        # Get timeout, falling back to that of a wait condition
+        timeout = timeout or getattr(condition, "timeout", None) or 10
+
         # Define decorator
         def decorator(method):
 
             # Define wrapper
             def wrapper(instance, driver):
 
-                # Wait for listing nav links to appear
-                WebDriverWait(driver, timeout).until(condition)
-
-                # Stop further loading
-                driver.execute_script("window.stop();")
+                # Wait for condition and stop further loading
+                WaitCondition.wait(driver, condition, timeout)
 
                 # Execute original method
                 return method(instance, driver)
@@ -0,0 +1,344 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ REQUESTS IMPORTS                                                                   │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from requests import Request as RequestsRequest
+from requests.models import Response as RequestsResponse
+from requests.structures import CaseInsensitiveDict
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ CACHE ENTRY                                                                        │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class CacheEntry:
+    """ A cached HTTP response read from disk """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, meta, content):
+        """ Init Method """
+
+        # Set metadata
+        self.meta = meta
+
+        # Set content
+        self.content = content
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ IS FRESH                                                                       │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @property
+    def is_fresh(self):
+        """ Returns a boolean of whether the entry can be used without revalidation """
+
+        # Return True if entry has not yet expired
+        return time.time() < self.meta["expires_at"]
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ VALIDATORS                                                                     │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @property
+    def validators(self):
+        """ Returns conditional request headers used to revalidate the entry """
+
+        # Get headers
+        headers = CaseInsensitiveDict(self.meta["headers"])
+
+        # Initialize validators
+        validators = {}
+
+        # Check if response had an ETag
+        if "ETag" in headers:
+
+            # Add If-None-Match validator
+            validators["If-None-Match"] = headers["ETag"]
+
+        # Check if response had a Last-Modified date
+        if "Last-Modified" in headers:
+
+            # Add If-Modified-Since validator
+            validators["If-Modified-Since"] = headers["Last-Modified"]
+
+        # Return validators
+        return validators
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RESPONSE                                                                       │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @property
+    def response(self):
+        """ Returns the entry as a requests Response object """
+
+        # Get metadata
+        meta = self.meta
+
+        # Initialize response
+        response = RequestsResponse()
+
+        # Set response attributes
+        response.status_code = meta["status_code"]
+        response.headers = CaseInsensitiveDict(meta["headers"])
+        response.url = meta["url"]
+        response.encoding = meta.get("encoding")
+        response._content = self.content
+
+        # Set the request that produced the response
+        response.request = RequestsRequest(
+            meta["method"], meta["url"], headers=meta["request_headers"]
+        ).prepare()
+
+        # Return response
+        return response
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ RESPONSE CACHE                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class ResponseCache:
+    """ An on-disk cache of HTTP responses that honors Cache-Control """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, cache_dir, ttl=0):
+        """ Init Method """
+
+        # Set cache directory
+        self.cache_dir = cache_dir
+
+        # Set seconds a response without a max-age stays fresh
+        self.ttl = ttl or 0
+
+        # Initialize hits and misses
+        self.hits = 0
+        self.misses = 0
+
+        # Initialize lock
+        self.lock = threading.Lock()
+
+        # Create cache directory
+        os.makedirs(cache_dir, exist_ok=True)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET PATH                                                                       │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_path(self, method, url):
+        """ Returns the path of the cache file of a method and URL """
+
+        # Get key
+        key = hashlib.sha256(f"{method.upper()} {url}".encode()).hexdigest()
+
+        # Return path sharded by the first two characters of the key
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ COUNT                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def count(self, hit):
+        """ Increments the hit or miss counter """
+
+        # Acquire lock
+        with self.lock:
+
+            # Check if hit
+            if hit:
+
+                # Increment hits
+                self.hits += 1
+
+            # Otherwise handle miss
+            else:
+
+                # Increment misses
+                self.misses += 1
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET TTL                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_ttl(self, cache_control):
+        """ Returns the seconds a response stays fresh given its Cache-Control """
+
+        # Return zero if the response must always be revalidated
+        if "no-cache" in cache_control:
+            return 0
+
+        # Get max age
+        max_age = re.search(r"max-age=(\d+)", cache_control)
+
+        # Return max age if the server specified one
+        if max_age:
+            return int(max_age.group(1))
+
+        # Return default TTL
+        return self.ttl
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ LOAD                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def load(self, method, url):
+        """ Returns the cache entry of a method and URL or None if there is none """
+
+        # Initialize try-except block
+        try:
+
+            # Open cache file
+            with open(self.get_path(method, url), "rb") as f:
+
+                # Read metadata from first line
+                meta = json.loads(f.readline())
+
+                # Read content from remainder
+                content = f.read()
+
+        # Except missing or unreadable cache file
+        except (OSError, ValueError):
+
+            # Return None
+            return None
+
+        # Initialize entry
+        entry = CacheEntry(meta, content)
+
+        # Count fresh entries as hits
+        entry.is_fresh and self.count(hit=True)
+
+        # Return entry
+        return entry
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ IS FRESH                                                                       │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def is_fresh(self, method, url):
+        """ Returns a boolean of whether a fresh entry of a method and URL is cached """
+
+        # Initialize try-except block
+        try:
+
+            # Open cache file
+            with open(self.get_path(method, url), "rb") as f:
+
+                # Read metadata from first line, leaving the content unread
+                meta = json.loads(f.readline())
+
+        # Except missing or unreadable cache file
+        except (OSError, ValueError):
+
+            # Return False
+            return False
+
+        # Return True if entry has not yet expired
+        return time.time() < meta["expires_at"]
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SAVE                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def save(self, method, url, response, entry=None):
+        """
+        Stores a fetched response and returns the response to use
+        A 304 Not Modified response is answered with the revalidated cache entry
+        """
+
+        # Get Cache-Control directives
+        cache_control = response.headers.get("Cache-Control", "").lower()
+
+        # Check if response is a 304 for a cached entry
+        if response.status_code == 304 and entry is not None:
+
+            # Count as hit
+            self.count(hit=True)
+
+            # Fall back to the directives of the cached response
+            cache_control = cache_control or CaseInsensitiveDict(
+                entry.meta["headers"]
+            ).get("Cache-Control", "").lower()
+
+            # Extend the freshness of the entry
+            entry.meta["expires_at"] = time.time() + self.get_ttl(cache_control)
+
+            # Write entry
+            self.write(method, url, entry.meta, entry.content)
+
+            # Return the cached response
+            return entry.response
+
+        # Count as miss
+        self.count(hit=False)
+
+        # Get truncated boolean of a streamed response
+        truncated = getattr(response, "truncated", False)
+
+        # Return response if it should not be stored
+        if response.status_code != 200 or "no-store" in cache_control or truncated:
+            return response
+
+        # Initialize metadata
+        meta = {
+            "method": method.upper(),
+            "url": url,
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "request_headers": dict(response.request.headers),
+            "encoding": getattr(response, "encoding", None),
+            "expires_at": time.time() + self.get_ttl(cache_control),
+        }
+
+        # Write entry
+        self.write(method, url, meta, response.content)
+
+        # Return response
+        return response
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ WRITE                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def write(self, method, url, meta, content):
+        """ Atomically writes metadata and content to a cache file """
+
+        # Get path
+        path = self.get_path(method, url)
+
+        # Get directory
+        directory = os.path.dirname(path)
+
+        # Create directory
+        os.makedirs(directory, exist_ok=True)
+
+        # Open a temporary file in the same directory
+        fd, path_tmp = tempfile.mkstemp(dir=directory)
+
+        # Write metadata line followed by content
+        with os.fdopen(fd, "wb") as f:
+            f.write(json.dumps(meta).encode() + b"\n")
+            f.write(content)
+
+        # Replace cache file so that readers never see a partial write
+        os.replace(path_tmp, path)
@@ -0,0 +1,68 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import re
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ CAPTURE SCOPE                                                                      │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class CaptureScope:
+    """
+    The driver traffic that is kept for a target when driver requests are captured
+    URLs are regular expressions searched in each request URL, while content types are
+    prefixes of each response's Content-Type header
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, urls=None, content_types=None):
+        """ Init Method """
+
+        # Set URL patterns
+        self.urls = list(urls or [])
+
+        # Set content types
+        self.content_types = [t.lower() for t in content_types or []]
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET SCOPES                                                                     │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_scopes(self, url):
+        """ Returns the Selenium Wire scopes of a target URL """
+
+        # Return no scopes if URLs are null as an empty scope captures everything
+        if not self.urls:
+            return []
+
+        # Return URL patterns along with the target URL itself
+        return [f"^{re.escape(url)}$", *self.urls]
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ IS CAPTURED                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def is_captured(self, url, response=None):
+        """ Returns a boolean of whether a captured request and response are kept """
+
+        # Return False if URL does not match any URL pattern
+        if self.urls and not any(re.search(p, url) for p in self.urls):
+            return False
+
+        # Return True if content types is null
+        if not self.content_types:
+            return True
+
+        # Get content type
+        content_type = (
+            response.headers.get("Content-Type", "").lower() if response else ""
+        )
+
+        # Return True if content type starts with a kept content type
+        return any(content_type.startswith(t) for t in self.content_types)
@@ -0,0 +1,196 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import threading
+import time
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ SQLALCHEMY IMPORTS                                                                 │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from sqlalchemy import Column, delete, Integer, MetaData, select, String, Table
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ CHECKPOINT                                                                         │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class Checkpoint:
+    """ Periodically records the progress of a crawl so that it can be resumed """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CONSTANTS                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Define max number of completed URLs written per statement
+    # SQLite limits the number of variables in a single statement
+    CHUNK_SIZE = 500
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CLASS ATTRIBUTES                                                               │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Initialize metadata
+    metadata = MetaData()
+
+    # Define checkpoint table of interface counters
+    table = Table(
+        "checkpoint",
+        metadata,
+        Column("key", String, primary_key=True),
+        Column("value", Integer, nullable=False),
+    )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, frontier, interval=10, item_writer=None):
+        """ Init Method """
+
+        # Set frontier
+        # Completed URLs are recorded as done entries of the frontier
+        self.frontier = frontier
+
+        # Set interval in seconds between writes
+        self.interval = interval
+
+        # Set item writer
+        # Buffered items are written before the URLs that yielded them are completed
+        self.item_writer = item_writer
+
+        # Initialize completed URL and method pairs that have yet to be written
+        self.completed = []
+
+        # Initialize last written timestamp
+        self.written_at = time.monotonic()
+
+        # Initialize lock
+        self.lock = threading.Lock()
+
+        # Create checkpoint table
+        self.metadata.create_all(frontier.db_session.get_bind())
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ COMPLETE                                                                       │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def complete(self, url, method, tables):
+        """ Records that a method finished yanking a URL and writes when due """
+
+        # Acquire lock
+        with self.lock:
+
+            # Add URL and method to completed
+            self.completed.append((url, method))
+
+            # Determine if write is due
+            is_due = time.monotonic() - self.written_at >= self.interval
+
+        # Write checkpoint if due
+        is_due and self.write(tables)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ WRITE                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def write(self, tables):
+        """ Writes completed URLs and the session counts of a dict of interfaces """
+
+        # Acquire lock
+        with self.lock:
+
+            # Take completed URLs
+            completed, self.completed = self.completed, []
+
+            # Set last written timestamp
+            self.written_at = time.monotonic()
+
+        # Initialize try-except block
+        try:
+
+            # Write the items of every completed URL taken
+            # URLs are taken first as their items were added before they were completed
+            self.item_writer and self.item_writer.flush()
+
+        # Except any exception
+        except Exception:
+
+            # Acquire lock
+            with self.lock:
+
+                # Put completed URLs back so that a later write still marks them done
+                self.completed = completed + self.completed
+
+            # Re-raise the exception
+            raise
+
+        # Get chunk size
+        chunk_size = self.CHUNK_SIZE
+
+        # Iterate over chunks of completed URLs
+        for i in range(0, len(completed), chunk_size):
+
+            # Mark chunk as done in the frontier
+            self.frontier.mark_done(completed[i : i + chunk_size])
+
+        # Return if there are no interfaces
+        if not tables:
+            return
+
+        # Get insert statement of session counts
+        statement = sqlite_insert(self.table).values(
+            [
+                {"key": name, "value": interface.session_count}
+                for name, interface in tables.items()
+            ]
+        )
+
+        # Replace session counts that already exist
+        statement = statement.on_conflict_do_update(
+            index_elements=["key"], set_={"value": statement.excluded.value}
+        )
+
+        # Execute statement
+        self.frontier.execute(statement)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RESTORE                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def restore(self, tables):
+        """ Restores the session counts of a dict of interfaces """
+
+        # Get session counts
+        session_counts = dict(self.frontier.execute(select(self.table)))
+
+        # Iterate over interfaces
+        for name, interface in tables.items():
+
+            # Set interface session count
+            interface.session_count = session_counts.get(name, 0)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CLEAR                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def clear(self, tables):
+        """ Clears recorded session counts and resets those of a dict of interfaces """
+
+        # Acquire lock
+        with self.lock:
+
+            # Clear completed URLs that have yet to be written
+            self.completed = []
+
+        # Delete session counts
+        self.frontier.execute(delete(self.table))
+
+        # Iterate over interfaces
+        for interface in tables.values():
+
+            # Reset interface session count
+            interface.session_count = 0
@@ -1,3 +1,6 @@
+BLOOM = "bloom"
+BULK_INGEST = "bulk_ingest"
+BURST = "burst"
 CAST = "cast"
 CHROME = "chrome"
 CHROMIUM = "chromium"
@@ -6,6 +9,7 @@ DISPLAY = "display"
 EAGER = "eager"
 ENDSWITH = "endswith"
 FIREFOX = "firefox"
+FONT = "font"
 GET = "get"
 HEADERS = "headers"
 ICONTAINS = "icontains"
@@ -13,17 +17,30 @@ IENDSWITH = "iendswith"
 IEXACT = "iexact"
 ISTARTSWITH = "istartswith"
 ID = "id"
+IGNORE = "ignore"
+IMAGE = "image"
 IN = "in"
+INDEX = "index"
 IIN = "iin"
 INPUT_TAG = " <YNK:#> "
+MEDIA = "media"
 NONE = "none"
 NORMAL = "normal"
 NULL = "null"
 QUICK = "quick"
 RANK = "rank"
+READ_HEAVY = "read_heavy"
+RECORD = "record"
 REGEX = "regex"
+REPLACE = "replace"
+REPLAY = "replay"
+SAFE = "safe"
 SESSION = "session"
+SET = "set"
 STARTSWITH = "startswith"
+STYLESHEET = "stylesheet"
+THROTTLE_MS = "throttle_ms"
+TRACKER = "tracker"
 TRANSIENT = "transient"
 TYPE = "type"
 UNIQUE = "unique"
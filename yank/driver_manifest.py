@@ -0,0 +1,336 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import json
+import os
+import tempfile
+import threading
+import time
+
+from contextlib import contextmanager
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ SELENIUM IMPORTS                                                                   │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.firefox import GeckoDriverManager
+from webdriver_manager.utils import ChromeType
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ PROJECT IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import yank.constants as _c
+
+from yank.exceptions import DriverNotFound
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ DRIVER MANIFEST                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class DriverManifest:
+    """
+    A local manifest of resolved webdriver binaries
+    Binaries are resolved once and then shared by every browser and process that uses
+    the same driver directory, so that launching a driver needs no network access
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CONSTANTS                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Define default driver directory
+    DRIVER_DIR = os.path.join(os.path.expanduser("~"), ".yank", "drivers")
+
+    # Define manifest and lock file names
+    MANIFEST_NAME = "manifest.json"
+    LOCK_NAME = "manifest.lock"
+
+    # Define seconds after which a lock file is considered abandoned
+    LOCK_STALE = 300
+
+    # Define seconds between attempts to acquire the lock file
+    LOCK_POLL = 0.1
+
+    # Initialize paths resolved in this process by manifest path and key
+    # This is shared by every manifest so that browsers resolve a binary only once
+    paths = {}
+
+    # Initialize lock of resolved paths
+    paths_lock = threading.Lock()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, driver_dir=None, version=None, offline=False, max_age_days=7):
+        """ Init Method """
+
+        # Set driver directory
+        self.driver_dir = driver_dir or self.DRIVER_DIR
+
+        # Set pinned driver version or None for the latest
+        self.version = version
+
+        # Set offline boolean
+        # An offline manifest only ever uses binaries that were resolved before
+        self.offline = offline
+
+        # Set seconds after which the latest version is resolved again
+        self.max_age = max_age_days and max_age_days * 86400
+
+        # Set manifest and lock paths
+        self.path = os.path.join(self.driver_dir, self.MANIFEST_NAME)
+        self.lock_path = os.path.join(self.driver_dir, self.LOCK_NAME)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET KEY                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_key(self, slug):
+        """ Returns the manifest key of a browser slug and the pinned version """
+
+        # Return key
+        return f"{slug}:{self.version or 'latest'}"
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ IS USABLE                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def is_usable(self, entry, is_stale_ok=False):
+        """ Returns a boolean of whether a manifest entry can be launched """
+
+        # Return False if entry is null or its binary has been removed
+        if not entry or not os.path.isfile(entry["path"]):
+            return False
+
+        # Return True if stale entries are acceptable
+        # Pinned versions never go stale
+        if is_stale_ok or self.version or not self.max_age:
+            return True
+
+        # Return True if entry was resolved recently
+        return time.time() - entry["resolved_at"] < self.max_age
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ READ                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def read(self):
+        """ Returns a dict of manifest entries by key """
+
+        # Initialize try-except block
+        try:
+
+            # Open manifest
+            with open(self.path) as f:
+
+                # Return entries
+                return json.load(f)
+
+        # Except missing or corrupt manifests
+        except (OSError, ValueError):
+
+            # Return an empty manifest
+            return {}
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ WRITE                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def write(self, manifest):
+        """ Atomically writes a dict of manifest entries by key """
+
+        # Open a temporary file in the driver directory
+        fd, path_tmp = tempfile.mkstemp(dir=self.driver_dir)
+
+        # Write entries
+        with os.fdopen(fd, "w") as f:
+            json.dump(manifest, f, indent=4)
+
+        # Replace manifest so that readers never see a partial write
+        os.replace(path_tmp, self.path)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ FILE LOCK                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @contextmanager
+    def file_lock(self):
+        """ Holds a lock file so that only one process resolves a binary at once """
+
+        # Iterate until lock file is created
+        while True:
+
+            # Initialize try-except block
+            try:
+
+                # Create lock file, failing if another process holds it
+                os.close(os.open(self.lock_path, os.O_CREAT | os.O_EXCL))
+
+                # Break
+                break
+
+            # Except lock files that already exist
+            except FileExistsError:
+
+                # Initialize try-except block
+                try:
+
+                    # Remove lock file if its process has likely died
+                    if time.time() - os.path.getmtime(self.lock_path) > self.LOCK_STALE:
+                        os.remove(self.lock_path)
+
+                # Except lock files that were released in the meantime
+                except FileNotFoundError:
+                    pass
+
+                # Wait before trying again
+                time.sleep(self.LOCK_POLL)
+
+        # Initialize try-finally block
+        try:
+
+            # Hold the lock for the duration of the block
+            yield
+
+        # Release lock
+        finally:
+
+            # Remove lock file
+            os.remove(self.lock_path)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INSTALL                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def install(self, slug):
+        """ Downloads or locates a webdriver binary and returns its path """
+
+        # Set log level to 0
+        # Silences webdriver manager log output
+        os.environ["WDM_LOG_LEVEL"] = "0"
+
+        # Define manager kwargs
+        manager_kwargs = {"version": self.version or "latest", "path": self.driver_dir}
+
+        # Check if browser is Firefox
+        if slug == _c.FIREFOX:
+
+            # Initialize a Gecko driver manager
+            manager = GeckoDriverManager(**manager_kwargs)
+
+        # Otherwise handle default case
+        else:
+
+            # Check if browser is Chromium
+            if slug == _c.CHROMIUM:
+
+                # Add Chrome type to kwargs
+                manager_kwargs["chrome_type"] = ChromeType.CHROMIUM
+
+            # Initialize a Chrome driver manager
+            manager = ChromeDriverManager(**manager_kwargs)
+
+        # Return path of binary
+        return manager.install()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RESOLVE                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def resolve(self, slug):
+        """ Returns a manifest entry of a browser slug, resolving it if needed """
+
+        # Get key
+        key = self.get_key(slug)
+
+        # Get entry
+        entry = self.read().get(key)
+
+        # Return entry if it can be launched as is
+        if self.is_usable(entry, is_stale_ok=self.offline):
+            return entry
+
+        # Check if offline
+        if self.offline:
+
+            # Raise DriverNotFound
+            raise DriverNotFound(
+                f"No {slug} driver has been resolved in {self.driver_dir}. Resolve one "
+                f"with network access first or disable offline mode."
+            )
+
+        # Create driver directory
+        os.makedirs(self.driver_dir, exist_ok=True)
+
+        # Acquire lock file
+        with self.file_lock():
+
+            # Get manifest again as another process may have resolved the binary
+            manifest = self.read()
+
+            # Get entry
+            entry = manifest.get(key)
+
+            # Return entry if another process resolved it
+            if self.is_usable(entry):
+                return entry
+
+            # Initialize try-except block
+            try:
+
+                # Install binary
+                path = self.install(slug)
+
+            # Except any exception
+            except Exception:
+
+                # Return stale entry if the latest version could not be resolved
+                if self.is_usable(entry, is_stale_ok=True):
+                    return entry
+
+                # Re-raise the exception
+                raise
+
+            # Initialize entry
+            # The binary is stored in a directory named after its version
+            entry = {
+                "path": path,
+                "version": os.path.basename(os.path.dirname(path)),
+                "resolved_at": time.time(),
+            }
+
+            # Save entry
+            manifest[key] = entry
+            self.write(manifest)
+
+        # Return entry
+        return entry
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET PATH                                                                       │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_path(self, slug):
+        """ Returns the path of a webdriver binary, resolving it once per process """
+
+        # Get key of resolved paths
+        key = (self.path, self.get_key(slug))
+
+        # Acquire lock of resolved paths
+        # Browsers that launch at the same time wait for a single resolution
+        with self.paths_lock:
+
+            # Check if path has not been resolved in this process
+            if key not in self.paths:
+
+                # Resolve and cache path
+                self.paths[key] = self.resolve(slug)["path"]
+
+            # Return path
+            return self.paths[key]
@@ -0,0 +1,248 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import threading
+
+from contextlib import contextmanager
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ SELENIUM IMPORTS                                                                   │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from selenium.common.exceptions import WebDriverException
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ DRIVER POOL                                                                        │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class DriverPool:
+    """ A bounded pool of webdrivers that are checked out one page at a time """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, initialize_driver, size=1, recycle_after=None):
+        """ Init Method """
+
+        # Set driver initializer
+        self.initialize_driver = initialize_driver
+
+        # Set max number of drivers
+        self.size = max(size or 1, 1)
+
+        # Set number of pages after which a driver is replaced
+        # This contains the memory growth of long-lived browser processes
+        self.recycle_after = recycle_after
+
+        # Initialize idle drivers
+        self.idle = []
+
+        # Initialize page counts by driver
+        self.pages = {}
+
+        # Initialize number of drivers that exist or are being initialized
+        self.count = 0
+
+        # Initialize number of drivers replaced for being dead or recycled
+        self.replaced = 0
+
+        # Initialize condition that checkouts wait on for an idle driver
+        self.condition = threading.Condition()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ IS HEALTHY                                                                     │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @staticmethod
+    def is_healthy(driver):
+        """ Returns a boolean of whether a driver still responds to commands """
+
+        # Initialize try-except block
+        try:
+
+            # Get window handles, which fails if the browser has crashed or closed
+            return bool(driver.window_handles)
+
+        # Except dead drivers
+        except WebDriverException:
+
+            # Return False
+            return False
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ACQUIRE                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def acquire(self):
+        """ Returns an idle healthy driver, initializing one if the pool is not full """
+
+        # Iterate until a driver is acquired
+        while True:
+
+            # Acquire condition
+            with self.condition:
+
+                # Wait for an idle driver or room for a new one
+                while not self.idle and self.count >= self.size:
+                    self.condition.wait()
+
+                # Get an idle driver or None to initialize a new one
+                driver = self.idle.pop() if self.idle else None
+
+                # Reserve room for a new driver
+                if driver is None:
+                    self.count += 1
+
+            # Return idle driver if it is healthy
+            if driver is not None and self.is_healthy(driver):
+                return driver
+
+            # Check if idle driver is dead
+            if driver is not None:
+
+                # Discard dead driver and try again
+                self.discard(driver)
+                continue
+
+            # Initialize try-except block
+            try:
+
+                # Initialize a new driver
+                driver = self.initialize_driver()
+
+            # Except any exception
+            except BaseException:
+
+                # Release the room reserved for the new driver
+                with self.condition:
+                    self.count -= 1
+                    self.condition.notify()
+
+                # Re-raise the exception
+                raise
+
+            # Initialize page count
+            with self.condition:
+                self.pages[driver] = 0
+
+            # Return new driver
+            return driver
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RELEASE                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def release(self, driver):
+        """ Returns a driver to the pool, replacing it if it has loaded enough pages """
+
+        # Acquire condition
+        with self.condition:
+
+            # Increment page count
+            self.pages[driver] = self.pages.get(driver, 0) + 1
+
+            # Determine if driver should be recycled
+            should_recycle = (
+                self.recycle_after and self.pages[driver] >= self.recycle_after
+            )
+
+            # Check if driver should be kept
+            if not should_recycle:
+
+                # Return driver to idle drivers
+                self.idle.append(driver)
+
+                # Wake a waiting checkout
+                self.condition.notify()
+
+                # Return
+                return
+
+        # Discard driver so that a fresh one is initialized on the next checkout
+        self.discard(driver)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ DISCARD                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def discard(self, driver, replaced=True):
+        """ Quits a driver and frees its room in the pool """
+
+        # Initialize try-except block
+        try:
+
+            # Quit driver
+            driver.quit()
+
+        # Except drivers that are already dead
+        except WebDriverException:
+
+            # Pass as the driver is gone either way
+            pass
+
+        # Acquire condition
+        with self.condition:
+
+            # Forget driver
+            self.pages.pop(driver, None)
+
+            # Free its room
+            self.count -= 1
+
+            # Increment replaced if driver was dead or recycled
+            self.replaced += 1 if replaced else 0
+
+            # Wake a waiting checkout
+            self.condition.notify()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CHECKOUT                                                                       │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @contextmanager
+    def checkout(self):
+        """ Holds a driver of the pool for the duration of a page """
+
+        # Acquire driver
+        driver = self.acquire()
+
+        # Initialize try-except block
+        try:
+
+            # Yield driver
+            yield driver
+
+        # Except any exception
+        except BaseException:
+
+            # Replace the driver if the exception left it dead
+            self.release(driver) if self.is_healthy(driver) else self.discard(driver)
+
+            # Re-raise the exception
+            raise
+
+        # Return driver to the pool
+        self.release(driver)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CLOSE                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def close(self):
+        """ Quits every idle driver of the pool """
+
+        # Acquire condition
+        with self.condition:
+
+            # Take idle drivers
+            idle, self.idle = self.idle, []
+
+        # Iterate over idle drivers
+        for driver in idle:
+
+            # Quit driver
+            self.discard(driver, replaced=False)
@@ -1,3 +1,30 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ ARCHIVE MISS                                                                       │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class ArchiveMiss(Exception):
+    """ Archive Miss """
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ CIRCUIT OPEN                                                                       │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class CircuitOpen(Exception):
+    """ Circuit Open """
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ DRIVER NOT FOUND                                                                   │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class DriverNotFound(Exception):
+    """ Driver Not Found """
+
+
 # ┌────────────────────────────────────────────────────────────────────────────────────┐
 # │ SESSION LIMIT REACHED                                                              │
 # └────────────────────────────────────────────────────────────────────────────────────┘
@@ -16,6 +43,24 @@ class UnsupportedBrowserError(Exception):
     """ Unsupported Browser Error """
 
 
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ UNSUPPORTED CONFLICT POLICY ERROR                                                  │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class UnsupportedConflictPolicyError(Exception):
+    """ Unsupported Conflict Policy Error """
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ UNSUPPORTED DB PROFILE ERROR                                                       │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class UnsupportedDBProfileError(Exception):
+    """ Unsupported DB Profile Error """
+
+
 # ┌────────────────────────────────────────────────────────────────────────────────────┐
 # │ UNSUPPORTED DRIVER MODE ERROR                                                      │
 # └────────────────────────────────────────────────────────────────────────────────────┘
@@ -0,0 +1,286 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ SQLALCHEMY IMPORTS                                                                 │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from sqlalchemy import (
+    Column,
+    delete,
+    func,
+    Index,
+    insert,
+    Integer,
+    MetaData,
+    select,
+    String,
+    Table,
+    UniqueConstraint,
+    update,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ FRONTIER                                                                           │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class Frontier:
+    """ A persistent priority queue of URLs waiting to be passed to yank methods """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CONSTANTS                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Statuses
+    PENDING = 0
+    ACTIVE = 1
+    DONE = 2
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CLASS ATTRIBUTES                                                               │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Initialize metadata
+    # The frontier table is kept apart from the interface tables of DBBase
+    metadata = MetaData()
+
+    # Define frontier table
+    table = Table(
+        "frontier",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("url", String, nullable=False),
+        Column("method", String, nullable=False),
+        Column("priority", Integer, nullable=False, default=0),
+        Column("status", Integer, nullable=False, default=PENDING),
+        UniqueConstraint("method", "url"),
+        Index("ix_frontier_status_priority", "status", "priority", "id"),
+    )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, db_engine, db_session, db_lock):
+        """ Init Method """
+
+        # Set database session
+        self.db_session = db_session
+
+        # Set database lock
+        self.db_lock = db_lock
+
+        # Create frontier table
+        self.metadata.create_all(db_engine)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ EXECUTE                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def execute(self, statement):
+        """ Executes a statement and returns its rows or the number of rows affected """
+
+        # Acquire database lock
+        with self.db_lock:
+
+            # Execute statement
+            result = self.db_session.execute(statement)
+
+            # Get rows or row count before the connection is released by the commit
+            result = result.all() if result.returns_rows else result.rowcount
+
+            # Commit transaction
+            self.db_session.commit()
+
+            # Return result
+            return result
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ COUNT                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def count(self, *statuses, excluded_methods=None):
+        """ Returns a count of frontier entries with any of the given statuses """
+
+        # Get table
+        table = self.table
+
+        # Initialize query
+        query = select(func.count(table.c.id))
+
+        # Check if statuses is not null
+        if statuses:
+
+            # Filter query by statuses
+            query = query.where(table.c.status.in_(statuses))
+
+        # Check if excluded methods is not null
+        if excluded_methods:
+
+            # Exclude entries of excluded methods
+            query = query.where(table.c.method.notin_(excluded_methods))
+
+        # Return count
+        return self.execute(query)[0][0]
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ PREPARE                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def prepare(self, resume=False):
+        """ Prepares the frontier to resume an unfinished crawl or start a new one """
+
+        # Get table
+        table = self.table
+
+        # Check if resume is True
+        if resume:
+
+            # Requeue entries that were interrupted while being yanked
+            self.execute(
+                update(table)
+                .where(table.c.status == self.ACTIVE)
+                .values(status=self.PENDING)
+            )
+
+        # Otherwise handle case of a new crawl
+        else:
+
+            # Clear the frontier so that its URLs can be yanked again
+            self.clear()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ PUSH                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def push(self, url, method, priority=0):
+        """ Adds a URL to the frontier unless it was already added for the method """
+
+        # Get insert statement that ignores duplicates
+        statement = (
+            insert(self.table)
+            .prefix_with("OR IGNORE")
+            .values(url=url, method=method, priority=priority, status=self.PENDING)
+        )
+
+        # Return True if a row was inserted
+        return self.execute(statement) > 0
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ POP                                                                            │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def pop(self, excluded_methods=None):
+        """ Marks the highest priority pending entry as active and returns it """
+
+        # Get table
+        table = self.table
+
+        # Initialize query of pending entries
+        query = select(table.c.id, table.c.url, table.c.method).where(
+            table.c.status == self.PENDING
+        )
+
+        # Check if excluded methods is not null
+        if excluded_methods:
+
+            # Exclude entries of excluded methods
+            query = query.where(table.c.method.notin_(excluded_methods))
+
+        # Acquire database lock
+        # Selecting and marking the entry must not be interleaved with other workers
+        with self.db_lock:
+
+            # Get highest priority entry, oldest first
+            entries = self.execute(
+                query.order_by(table.c.priority.desc(), table.c.id).limit(1)
+            )
+
+            # Return None if there are no pending entries
+            if not entries:
+                return None
+
+            # Get entry
+            entry = entries[0]
+
+            # Mark entry as active
+            self.execute(
+                update(table).where(table.c.id == entry.id).values(status=self.ACTIVE)
+            )
+
+            # Return URL and method
+            return entry.url, entry.method
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SET STATUS                                                                     │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def set_status(self, url, method, status):
+        """ Sets the status of a frontier entry """
+
+        # Get table
+        table = self.table
+
+        # Update entry status
+        self.execute(
+            update(table)
+            .where(table.c.method == method, table.c.url == url)
+            .values(status=status)
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ MARK DONE                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def mark_done(self, entries):
+        """ Marks a list of URL and method pairs as done, adding them if necessary """
+
+        # Return if entries is null
+        if not entries:
+            return
+
+        # Get insert statement
+        statement = sqlite_insert(self.table).values(
+            [
+                {"url": url, "method": method, "priority": 0, "status": self.DONE}
+                for url, method in entries
+            ]
+        )
+
+        # Update the status of entries that already exist
+        statement = statement.on_conflict_do_update(
+            index_elements=["method", "url"], set_={"status": self.DONE}
+        )
+
+        # Execute statement
+        self.execute(statement)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET DONE URLS                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_done_urls(self, method):
+        """ Returns a set of the URLs that a method has finished yanking """
+
+        # Get table
+        table = self.table
+
+        # Get done URLs
+        rows = self.execute(
+            select(table.c.url).where(
+                table.c.method == method, table.c.status == self.DONE
+            )
+        )
+
+        # Return a set of URLs
+        return {row.url for row in rows}
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CLEAR                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def clear(self):
+        """ Deletes every entry in the frontier """
+
+        # Delete entries
+        self.execute(delete(self.table))
@@ -0,0 +1,295 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import json
+import re
+import threading
+
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ SELENIUM IMPORTS                                                                   │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from seleniumwire.utils import decode
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ HANDOFF                                                                            │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class Handoff:
+    """
+    A JSON endpoint discovered in the driver traffic of a yank method
+    Once discovered, later targets of the method call the endpoint with the requester
+    instead of loading their page in a browser
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CONSTANTS                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Define request headers that are not replayed
+    # Cookies are replayed through the requester's session instead
+    EXCLUDED_HEADERS = {"accept-encoding", "content-length", "cookie", "host"}
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, pattern=None):
+        """ Init Method """
+
+        # Set URL pattern of the endpoint or None to pick the largest JSON response
+        self.pattern = pattern if isinstance(pattern, str) else None
+
+        # Initialize scheme and host of the endpoint
+        self.origin = None
+
+        # Initialize path segments and query params of the endpoint
+        # Values taken from the target URL are stored as indexes of its tokens
+        self.path = None
+        self.query = None
+
+        # Initialize request headers of the endpoint
+        self.headers = {}
+
+        # Initialize driver cookies sent with every call of the endpoint
+        self.cookies = {}
+
+        # Initialize top-level JSON keys of the endpoint's response
+        self.keys = None
+
+        # Initialize hits and fallbacks
+        self.hits = 0
+        self.fallbacks = 0
+
+        # Initialize lock
+        self.lock = threading.Lock()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ IS DISCOVERED                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @property
+    def is_discovered(self):
+        """ Returns a boolean of whether an endpoint has been discovered """
+
+        # Return True if endpoint origin is set
+        return self.origin is not None
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET TOKENS                                                                     │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @staticmethod
+    def get_tokens(url):
+        """ Returns a list of the path segments and query values of a URL """
+
+        # Split URL
+        parts = urlsplit(url)
+
+        # Return path segments followed by query values
+        return [s for s in parts.path.split("/") if s] + [
+            v for _, v in parse_qsl(parts.query)
+        ]
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET JSON                                                                       │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @staticmethod
+    def get_json(response):
+        """ Returns the decoded JSON body of a driver or requester response or None """
+
+        # Return None if response is null
+        if response is None:
+            return None
+
+        # Initialize try-except block
+        try:
+
+            # Check if response was captured by Selenium Wire
+            if hasattr(response, "body"):
+
+                # Decode and parse captured body
+                return json.loads(
+                    decode(
+                        response.body,
+                        response.headers.get("Content-Encoding", "identity"),
+                    )
+                )
+
+            # Parse requester body
+            return response.json()
+
+        # Except bodies that are not JSON
+        except ValueError:
+
+            # Return None
+            return None
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ IS CANDIDATE                                                                   │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def is_candidate(self, request):
+        """ Returns a boolean of whether a captured request may carry the data """
+
+        # Get captured response
+        response = request.response and request.response._response
+
+        # Return False if request has no successful response
+        if response is None or response.status_code != 200:
+            return False
+
+        # Return False if request is not a GET request
+        # Other methods carry bodies that cannot be rebuilt for another target
+        if response.request.method != "GET":
+            return False
+
+        # Return False if response is not JSON
+        if "json" not in response.headers.get("Content-Type", "").lower():
+            return False
+
+        # Return True if request URL matches pattern
+        return not self.pattern or bool(re.search(self.pattern, request.url))
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ DISCOVER                                                                       │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def discover(self, url, requests, cookies=None):
+        """ Records the captured request of a target that carried its data """
+
+        # Get candidate requests
+        candidates = [r for r in requests if self.is_candidate(r)]
+
+        # Return None if there are no candidates
+        if not candidates:
+            return None
+
+        # Get the candidate with the largest response
+        # Decoded content is read as replayed responses have no captured body
+        request = max(candidates, key=lambda r: len(r.response.content))
+
+        # Get data
+        data = self.get_json(request.response._response)
+
+        # Get tokens of target URL
+        tokens = self.get_tokens(url)
+
+        # Define a function that swaps a value for the index of a matching token
+        def templatize(value):
+            return tokens.index(value) if value in tokens else value
+
+        # Split endpoint URL
+        parts = urlsplit(request.url)
+
+        # Acquire lock
+        with self.lock:
+
+            # Set endpoint origin
+            self.origin = (parts.scheme, parts.netloc)
+
+            # Set endpoint path segments and query params
+            self.path = [templatize(s) for s in parts.path.split("/")]
+            self.query = [(k, templatize(v)) for k, v in parse_qsl(parts.query)]
+
+            # Set endpoint headers
+            self.headers = {
+                k: v
+                for k, v in (request.headers or {}).items()
+                if k.lower() not in self.EXCLUDED_HEADERS
+            }
+
+            # Set top-level JSON keys
+            self.keys = set(data) if isinstance(data, dict) else None
+
+            # Set driver cookies by name
+            self.cookies = {c["name"]: c["value"] for c in cookies or []}
+
+        # Return request
+        return request
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET URL                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_url(self, url):
+        """ Returns the endpoint URL of a target URL or None if it cannot be built """
+
+        # Get tokens of target URL
+        tokens = self.get_tokens(url)
+
+        # Acquire lock
+        with self.lock:
+
+            # Return None if endpoint has not been discovered
+            if not self.is_discovered:
+                return None
+
+            # Get indexes of target URL tokens used by the endpoint
+            indexes = [
+                v for v in self.path + [v for _, v in self.query] if type(v) is int
+            ]
+
+            # Return None if target URL lacks a token used by the endpoint
+            if any(i >= len(tokens) for i in indexes):
+                return None
+
+            # Define a function that swaps a token index for the token itself
+            def fill(value):
+                return tokens[value] if type(value) is int else value
+
+            # Build endpoint path and query
+            path = "/".join(fill(s) for s in self.path)
+            query = urlencode([(k, fill(v)) for k, v in self.query])
+
+            # Return endpoint URL
+            return urlunsplit((*self.origin, path, query, ""))
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ IS VALID                                                                       │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def is_valid(self, response):
+        """ Returns a boolean of whether an endpoint response resembles the original """
+
+        # Return False if response is null or unsuccessful
+        if response is None or response.status_code != 200:
+            return False
+
+        # Get data
+        data = self.get_json(response)
+
+        # Return False if response is not JSON
+        if data is None:
+            return False
+
+        # Return True if response has the top-level keys of the original
+        return not self.keys or (isinstance(data, dict) and self.keys <= set(data))
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ COUNT                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def count(self, hit):
+        """ Increments the hit or fallback counter """
+
+        # Acquire lock
+        with self.lock:
+
+            # Check if hit
+            if hit:
+
+                # Increment hits
+                self.hits += 1
+
+            # Otherwise handle fallback
+            else:
+
+                # Increment fallbacks
+                self.fallbacks += 1
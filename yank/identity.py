@@ -0,0 +1,167 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import json
+import os
+import tempfile
+import threading
+import time
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ IDENTITY STORE                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class IdentityStore:
+    """
+    Persists the headers, user agent and cookies harvested by a driver
+    A yanker that loads a fresh identity does not need to start a browser for them
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, path, ttl=86400):
+        """ Init Method """
+
+        # Set path of the identity file
+        self.path = path
+
+        # Set seconds after which a saved identity is harvested again
+        self.ttl = ttl
+
+        # Initialize last read or written identity
+        # Saves compare against it so that an unchanged identity is not rewritten
+        self.identity = None
+
+        # Initialize lock
+        self.lock = threading.Lock()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ READ                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def read(self):
+        """ Returns the saved identity dict regardless of its age """
+
+        # Initialize try-except block
+        try:
+
+            # Open identity file
+            with open(self.path) as f:
+
+                # Cache and return identity
+                self.identity = json.load(f)
+                return self.identity
+
+        # Except missing or corrupt identity files
+        except (OSError, ValueError):
+
+            # Return an empty identity
+            return {}
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ LOAD                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def load(self):
+        """ Returns the saved identity dict or None if it is missing or expired """
+
+        # Get identity
+        identity = self.read()
+
+        # Return None if identity was never saved or has expired
+        if not identity or time.time() - identity.get("saved_at", 0) >= self.ttl:
+            return None
+
+        # Get now
+        now = time.time()
+
+        # Drop cookies that have expired since they were saved
+        identity["cookies"] = [
+            c for c in identity.get("cookies") or [] if c.get("expiry", now + 1) > now
+        ]
+
+        # Return identity
+        return identity
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ IS CHANGED                                                                     │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def is_changed(self, identity, values):
+        """ Returns a boolean of whether harvested values change a saved identity """
+
+        # Return True if identity was never saved or has expired
+        if not identity or time.time() - identity.get("saved_at", 0) >= self.ttl:
+            return True
+
+        # Define a function that reduces cookies to their names and values
+        # Expiries are refreshed on every page and do not make an identity stale
+        def get_values(cookies):
+            return {c["name"]: c["value"] for c in cookies or []}
+
+        # Return True if any harvested value differs from the saved one
+        return any(
+            get_values(v) != get_values(identity.get(k))
+            if k == "cookies"
+            else v != identity.get(k)
+            for k, v in values.items()
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SAVE                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def save(self, headers=None, user_agent=None, cookies=None):
+        """ Merges harvested values into the saved identity and writes it """
+
+        # Acquire lock
+        with self.lock:
+
+            # Get last read or written identity, reading it if there is none
+            identity = dict(self.identity or self.read())
+
+            # Get values that were harvested
+            values = {
+                k: v
+                for k, v in {
+                    "headers": headers,
+                    "user_agent": user_agent,
+                    "cookies": cookies,
+                }.items()
+                if v
+            }
+
+            # Return if harvested values leave a fresh identity unchanged
+            # Drivers harvest on every page and rewriting the file each time is waste
+            if not self.is_changed(identity, values):
+                return
+
+            # Merge values that were harvested
+            identity.update(values)
+
+            # Set saved timestamp
+            identity["saved_at"] = time.time()
+
+            # Get directory
+            directory = os.path.dirname(os.path.abspath(self.path))
+
+            # Create directory
+            os.makedirs(directory, exist_ok=True)
+
+            # Open a temporary file in the same directory
+            fd, path_tmp = tempfile.mkstemp(dir=directory)
+
+            # Write identity
+            with os.fdopen(fd, "w") as f:
+                json.dump(identity, f, indent=4)
+
+            # Replace identity file so that readers never see a partial write
+            os.replace(path_tmp, self.path)
+
+            # Cache identity
+            self.identity = identity
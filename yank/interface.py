@@ -3,6 +3,7 @@
 # └────────────────────────────────────────────────────────────────────────────────────┘
 
 import math
+import sqlite3
 
 from datetime import datetime
 
@@ -10,7 +11,7 @@ from datetime import datetime
 # │ SQLALCHEMY IMPORTS                                                                 │
 # └────────────────────────────────────────────────────────────────────────────────────┘
 
-from sqlalchemy import Column, func, Integer
+from sqlalchemy import Column, func, Index, Integer
 from sqlalchemy.ext.hybrid import hybrid_property
 
 # ┌────────────────────────────────────────────────────────────────────────────────────┐
@@ -20,6 +21,7 @@ from sqlalchemy.ext.hybrid import hybrid_property
 import yank.constants as _c
 
 from yank.browser import Browser
+from yank.exceptions import UnsupportedConflictPolicyError
 from yank.interface_database_mixin import InterfaceDatabaseMixin
 from yank.interface_display_mixin import InterfaceDisplayMixin
 
@@ -39,11 +41,20 @@ class Interface(InterfaceDatabaseMixin, InterfaceDisplayMixin):
     # Interface
     CAST = _c.CAST
     DISPLAY = _c.DISPLAY
+    INDEX = _c.INDEX
     NULL = _c.NULL
     RANK = _c.RANK
     UNIQUE = _c.UNIQUE
     WEIGHT = _c.WEIGHT
 
+    # URL indexes
+    BLOOM = _c.BLOOM
+    SET = _c.SET
+
+    # Conflict policies
+    IGNORE = _c.IGNORE
+    REPLACE = _c.REPLACE
+
     # Fields
     ID = _c.ID
     URL = _c.URL
@@ -57,14 +68,51 @@ class Interface(InterfaceDatabaseMixin, InterfaceDisplayMixin):
     name = ""
 
     # Initialize skip by URL to False
+    # The URL column is indexed if True
     skip_by_url = False
 
+    # Initialize composite indexes to None
+    # e.g. [("author", "yanked_at")] to filter by author and sort by yanked at
+    indexes = None
+
+    # Initialize conflict policy of items that break a unique field to None (raise)
+    # Use IGNORE to keep the existing item, REPLACE to overwrite all of its fields but
+    # its ID, or a list of fields to update on the existing item
+    on_conflict = None
+
     # Initialize session limit to None
     session_limit = None
 
     # Initialize session count to 0
     session_count = 0
 
+    # Initialize URL index to an exact set
+    # Use BLOOM to trade a DB check on positive hits for far less memory
+    url_index = _c.SET
+
+    # Initialize false positive rate of a Bloom filter URL index
+    url_index_error_rate = 0.001
+
+    # Initialize max bytes read per response to None (use the yanker's)
+    max_bytes = None
+
+    # Initialize allowed content types to None (use the yanker's)
+    content_types = None
+
+    # Initialize resources that drivers do not load to None (use the yanker's)
+    block_resources = None
+
+    # Initialize URL patterns and content types of captured driver requests to None
+    # (use the yanker's)
+    capture_urls = None
+    capture_content_types = None
+
+    # Initialize handoff to None (use the yanker's)
+    handoff = None
+
+    # Initialize wait condition of driver pages to None (use the yanker's)
+    wait_for = None
+
     # Initialize display list by to None
     display_list_by = None
 
@@ -93,6 +141,7 @@ class Interface(InterfaceDatabaseMixin, InterfaceDisplayMixin):
         # Get common constants
         CAST = self.CAST
         DISPLAY = self.DISPLAY
+        INDEX = self.INDEX
         RANK = self.RANK
         UNIQUE = self.UNIQUE
         WEIGHT = self.WEIGHT
@@ -130,7 +179,7 @@ class Interface(InterfaceDatabaseMixin, InterfaceDisplayMixin):
         }
 
         # Add yanked at and URL to field map
-        field_map[self.URL] = {CAST: str, DISPLAY: "URL"}
+        field_map[self.URL] = {CAST: str, DISPLAY: "URL", INDEX: self.skip_by_url}
         field_map[self.YANKED_AT] = datetime
 
         # Normalize the structure of the field map
@@ -141,6 +190,41 @@ class Interface(InterfaceDatabaseMixin, InterfaceDisplayMixin):
         # Set field map
         self.field_map = field_map
 
+        # ┌────────────────────────────────────────────────────────────────────────────┐
+        # │ ON CONFLICT                                                                │
+        # └────────────────────────────────────────────────────────────────────────────┘
+
+        # Get conflict policy
+        on_conflict = self.on_conflict
+
+        # Check if conflict policy is not supported
+        if on_conflict and (
+            on_conflict not in (self.IGNORE, self.REPLACE)
+            if type(on_conflict) is str
+            else any(field not in field_map for field in on_conflict)
+        ):
+
+            # Raise UnsupportedConflictPolicyError
+            raise UnsupportedConflictPolicyError(
+                f"Conflict policy '{on_conflict}' not supported. Please use one of "
+                f"the following: {self.IGNORE}, {self.REPLACE} or a list of fields"
+            )
+
+        # Check if updating existing items needs an upsert without a conflict target
+        # SQLite only supports these from 3.35, which several unique fields require
+        if (
+            on_conflict
+            and on_conflict != self.IGNORE
+            and len(self.get_unique_fields()) > 1
+            and sqlite3.sqlite_version_info < (3, 35, 0)
+        ):
+
+            # Raise UnsupportedConflictPolicyError
+            raise UnsupportedConflictPolicyError(
+                f"Conflict policy '{on_conflict}' needs SQLite 3.35 or later with more "
+                f"than one unique field. Found SQLite {sqlite3.sqlite_version}"
+            )
+
         # ┌────────────────────────────────────────────────────────────────────────────┐
         # │ DEFAULTS                                                                   │
         # └────────────────────────────────────────────────────────────────────────────┘
@@ -207,8 +291,11 @@ class Interface(InterfaceDatabaseMixin, InterfaceDisplayMixin):
                 # Get unique
                 unique = info.get(UNIQUE, False)
 
+                # Get index
+                index = bool(info.get(INDEX, False))
+
                 # Set class attribute
-                setattr(cls, field, Column(ColType, unique=unique))
+                setattr(cls, field, Column(ColType, unique=unique, index=index))
 
             # Define rank
             @hybrid_property
@@ -273,6 +360,18 @@ class Interface(InterfaceDatabaseMixin, InterfaceDisplayMixin):
             # Set ID as primary key
             id = Column(Integer, primary_key=True)
 
+        # Iterate over composite indexes
+        for fields in self.indexes or []:
+
+            # Normalize a single field to a tuple
+            fields = (fields,) if type(fields) is str else tuple(fields)
+
+            # Add index to Item table
+            Index(
+                f"ix_{self.db_table_name}_{'_'.join(fields)}",
+                *[getattr(Item, field) for field in fields],
+            )
+
         # Set Item class on interface object
         self.Item = Item
 
@@ -542,6 +641,9 @@ class Interface(InterfaceDatabaseMixin, InterfaceDisplayMixin):
             # Assert value is datetime
             assert value_type is datetime, f"{field} is not a valid datetime"
 
+            # Return the value as datetime cannot be cast from itself
+            return value
+
         # Cast value to appropriate type
         value = to_type(value)
 
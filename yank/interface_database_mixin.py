@@ -9,6 +9,7 @@ from datetime import datetime
 # └────────────────────────────────────────────────────────────────────────────────────┘
 
 from sqlalchemy import Boolean, DateTime, exists, Float, func, Integer, String
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 # ┌────────────────────────────────────────────────────────────────────────────────────┐
 # │ PROJECT IMPORTS                                                                    │
@@ -16,6 +17,8 @@ from sqlalchemy import Boolean, DateTime, exists, Float, func, Integer, String
 
 import yank.constants as _c
 
+from yank.url_index import BloomFilter, URLSet
+
 
 # ┌────────────────────────────────────────────────────────────────────────────────────┐
 # │ INTERFACE DATABASE MIXIN                                                           │
@@ -45,6 +48,9 @@ class InterfaceDatabaseMixin:
     # Initialize database session
     db_session = None
 
+    # Initialize cached URL index
+    _url_index = None
+
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │ NEW                                                                            │
     # └────────────────────────────────────────────────────────────────────────────────┘
@@ -52,11 +58,70 @@ class InterfaceDatabaseMixin:
     def new(self, **kwargs):
         """ A creates a new Item using the SQLAlchemy ORM Item class """
 
+        # Cast the item fields spplied as kawrgs and return an initialized Item object
+        return self.Item(**self.new_row(**kwargs))
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ NEW ROW                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def new_row(self, **kwargs):
+        """ Returns a dict of cast item fields that can be inserted in bulk """
+
         # Get rid of all kwargs not in field map
         kwargs = {k: v for k, v in kwargs.items() if k in self.field_map}
 
-        # Cast the item fields spplied as kawrgs and return an initialized Item object
-        return self.Item(**self.cast_fields(kwargs))
+        # Return cast item fields
+        return self.cast_fields(kwargs)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INSERT STATEMENT                                                               │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def insert_statement(self):
+        """ Returns an insert statement of Items that applies the conflict policy """
+
+        # Get insert statement
+        statement = sqlite_insert(self.Item.__table__)
+
+        # Get conflict policy
+        on_conflict = self.on_conflict
+
+        # Return plain insert statement if there is no conflict policy
+        if not on_conflict:
+            return statement
+
+        # Return statement that keeps existing items if conflict policy is ignore
+        if on_conflict == _c.IGNORE:
+            return statement.on_conflict_do_nothing()
+
+        # Get fields to update, which are all but the key if conflict policy is replace
+        # Existing items are updated in place so that their IDs are kept
+        fields = (
+            [field for field in self.field_map if field != _c.ID]
+            if on_conflict == _c.REPLACE
+            else on_conflict
+        )
+
+        # Get unique fields
+        unique_fields = self.get_unique_fields()
+
+        # Return statement that updates the fields of existing items
+        # A single unique field is named as the conflict target for older SQLite
+        return statement.on_conflict_do_update(
+            index_elements=unique_fields if len(unique_fields) == 1 else None,
+            set_={field: statement.excluded[field] for field in fields},
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET UNIQUE FIELDS                                                              │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_unique_fields(self):
+        """ Returns a list of the fields of unique columns """
+
+        # Return unique fields
+        return [field for field, info in self.field_map.items() if info.get(_c.UNIQUE)]
 
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │ GET                                                                            │
@@ -114,6 +179,79 @@ class InterfaceDatabaseMixin:
             exists().where(*[k == v for k, v in kwargs.items()])
         ).scalar()
 
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ BUILD URL INDEX                                                                │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def build_url_index(self):
+        """ Builds and caches an in-memory index of the URLs stored in the database """
+
+        # Get URL column
+        url = self.Item.url
+
+        # Check if URL index is a Bloom filter
+        if self.url_index == _c.BLOOM:
+
+            # Size the filter with room for the database to double in size
+            capacity = max(self.count() * 2, 100000)
+
+            # Initialize a Bloom filter
+            url_index = BloomFilter(capacity, error_rate=self.url_index_error_rate)
+
+        # Otherwise handle case of set
+        else:
+
+            # Initialize a set
+            url_index = URLSet()
+
+        # Stream stored URLs into the index
+        url_index.update(
+            row[0] for row in self.db_session.query(url).yield_per(10000) if row[0]
+        )
+
+        # Cache URL index
+        self._url_index = url_index
+
+        # Return URL index
+        return url_index
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ HAS URL                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def has_url(self, url):
+        """ Returns a boolean of whether an item with the given URL exists """
+
+        # Check URL in database if URL index is disabled
+        if not self.url_index:
+            return self.exists(url=url)
+
+        # Get cached or newly built URL index
+        # An empty index is falsy so it is checked against None to be built only once
+        url_index = (
+            self.build_url_index() if self._url_index is None else self._url_index
+        )
+
+        # Return False if URL is certainly not in the database
+        if url not in url_index:
+            return False
+
+        # Return True if index is exact otherwise confirm in database
+        return url_index.exact or self.exists(url=url)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ADD URL                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def add_url(self, url):
+        """ Adds the URL of a committed item to the URL index if it has been built """
+
+        # Check if URL index has been built
+        if self._url_index is not None:
+
+            # Add URL to URL index
+            self._url_index.add(url)
+
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │ ALL                                                                            │
     # └────────────────────────────────────────────────────────────────────────────────┘
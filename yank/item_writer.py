@@ -0,0 +1,444 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import queue
+import threading
+import time
+
+from collections import Counter
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ PROJECT IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import yank.constants as _c
+
+from yank.exceptions import SessionLimitReached
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ ITEM WRITER                                                                        │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class ItemWriter:
+    """
+    Writes yielded items to the database in bulk from a dedicated writer thread
+    Unless started, each item is written and committed as soon as it is added
+    Items only count toward session limits and URL indexes once committed
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(
+        self, db_session, db_lock, batch_size=100, interval=5, queue_size=1000
+    ):
+        """ Init Method """
+
+        # Set database session
+        self.db_session = db_session
+
+        # Set database lock
+        self.db_lock = db_lock
+
+        # Set number of buffered items that triggers a write
+        self.batch_size = batch_size
+
+        # Set seconds since the last write that trigger a write
+        self.interval = interval
+
+        # Initialize queue of items handed to the writer thread
+        # Adding to a full queue blocks so that fetching cannot outrun writing
+        self.queue = queue.Queue(maxsize=queue_size)
+
+        # Initialize writer thread
+        self.thread = None
+
+        # Initialize buffered rows by interface
+        # These are only touched by the writer thread while it is running
+        self.rows = {}
+
+        # Initialize number of buffered rows
+        self.count = 0
+
+        # Initialize last written timestamp
+        self.written_at = time.monotonic()
+
+        # Initialize number of rows added but not yet written by interface
+        self.pending = Counter()
+
+        # Initialize URLs of rows added but not yet written by interface
+        self.urls = {}
+
+        # Initialize error raised by the writer thread
+        self.error = None
+
+        # Initialize lock
+        self.lock = threading.Lock()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ IS RUNNING                                                                     │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @property
+    def is_running(self):
+        """ Returns a boolean of whether the writer thread is running """
+
+        # Return True if writer thread is set
+        return self.thread is not None
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ START                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def start(self):
+        """ Starts the writer thread that writes added items in the background """
+
+        # Return if writer thread is already running
+        if self.is_running:
+            return
+
+        # Initialize writer thread
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+        # Start writer thread
+        self.thread.start()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ STOP                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def stop(self):
+        """ Writes every queued item and stops the writer thread """
+
+        # Return if writer thread is not running
+        if not self.is_running:
+            return
+
+        # Tell writer thread to write what is left and exit
+        self.queue.put(None)
+
+        # Wait for writer thread to exit
+        self.thread.join()
+
+        # Clear writer thread
+        self.thread = None
+
+        # Raise any error of the writer thread
+        self.raise_error()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ADD                                                                            │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def add(self, interface, row, session_limit=None):
+        """ Hands a row of an interface to the writer thread or writes it at once """
+
+        # Raise any error of the writer thread so that a failing run stops early
+        self.raise_error()
+
+        # Acquire lock
+        with self.lock:
+
+            # Check if committed and pending rows have reached session limit
+            if session_limit and self.get_session_count(interface) >= session_limit:
+
+                # Raise SessionLimitReached
+                raise SessionLimitReached
+
+            # Record row and its URL until it is written
+            self.pending[interface] += 1
+            self.urls.setdefault(interface, Counter())[row.get("url")] += 1
+
+        # Check if writer thread is running
+        if self.is_running:
+
+            # Queue row, waiting for room if the queue is full
+            self.queue.put((interface, row))
+
+        # Otherwise write row at once
+        else:
+
+            # Buffer and write row
+            self.buffer(interface, row)
+            self.write()
+
+            # Raise any error of the write
+            self.raise_error()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET SESSION COUNT                                                              │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_session_count(self, interface):
+        """ Returns the session count of an interface including its pending rows """
+
+        # Return committed and pending rows
+        return interface.session_count + self.pending[interface]
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ HAS URL                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def has_url(self, interface, url):
+        """ Returns a boolean of whether an unwritten row of an interface has a URL """
+
+        # Acquire lock
+        with self.lock:
+
+            # Return True if URL is queued or buffered
+            return url in self.urls.get(interface, ())
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ FLUSH                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def flush(self):
+        """ Returns once every row added so far has been written """
+
+        # Check if writer thread is not running
+        if not self.is_running:
+
+            # Write buffered rows
+            self.write()
+
+            # Raise any error of the write
+            return self.raise_error()
+
+        # Initialize written event
+        written = threading.Event()
+
+        # Queue written event behind the rows added so far
+        self.queue.put(written)
+
+        # Wait for writer thread to reach and set written event
+        written.wait()
+
+        # Raise any error of the writer thread
+        self.raise_error()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RUN                                                                            │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def run(self):
+        """ Drains the queue and writes rows in batches until told to stop """
+
+        # Iterate indefinitely
+        while True:
+
+            # Initialize entry as none has been taken from the queue yet
+            entry = False
+
+            # Initialize try-except block
+            try:
+
+                # Get seconds until the next write is due
+                timeout = max(0, self.interval - (time.monotonic() - self.written_at))
+
+                # Initialize try-except block
+                try:
+
+                    # Get next queue entry
+                    entry = self.queue.get(timeout=timeout)
+
+                # Except no entry before the next write is due
+                except queue.Empty:
+
+                    # Write buffered rows
+                    self.write()
+
+                    # Continue
+                    continue
+
+                # Check if entry is a row
+                if isinstance(entry, tuple):
+
+                    # Buffer row
+                    self.buffer(*entry)
+
+                    # Write buffered rows if batch is full
+                    self.count >= self.batch_size and self.write()
+
+                    # Continue
+                    continue
+
+                # Write buffered rows
+                self.write()
+
+            # Except any exception, which would otherwise end the thread silently
+            except Exception as e:
+
+                # Keep the first error to be raised with the next add, flush or stop
+                self.error = self.error or e
+
+                # Continue unless the entry is a stop sentinel or written event
+                # These are still handled or flush and stop would wait forever
+                if entry is False or isinstance(entry, tuple):
+                    continue
+
+            # Break if entry is the stop sentinel
+            if entry is None:
+                break
+
+            # Otherwise set written event
+            entry.set()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ BUFFER                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def buffer(self, interface, row):
+        """ Buffers a row of an interface to be written with the next batch """
+
+        # Buffer row
+        self.rows.setdefault(interface, []).append(row)
+
+        # Increment number of buffered rows
+        self.count += 1
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ WRITE                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def write(self):
+        """ Writes buffered rows in bulk and counts and indexes those committed """
+
+        # Set last written timestamp
+        self.written_at = time.monotonic()
+
+        # Return if there are no buffered rows
+        if not self.count:
+            return
+
+        # Take buffered rows
+        rows, self.rows, self.count = self.rows, {}, 0
+
+        # Iterate over buffered rows by interface
+        for interface, interface_rows in rows.items():
+
+            # Initialize committed rows
+            written = []
+
+            # Initialize try-except block
+            try:
+
+                # Insert rows and get those committed
+                written = self.insert(interface, interface_rows)
+
+                # Acquire database lock
+                with self.db_lock:
+
+                    # Iterate over committed rows
+                    for row in written:
+
+                        # Add URL to interface URL index
+                        interface.add_url(row.get("url"))
+
+            # Except any exception so that the rows of other interfaces are written
+            except Exception as e:
+
+                # Keep the first error to be raised with the next added row
+                self.error = self.error or e
+
+            # Forget pending rows even if indexing them failed
+            finally:
+
+                # Acquire lock
+                with self.lock:
+
+                    # Increment interface session count by committed rows
+                    interface.session_count += len(written)
+
+                    # Forget pending rows and their URLs, committed or not
+                    self.pending[interface] -= len(interface_rows)
+                    self.urls[interface] -= Counter(
+                        r.get("url") for r in interface_rows
+                    )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INSERT                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def insert(self, interface, rows):
+        """ Inserts rows of an interface and returns the rows that were committed """
+
+        # Get fields of interface
+        fields = [f for f in interface.field_map if f != _c.ID]
+
+        # Bind every field of every row as the statement is shared
+        params = [{f: row.get(f) for f in fields} for row in rows]
+
+        # Acquire database lock
+        with self.db_lock:
+
+            # Initialize try-except block
+            try:
+
+                # Insert rows in bulk in a single statement
+                result = self.db_session.execute(interface.insert_statement(), params)
+
+                # Check if every row was inserted
+                # Rows skipped by an ignore conflict policy are missing from the count
+                if result.rowcount in (-1, len(rows)):
+
+                    # Commit rows and return them
+                    self.db_session.commit()
+                    return rows
+
+                # Roll back so that the inserted rows can be told from skipped ones
+                self.db_session.rollback()
+
+            # Except any exception
+            except Exception:
+
+                # Roll back so that the session remains usable
+                self.db_session.rollback()
+
+            # Initialize committed rows
+            written = []
+
+            # Fall back to one row at a time so that a bad row only loses itself
+            # This also tells the rows inserted apart from those skipped on conflict
+            for row, row_params in zip(rows, params):
+
+                # Initialize try-except block
+                try:
+
+                    # Insert and commit row
+                    result = self.db_session.execute(
+                        interface.insert_statement(), row_params
+                    )
+                    self.db_session.commit()
+
+                    # Add row to committed rows unless it was skipped
+                    result.rowcount and written.append(row)
+
+                # Except any exception
+                except Exception as e:
+
+                    # Roll back so that the session remains usable
+                    self.db_session.rollback()
+
+                    # Keep the first error to be raised with the next added row
+                    self.error = self.error or e
+
+            # Return committed rows
+            return written
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RAISE ERROR                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def raise_error(self):
+        """ Raises and clears the error of a failed write if there is one """
+
+        # Get and clear error
+        error, self.error = self.error, None
+
+        # Raise error if there is one
+        if error is not None:
+            raise error
@@ -23,7 +23,7 @@ class Request:
     # │ INIT METHOD                                                                    │
     # └────────────────────────────────────────────────────────────────────────────────┘
 
-    def __init__(self, url, driver=None):
+    def __init__(self, url, driver=None, snapshot=None):
         """ Init Method """
 
         # Set URL
@@ -32,6 +32,10 @@ class Request:
         # Set driver
         self.driver = driver
 
+        # Set snapshot of the driver's page at the time of the request
+        # The driver itself may have since moved on to another page
+        self.snapshot = snapshot
+
         # Initialize headers to None
         self.headers = None
 
@@ -0,0 +1,201 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import requests
+import threading
+import time
+
+from http.cookiejar import DefaultCookiePolicy
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ REQUESTS IMPORTS                                                                   │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from requests.adapters import HTTPAdapter
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ POOLED ADAPTER                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class PooledAdapter(HTTPAdapter):
+    """ An HTTP adapter that keeps count of how often pooled connections are reused """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, *args, **kwargs):
+        """ Init Method """
+
+        # Initialize reuses of connection pools that have since been disposed
+        self.disposed_reuses = 0
+
+        # Initialize lock
+        self.lock = threading.Lock()
+
+        # Call parent init method
+        super().__init__(*args, **kwargs)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT POOL MANAGER                                                              │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def init_poolmanager(self, *args, **kwargs):
+        """ Initializes a pool manager that records reuses of disposed pools """
+
+        # Call parent init pool manager method
+        super().init_poolmanager(*args, **kwargs)
+
+        # Get pools container
+        pools = self.poolmanager.pools
+
+        # Get original dispose function
+        dispose = pools.dispose_func
+
+        # Define a dispose function that records reuses before closing a pool
+        def dispose_func(pool):
+
+            # Acquire lock
+            with self.lock:
+
+                # Add pool reuses to disposed reuses
+                self.disposed_reuses += self.get_pool_reuses(pool)
+
+            # Check if there is an original dispose function
+            if dispose:
+
+                # Dispose of pool
+                dispose(pool)
+
+            # Otherwise close pool
+            else:
+                pool.close()
+
+        # Set dispose function
+        pools.dispose_func = dispose_func
+
+        # NOTE: Pools are disposed when evicted past pool_connections or cleared
+
+        # NOTE: urllib3 2 leaves the dispose function unset
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET POOL REUSES                                                                │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @staticmethod
+    def get_pool_reuses(pool):
+        """ Returns the number of requests a pool served without a new connection """
+
+        # Return requests minus the connections that were opened for them
+        return max(pool.num_requests - pool.num_connections, 0)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CONNECTION REUSES                                                              │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @property
+    def connection_reuses(self):
+        """ Returns the number of requests sent over an already open connection """
+
+        # Get pools container
+        pools = self.poolmanager.pools
+
+        # Get live pools
+        live_pools = [pools.get(key) for key in pools.keys()]
+
+        # Return reuses of live and disposed pools
+        return self.disposed_reuses + sum(
+            [self.get_pool_reuses(pool) for pool in live_pools if pool is not None]
+        )
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ REQUESTER                                                                          │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class Requester(requests.Session):
+    """ A requests session with a configurable pool of keep-alive connections """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(
+        self,
+        transient=False,
+        pool_connections=10,
+        pool_maxsize=10,
+        pool_idle_timeout=None,
+    ):
+        """ Init Method """
+
+        # Call parent init method
+        super().__init__()
+
+        # Check if transient
+        if transient:
+
+            # Reject every cookie so that no state is shared between requests
+            # Connections are still reused, which is what the pool is for
+            self.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        # Set transient boolean
+        self.transient = transient
+
+        # Set pool idle timeout in seconds
+        self.pool_idle_timeout = pool_idle_timeout
+
+        # Initialize last used timestamp
+        self.used_at = time.monotonic()
+
+        # Initialize adapter
+        self.adapter = PooledAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+
+        # Mount adapter on HTTP and HTTPS
+        self.mount("http://", self.adapter)
+        self.mount("https://", self.adapter)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CONNECTION REUSES                                                              │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @property
+    def connection_reuses(self):
+        """ Returns the number of requests sent over an already open connection """
+
+        # Return connection reuses of adapter
+        return self.adapter.connection_reuses
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ REQUEST                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def request(self, *args, **kwargs):
+        """ Closes idle pooled connections before making an HTTP request """
+
+        # Get pool idle timeout
+        pool_idle_timeout = self.pool_idle_timeout
+
+        # Check if pool has been idle for longer than the timeout
+        if pool_idle_timeout and time.monotonic() - self.used_at > pool_idle_timeout:
+
+            # Close pooled connections as the server has likely dropped them by now
+            self.adapter.poolmanager.clear()
+
+        # Initialize try-finally block
+        try:
+
+            # Make HTTP request
+            return super().request(*args, **kwargs)
+
+        # Update last used timestamp
+        finally:
+
+            # Set last used timestamp
+            self.used_at = time.monotonic()
@@ -2,6 +2,8 @@
 # │ GENERAL IMPORTS                                                                    │
 # └────────────────────────────────────────────────────────────────────────────────────┘
 
+import json
+
 from json.decoder import JSONDecodeError
 
 # ┌────────────────────────────────────────────────────────────────────────────────────┐
@@ -10,6 +12,12 @@ from json.decoder import JSONDecodeError
 
 from bs4 import BeautifulSoup
 
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ SELENIUM IMPORTS                                                                   │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from seleniumwire.utils import decode
+
 
 # ┌────────────────────────────────────────────────────────────────────────────────────┐
 # │ RESPONSE                                                                           │
@@ -32,8 +40,13 @@ class Response:
         # Set response
         self._response = response
 
+        # Initialize cached HTML
+        self._html = None
+
         # Initialize cached JSON
+        # A loaded boolean also caches bodies that are not JSON
         self._json = None
+        self._json_loaded = False
 
         # Initialize cached soup
         self._soup = None
@@ -57,12 +70,75 @@ class Response:
     def html(self):
         """ Returns the HTML source of the response depending driver and response """
 
-        # Return driver source if driver is defined otherwise response content
-        return (
-            self.request.driver.page_source
-            if self.request.driver
-            else self._response.content
-        )
+        # Check if HTML is cached
+        if self._html is not None:
+
+            # Return cached HTML
+            return self._html
+
+        # Get snapshot
+        snapshot = self.request.snapshot
+
+        # Get snapshot source if driver is defined otherwise response content
+        _html = snapshot.page_source if snapshot else self._response.content
+
+        # Cache HTML
+        self._html = _html
+
+        # Return HTML
+        return _html
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CONTENT                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @property
+    def content(self):
+        """ Returns the body bytes of the response """
+
+        # Get response
+        response = self._response
+
+        # Return decoded body if response was captured by Selenium Wire
+        if hasattr(response, "body"):
+            return decode(
+                response.body, response.headers.get("Content-Encoding", "identity")
+            )
+
+        # Return response content
+        return response.content
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ URL                                                                            │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @property
+    def url(self):
+        """ Returns the final URL of the page after any redirects """
+
+        # Get snapshot
+        snapshot = self.request.snapshot
+
+        # Return snapshot URL if driver is defined otherwise response URL
+        return snapshot.url if snapshot else getattr(self._response, "url", None)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ COOKIES                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @property
+    def cookies(self):
+        """ Returns a dict of the cookies set by the page """
+
+        # Get snapshot
+        snapshot = self.request.snapshot
+
+        # Return snapshot cookies if driver is defined
+        if snapshot:
+            return snapshot.cookies
+
+        # Return response cookies
+        return dict(getattr(self._response, "cookies", None) or {})
 
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │ JSON                                                                           │
@@ -73,26 +149,29 @@ class Response:
         """ Returns a JSON dict of the response object """
 
         # Check if JSON is cached
-        if self._json is not None:
+        if self._json_loaded:
 
             # Return cached JSON
             return self._json
 
+        # Initialize try-except block
         try:
 
             # Get JSON
-            _json = self._response.json()
+            _json = json.loads(self.content)
 
-            # Cache JSON
-            self._json = _json
+        # Except bodies that are not JSON
+        except (JSONDecodeError, UnicodeDecodeError):
 
-            # Return JSON data
-            return _json
+            # Set JSON to None
+            _json = None
 
-        except (AttributeError, JSONDecodeError):
+        # Cache JSON
+        self._json = _json
+        self._json_loaded = True
 
-            # Return None
-            return None
+        # Return JSON data
+        return _json
 
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │ SOUP                                                                           │
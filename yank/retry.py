@@ -0,0 +1,318 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import random
+import threading
+import time
+
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ PROJECT IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from yank.exceptions import CircuitOpen
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ RETRY POLICY                                                                       │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class RetryPolicy:
+    """ Decides which failed requests are retried and how long to wait in between """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(
+        self,
+        attempts=3,
+        statuses=(),
+        exceptions=(),
+        backoff_ms=500,
+        backoff_max_ms=30000,
+    ):
+        """ Init Method """
+
+        # Set max number of retries after the first attempt
+        self.attempts = attempts or 0
+
+        # Set status codes that are retried
+        self.statuses = set(statuses or ())
+
+        # Set exception classes that are retried
+        self.exceptions = tuple(exceptions or ())
+
+        # Set base and max backoff in seconds
+        self.backoff = (backoff_ms or 0) / 1000
+        self.backoff_max = (backoff_max_ms or 0) / 1000
+
+        # Initialize retries and failures
+        self.retries = 0
+        self.failures = 0
+
+        # Initialize lock
+        self.lock = threading.Lock()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ IS RETRYABLE                                                                   │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def is_retryable(self, response):
+        """ Returns a boolean of whether a response has a retried status code """
+
+        # Return True if status code is retried
+        return response.status_code in self.statuses
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET RETRY AFTER                                                                │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @staticmethod
+    def get_retry_after(response):
+        """ Returns the seconds requested by a Retry-After header or None """
+
+        # Get Retry-After header
+        retry_after = response.headers.get("Retry-After") if response else None
+
+        # Return None if Retry-After is null
+        if not retry_after:
+            return None
+
+        # Return seconds if Retry-After is a number of seconds
+        if retry_after.strip().isdigit():
+            return int(retry_after)
+
+        # Initialize try-except block
+        try:
+
+            # Return seconds until Retry-After if it is an HTTP date
+            return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0)
+
+        # Except invalid dates
+        except (TypeError, ValueError):
+
+            # Return None
+            return None
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET DELAY                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_delay(self, attempt, response=None):
+        """ Returns the seconds to wait before retrying a failed attempt """
+
+        # Get seconds requested by the server
+        retry_after = self.get_retry_after(response)
+
+        # Return requested seconds up to the max backoff
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+
+        # Return an exponential backoff with full jitter
+        # Jitter keeps workers that failed together from retrying together
+        return random.uniform(0, min(self.backoff * 2 ** attempt, self.backoff_max))
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ COUNT                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def count(self, failure=False):
+        """ Increments the retry or failure counter """
+
+        # Acquire lock
+        with self.lock:
+
+            # Check if failure
+            if failure:
+
+                # Increment failures
+                self.failures += 1
+
+            # Otherwise handle retry
+            else:
+
+                # Increment retries
+                self.retries += 1
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ CIRCUIT BREAKER                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class CircuitBreaker:
+    """ Stops requests to a host after repeated failures until a cooldown has passed """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CONSTANTS                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # States
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, threshold=5, cooldown=30):
+        """ Init Method """
+
+        # Set number of consecutive failures that open the circuit of a host
+        self.threshold = threshold
+
+        # Set seconds an open circuit rejects requests
+        self.cooldown = cooldown
+
+        # Initialize consecutive failures by host
+        self.failures = {}
+
+        # Initialize opened timestamps by host
+        self.opened_at = {}
+
+        # Initialize hosts with a trial request in flight
+        self.trials = set()
+
+        # Initialize rejections
+        self.rejections = 0
+
+        # Initialize lock
+        self.lock = threading.Lock()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET STATE                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_state(self, host):
+        """ Returns the state of the circuit of a host """
+
+        # Get opened timestamp
+        opened_at = self.opened_at.get(host)
+
+        # Return closed if circuit has not been opened
+        if opened_at is None:
+            return self.CLOSED
+
+        # Return open if cooldown has not passed
+        if time.monotonic() - opened_at < self.cooldown:
+            return self.OPEN
+
+        # Return half-open as a trial request may be sent
+        return self.HALF_OPEN
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ STATES                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @property
+    def states(self):
+        """ Returns a dict of hosts and their circuit states """
+
+        # Acquire lock
+        with self.lock:
+
+            # Return states of hosts that have failed
+            return {host: self.get_state(host) for host in self.failures}
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CHECK                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def check(self, url):
+        """ Raises CircuitOpen if a request to a URL's host should not be sent """
+
+        # Return if circuit breaker is disabled
+        if not self.threshold:
+            return
+
+        # Get host
+        host = urlparse(url).netloc
+
+        # Acquire lock
+        with self.lock:
+
+            # Get state
+            state = self.get_state(host)
+
+            # Return if circuit is closed
+            if state == self.CLOSED:
+                return
+
+            # Check if circuit is half-open and no trial request is in flight
+            if state == self.HALF_OPEN and host not in self.trials:
+
+                # Let a single trial request through
+                self.trials.add(host)
+
+                # Return
+                return
+
+            # Increment rejections
+            self.rejections += 1
+
+        # Raise CircuitOpen
+        raise CircuitOpen(f"Circuit of {host} is {state}")
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RELEASE                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def release(self, url):
+        """ Clears the trial request of a URL's host without recording an outcome """
+
+        # Return if circuit breaker is disabled
+        if not self.threshold:
+            return
+
+        # Acquire lock
+        with self.lock:
+
+            # Clear trial request so that the next request may be a trial
+            self.trials.discard(urlparse(url).netloc)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RECORD                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def record(self, url, success):
+        """ Records the outcome of a request to a URL's host """
+
+        # Return if circuit breaker is disabled
+        if not self.threshold:
+            return
+
+        # Get host
+        host = urlparse(url).netloc
+
+        # Acquire lock
+        with self.lock:
+
+            # Clear trial request
+            self.trials.discard(host)
+
+            # Check if request succeeded
+            if success:
+
+                # Close circuit
+                self.opened_at.pop(host, None)
+
+                # Reset consecutive failures
+                self.failures[host] = 0
+
+                # Return
+                return
+
+            # Increment consecutive failures
+            self.failures[host] = self.failures.get(host, 0) + 1
+
+            # Check if threshold was reached or a trial request failed
+            if self.failures[host] >= self.threshold or host in self.opened_at:
+
+                # Open circuit
+                self.opened_at[host] = time.monotonic()
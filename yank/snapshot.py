@@ -0,0 +1,60 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import zlib
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ SNAPSHOT                                                                           │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class Snapshot:
+    """
+    An immutable copy of a driver's rendered page taken once at fetch time
+    It stays correct after the driver has been returned to its pool and navigated away
+    """
+
+    # Define slots so that snapshots stay small and attributes cannot be added
+    __slots__ = ("_source", "url", "cookies")
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, page_source, url=None, cookies=None):
+        """ Init Method """
+
+        # Set compressed page source
+        # Rendered pages are mostly markup and compress several times over
+        object.__setattr__(self, "_source", zlib.compress(page_source.encode()))
+
+        # Set final URL of the page, which differs from the target URL after redirects
+        object.__setattr__(self, "url", url)
+
+        # Set cookies of the page by name
+        object.__setattr__(
+            self, "cookies", {c["name"]: c["value"] for c in cookies or []}
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SETATTR                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __setattr__(self, name, value):
+        """ Prevents a snapshot from being changed after it is taken """
+
+        # Raise AttributeError
+        raise AttributeError(f"Snapshot attribute '{name}' cannot be set")
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ PAGE SOURCE                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @property
+    def page_source(self):
+        """ Returns the decompressed page source """
+
+        # Return page source
+        return zlib.decompress(self._source).decode()
@@ -2,17 +2,30 @@
 # │ GENERAL IMPORTS                                                                    │
 # └────────────────────────────────────────────────────────────────────────────────────┘
 
+import asyncio
+import functools
+import itertools
+import time
 import tldextract
 
 from urllib.parse import urlparse
 
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ REQUESTS IMPORTS                                                                   │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from requests import RequestException
+
 # ┌────────────────────────────────────────────────────────────────────────────────────┐
 # │ PROJECT IMPORTS                                                                    │
 # └────────────────────────────────────────────────────────────────────────────────────┘
 
 import yank.constants as _c
 
+from yank.exceptions import CircuitOpen
 from yank.request import Request
+from yank.snapshot import Snapshot
+from yank.wait import WaitCondition
 
 
 # ┌────────────────────────────────────────────────────────────────────────────────────┐
@@ -33,6 +46,9 @@ class Target:
     # Initialize cached driver
     _driver = None
 
+    # Define number of bytes read at a time from a streamed response
+    STREAM_CHUNK_SIZE = 65536
+
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │ INIT METHOD                                                                    │
     # └────────────────────────────────────────────────────────────────────────────────┘
@@ -67,6 +83,18 @@ class Target:
         # Initialize requests
         self.requests = []
 
+        # Initialize truncated boolean
+        # A truncated response stopped reading before the end of its body
+        self.truncated = False
+
+        # Initialize aborted boolean
+        # An aborted response was not read as its content type is not allowed
+        self.aborted = False
+
+        # Initialize handoff request
+        # This is the request that carried the target's data when a handoff is used
+        self.handoff_request = None
+
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │ DRIVER                                                                         │
     # └────────────────────────────────────────────────────────────────────────────────┘
@@ -109,7 +137,11 @@ class Target:
         """ Returns the request that shares the target's URL """
 
         # Get target requests
-        target_requests = [r for r in self.requests if r.url == self.url]
+        # Fall back to the first request, which is the navigation of a driver whose
+        # URL may have been normalized or redirected
+        target_requests = [r for r in self.requests if r.url == self.url] or (
+            self.requests[:1]
+        )
 
         # Return None if target requests is null
         if not target_requests:
@@ -176,11 +208,41 @@ class Target:
         # Return soup
         return self.response.soup
 
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SHOULD USE DRIVER                                                              │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def should_use_driver(self, driver_callback=None, solve_captcha_callback=None):
+        """ Returns a boolean of whether the target must be fetched with a driver """
+
+        # Get yanker
+        yanker = self.yanker
+
+        # Determine if should get auto headers
+        should_get_auto_headers = yanker.auto_headers and yanker._auto_headers is None
+
+        # Return boolean of whether driver is available and required
+        return bool(
+            self.browser
+            and (driver_callback or solve_captcha_callback or should_get_auto_headers)
+        )
+
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │ GET                                                                            │
     # └────────────────────────────────────────────────────────────────────────────────┘
 
-    def get(self, driver_callback=None, solve_captcha_callback=None):
+    def get(
+        self,
+        driver_callback=None,
+        solve_captcha_callback=None,
+        max_bytes=None,
+        content_types=None,
+        stream_callback=None,
+        block_profile=None,
+        capture_scope=None,
+        handoff=None,
+        wait_for=None,
+    ):
         """ Performs an HTTP GET request to the page using its yanker's requester """
 
         # Get URL
@@ -192,130 +254,216 @@ class Target:
         # Determine if should get auto headers
         should_get_auto_headers = yanker.auto_headers and yanker._auto_headers is None
 
+        # Get archive
+        archive = yanker.archive
+
+        # Check if archive is being replayed
+        if archive and archive.is_replay:
+
+            # Set response to recorded response and return
+            return self.replay(archive, handoff=handoff)
+
         # ┌────────────────────────────────────────────────────────────────────────────┐
         # │ DRIVER                                                                     │
         # └────────────────────────────────────────────────────────────────────────────┘
 
         # Determine if should use driver
-        should_use_driver = self.browser and (
-            driver_callback or solve_captcha_callback or should_get_auto_headers
+        should_use_driver = self.should_use_driver(
+            driver_callback, solve_captcha_callback
         )
 
+        # Check if the data of the target can be fetched from a discovered endpoint
+        # A captcha is always solved in the driver
+        if (
+            should_use_driver
+            and handoff
+            and not solve_captcha_callback
+            and self.hand_off(handoff, max_bytes=max_bytes)
+        ):
+
+            # Return as the target has been fetched without loading its page
+            return
+
         # Check if driver is not null
         if should_use_driver:
 
-            # Get driver
-            driver = self.driver
+            # Determine if page loading is stopped by a wait condition
+            # Such pages are loaded by quick drivers that do not wait for the load event
+            is_quick = wait_for or getattr(driver_callback, "has_stop_when", False)
+
+            # Check out a driver of the browser's pool
+            # A driver can only navigate to one page at a time
+            # It is not kept on the target or its requests, as once checked back in it
+            # may load another worker's page or be quit when recycled
+            with self.browser.checkout(quick=is_quick) as driver:
+
+                # Block resources that the method does not need
+                self.browser.block(driver, block_profile)
 
-            # TODO: Copy cookies over from session
+                # Clear and scope the requests captured by the driver
+                self.browser.scope(driver, url, capture_scope)
 
-            # Check if driver callback is not null
-            if driver_callback:
+                # TODO: Copy cookies over from session
 
-                # Check if driver mode is not none and callback has stop when decorator
-                if getattr(driver_callback, "has_stop_when", False):
+                # Check if page loading may be stopped by a wait condition
+                if is_quick:
 
-                    # Get quick driver
-                    driver_quick = self.browser.driver_quick
+                    # Mark the page the driver is leaving
+                    # A quick driver returns from get before the new page replaces it
+                    WaitCondition.mark(driver)
 
-                    # Copy cookies from driver to quick driver
+                # Get URL with driver
+                driver.get(url)
 
-                    # Get URL with quick driver
-                    driver_quick.get(url)
+                # Check if wait condition is not null
+                if wait_for:
 
-                    # Copy cookies from quick driver back to driver
+                    # Wait for condition and stop further loading
+                    WaitCondition.wait(driver, wait_for, wait_for.timeout)
 
-                    # Set local driver to quick driver
-                    driver = driver_quick
+                # Check if driver callback is not null
+                if driver_callback:
 
-                # Otherwise get URL as usual
-                else:
+                    # Execute driver callback
+                    driver_callback(driver)
 
-                    # Get URL with driver
-                    driver.get(url)
+                # Check if solve captcha callback is not null
+                if solve_captcha_callback:
 
-                # Execute driver callback
-                driver_callback(driver)
+                    # TODO: HOW TO MARK AS SOLVED?
 
-            # Otherwise handle case of no driver callback
-            else:
+                    # Pass driver into solve captcha callback
+                    solve_captcha_callback(driver)
 
-                # Get URL with driver
-                driver.get(url)
+                # Get page source before the driver is returned to the pool
+                page_source = driver.page_source
 
-            # Check if solve captcha callback is not null
-            if solve_captcha_callback:
+                # Take a snapshot of the page shared by the target's requests
+                snapshot = Snapshot(
+                    page_source,
+                    url=driver.current_url,
+                    cookies=driver.get_cookies() if yanker.snapshot_cookies else None,
+                )
 
-                # TODO: HOW TO MARK AS SOLVED?
+                # Iterate over requests captured since the driver was scoped
+                for request in driver.requests:
 
-                # Pass driver into solve captcha callback
-                solve_captcha_callback(driver)
+                    # Get request URL
+                    request_url = request.url
 
-            # Iterate over driver requests
-            for request in driver.requests:
+                    # Get response
+                    response = request.response
 
-                # Get response
-                response = request.response
+                    # Check if request is outside of the capture scope
+                    # The request of the target URL itself is always kept
+                    if (
+                        capture_scope
+                        and request_url != url
+                        and not capture_scope.is_captured(request_url, response)
+                    ):
+                        continue
 
-                # Check if response is not None
-                if response is not None:
+                    # Check if response is not None
+                    if response is not None:
 
-                    # Set request of response
-                    response.request = request
+                        # Set request of response
+                        response.request = request
 
-                # Initialize request object
-                request = Request(url, driver=driver)
+                    # Initialize request object
+                    request = Request(request_url, snapshot=snapshot)
 
-                # Set request response
-                request.set_response(response)
+                    # Set request response
+                    request.set_response(response)
 
-                # Append request to requests
-                self.requests.append(request)
+                    # Append request to requests
+                    self.requests.append(request)
 
-                # ┌────────────────────────────────────────────────────────────────────┐
-                # │ AUTO HEADERS                                                       │
-                # └────────────────────────────────────────────────────────────────────┘
+                    # ┌────────────────────────────────────────────────────────────────┐
+                    # │ AUTO HEADERS                                                   │
+                    # └────────────────────────────────────────────────────────────────┘
 
-                # Check if should get auto headers
-                if should_get_auto_headers and yanker._auto_headers is None:
+                    # Check if should get auto headers
+                    if should_get_auto_headers and yanker._auto_headers is None:
 
-                    # Extract registered domain from request URL
-                    domain = tldextract.extract(request.url).registered_domain
+                        # Extract registered domain from request URL
+                        domain = tldextract.extract(request.url).registered_domain
 
-                    # Check if registered domain is in the target URL
-                    if domain in url:
+                        # Check if registered domain is in the target URL
+                        if domain in url:
 
-                        # Get auto headers
-                        _auto_headers = request.headers
+                            # Get auto headers
+                            _auto_headers = request.headers
 
-                        # Update auto headers by default headers
-                        _auto_headers.update(yanker.default_headers)
+                            # Update auto headers by default headers
+                            _auto_headers.update(yanker.default_headers)
 
-                        # Set auto headers cache to request headers
-                        yanker._auto_headers = request.headers
+                            # Set auto headers cache to request headers
+                            yanker._auto_headers = request.headers
 
-                        # Set default headers
-                        yanker.default_headers = _auto_headers
+                            # Set default headers
+                            yanker.default_headers = _auto_headers
 
-                        # Break here
-                        break
+                            # Break here
+                            break
 
-            # Check if mode is session
-            if self.yanker.mode == _c.SESSION:
+                # Check if handoff is not null
+                if handoff:
 
-                # Get driver user agent
-                driver_user_agent = driver.execute_script("return navigator.userAgent;")
+                    # Record the captured request that carried the target's data
+                    # Driver cookies are kept so that the endpoint can be called with
+                    # them even by a transient requester that rejects cookies
+                    self.handoff_request = handoff.discover(
+                        url, self.requests, cookies=driver.get_cookies()
+                    )
 
-                # Update session user agent
-                self.requester.headers.update({"User-Agent": driver_user_agent})
+                # Check if archive is being recorded
+                if archive:
 
-                # Get driver cookies
-                driver_cookies = driver.get_cookies()
+                    # Get response of target request
+                    response = self.request and self.request.response
 
-                # Update session cookies
-                self.requester.cookies.update(
-                    {c["name"]: c["value"] for c in driver_cookies}
-                )
+                    # Record final page source along with the captured requests
+                    # A replay restores both so that methods reading captured JSON work
+                    archive.record_page(
+                        url,
+                        page_source,
+                        response=response and response._response,
+                        final_url=snapshot.url,
+                        cookies=driver.get_cookies(),
+                        requests=self.requests,
+                    )
+
+                # Initialize driver user agent and cookies
+                driver_user_agent = driver_cookies = None
+
+                # Check if mode is session
+                if self.yanker.mode == _c.SESSION:
+
+                    # Get driver user agent
+                    driver_user_agent = driver.execute_script(
+                        "return navigator.userAgent;"
+                    )
+
+                    # Update session user agent
+                    self.requester.headers.update({"User-Agent": driver_user_agent})
+
+                    # Get driver cookies
+                    driver_cookies = driver.get_cookies()
+
+                    # Update session cookies
+                    self.requester.cookies.update(
+                        {c["name"]: c["value"] for c in driver_cookies}
+                    )
+
+                # Check if an identity was harvested and identity store is not null
+                if yanker.identity and (should_get_auto_headers or driver_user_agent):
+
+                    # Persist identity so that later runs can skip the browser
+                    yanker.identity.save(
+                        headers=yanker._auto_headers,
+                        user_agent=driver_user_agent,
+                        cookies=driver_cookies,
+                    )
 
         # ┌────────────────────────────────────────────────────────────────────────────┐
         # │ REQUESTER                                                                  │
@@ -341,12 +489,782 @@ class Target:
                 # Add default headers to request kwargs
                 request_kwargs[_c.HEADERS] = self.yanker.default_headers
 
-            # Make an HTTP request
-            response = self.requester.get(url, **request_kwargs)
+            # Get cache
+            cache = yanker.cache
+
+            # Get cache entry
+            entry = cache and cache.load(_c.GET, url)
+
+            # Check if cache entry is fresh
+            if entry and entry.is_fresh:
+
+                # Get cached response
+                response = self.set_cached(entry.response, content_types)
+
+            # Otherwise handle case of a missing or stale cache entry
+            else:
+
+                # Check if cache entry is stale
+                if entry:
+
+                    # Add validators so that an unchanged page returns a 304
+                    request_kwargs[_c.HEADERS] = {
+                        **(request_kwargs.get(_c.HEADERS) or {}),
+                        **entry.validators,
+                    }
+
+                # Make an HTTP request, retrying transient failures
+                fetched = self.retry(
+                    functools.partial(
+                        self.fetch,
+                        request_kwargs,
+                        max_bytes=max_bytes,
+                        content_types=content_types,
+                        stream_callback=stream_callback,
+                    )
+                )
+
+                # Store response in cache, reusing the cached body if unchanged
+                response = cache.save(_c.GET, url, fetched, entry) if cache else fetched
+
+                # Check if cache answered a 304 with the revalidated entry
+                if response is not fetched:
+
+                    # Reset read state to that of the cached response
+                    self.set_cached(response, content_types)
+
+            # Record response if archive is being recorded
+            archive and archive.record_response(
+                _c.GET, url, response, aborted=self.aborted, truncated=self.truncated
+            )
 
             # Set request response
             request.set_response(response)
 
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET ASYNC                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def get_async(
+        self,
+        driver_callback=None,
+        solve_captcha_callback=None,
+        max_bytes=None,
+        content_types=None,
+        stream_callback=None,
+        block_profile=None,
+        capture_scope=None,
+        handoff=None,
+        wait_for=None,
+    ):
+        """ Performs an awaitable HTTP GET request using the async requester """
+
+        # Get URL
+        url = self.url
+
+        # Get yanker
+        yanker = self.yanker
+
+        # Get async requester
+        requester_async = yanker.requester_async
+
+        # Get archive
+        archive = yanker.archive
+
+        # Check if archive is being replayed
+        if archive and archive.is_replay:
+
+            # Set response to recorded response and return
+            return self.replay(archive, handoff=handoff)
+
+        # Check if driver is required or there is no async requester
+        if requester_async is None or self.should_use_driver(
+            driver_callback, solve_captcha_callback
+        ):
+
+            # Get event loop
+            loop = asyncio.get_running_loop()
+
+            # Run the blocking get method in the event loop's thread pool
+            await loop.run_in_executor(
+                None,
+                functools.partial(
+                    self.get,
+                    driver_callback=driver_callback,
+                    solve_captcha_callback=solve_captcha_callback,
+                    max_bytes=max_bytes,
+                    content_types=content_types,
+                    stream_callback=stream_callback,
+                    block_profile=block_profile,
+                    capture_scope=capture_scope,
+                    handoff=handoff,
+                    wait_for=wait_for,
+                ),
+            )
+
+            # Return as the target has been fetched
+            return
+
+        # Initialize request object
+        request = Request(url)
+
+        # Append request to requests
+        self.requests.append(request)
+
+        # Get headers of yanker mode
+        # A session requester's headers include any user agent copied from the driver
+        headers = (
+            dict(self.requester.headers)
+            if yanker.mode == _c.SESSION
+            else yanker.default_headers
+        )
+
+        # Get cache
+        cache = yanker.cache
+
+        # Get cache entry
+        entry = cache and cache.load(_c.GET, url)
+
+        # Check if cache entry is fresh
+        if entry and entry.is_fresh:
+
+            # Get cached response
+            response = self.set_cached(entry.response, content_types)
+
+        # Otherwise handle case of a missing or stale cache entry
+        else:
+
+            # Check if cache entry is stale
+            if entry:
+
+                # Add validators so that an unchanged page returns a 304 without body
+                headers = {**(headers or {}), **entry.validators}
+
+            # Make an HTTP request without blocking the event loop
+            fetched = await self.retry_async(
+                functools.partial(
+                    self.fetch_async,
+                    headers,
+                    max_bytes=max_bytes,
+                    content_types=content_types,
+                    stream_callback=stream_callback,
+                )
+            )
+
+            # Store response in cache, reusing the cached body if unchanged
+            response = cache.save(_c.GET, url, fetched, entry) if cache else fetched
+
+            # Check if cache answered a 304 with the revalidated entry
+            if response is not fetched:
+
+                # Reset read state to that of the cached response
+                self.set_cached(response, content_types)
+
+        # Record response if archive is being recorded
+        archive and archive.record_response(
+            _c.GET, url, response, aborted=self.aborted, truncated=self.truncated
+        )
+
+        # Set request response
+        request.set_response(response)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ FETCH                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def fetch(
+        self,
+        request_kwargs,
+        max_bytes=None,
+        content_types=None,
+        stream_callback=None,
+        url=None,
+    ):
+        """ Makes a single HTTP request with the requester and returns its response """
+
+        # Get URL, which defaults to that of the target
+        url = url or self.url
+
+        # Return response read in full if there are no limits
+        if not (max_bytes or content_types or stream_callback):
+            return self.requester.get(url, **request_kwargs)
+
+        # Make an HTTP request without reading the body
+        response = self.requester.get(url, stream=True, **request_kwargs)
+
+        # Read the body in chunks until a limit is reached
+        response = self.read_stream(
+            response,
+            response.iter_content(self.STREAM_CHUNK_SIZE),
+            max_bytes=max_bytes,
+            content_types=content_types,
+            stream_callback=stream_callback,
+        )
+
+        # Close response to release its connection
+        response.close()
+
+        # Return response
+        return response
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ FETCH ASYNC                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def fetch_async(
+        self, headers, max_bytes=None, content_types=None, stream_callback=None
+    ):
+        """ Makes a single HTTP request with the async requester """
+
+        # Get URL
+        url = self.url
+
+        # Get async requester
+        requester_async = self.yanker.requester_async
+
+        # Return response read in full if there are no limits
+        if not (max_bytes or content_types or stream_callback):
+            return await requester_async.get(url, **{_c.HEADERS: headers})
+
+        # Open a streamed HTTP request without reading the body
+        async with requester_async.stream(
+            _c.GET.upper(), url, **{_c.HEADERS: headers}
+        ) as response:
+
+            # Read the body in chunks until a limit is reached and return response
+            return await self.read_stream_async(
+                response,
+                response.aiter_bytes(self.STREAM_CHUNK_SIZE),
+                max_bytes=max_bytes,
+                content_types=content_types,
+                stream_callback=stream_callback,
+            )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ATTEMPT                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def attempt(self, attempt, latency, response=None, exception=None, url=None):
+        """
+        Records the outcome of an attempt and returns the seconds to wait before the
+        next, or None if the outcome is final
+        """
+
+        # Get URL, which defaults to that of the target
+        url = url or self.url
+
+        # Record latency and status code with the throttle
+        self.yanker.throttle.record(
+            url, latency, response.status_code if response is not None else None
+        )
+
+        # Get retry policy
+        retry_policy = self.yanker.retry_policy
+
+        # Determine if attempt failed
+        failed = exception is not None or retry_policy.is_retryable(response)
+
+        # Record outcome with the host's circuit breaker
+        # A 429 means the host is alive but rate limiting, which the throttle handles
+        self.yanker.circuit_breaker.record(
+            url,
+            success=not failed
+            or (response is not None and response.status_code == 429),
+        )
+
+        # Return None if attempt succeeded
+        if not failed:
+            return None
+
+        # Check if there are no retries left
+        if attempt >= retry_policy.attempts:
+
+            # Count failure
+            retry_policy.count(failure=True)
+
+            # Return None
+            return None
+
+        # Count retry
+        retry_policy.count()
+
+        # Return seconds to wait before retrying
+        return retry_policy.get_delay(attempt, response)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RETRY                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def retry(self, fetch, url=None):
+        """ Calls a fetch function until it succeeds or its retries are exhausted """
+
+        # Get URL, which defaults to that of the target
+        url = url or self.url
+
+        # Get retry exceptions
+        retry_exceptions = self.yanker.retry_policy.exceptions
+
+        # Iterate over attempts
+        for attempt in itertools.count():
+
+            # Raise CircuitOpen if host is failing
+            self.yanker.circuit_breaker.check(url)
+
+            # Get start timestamp
+            started_at = time.monotonic()
+
+            # Initialize try-except block
+            try:
+
+                # Make an HTTP request
+                response = fetch()
+
+            # Except exceptions that are retried
+            except retry_exceptions as e:
+
+                # Get seconds to wait before retrying
+                delay = self.attempt(
+                    attempt, time.monotonic() - started_at, exception=e, url=url
+                )
+
+                # Re-raise the exception if there are no retries left
+                if delay is None:
+                    raise
+
+            # Except any other exception
+            except Exception:
+
+                # Clear a trial request, which would otherwise keep the circuit open
+                self.yanker.circuit_breaker.release(url)
+
+                # Re-raise the exception
+                raise
+
+            # Handle case of a response
+            else:
+
+                # Get seconds to wait before retrying
+                delay = self.attempt(
+                    attempt, time.monotonic() - started_at, response=response, url=url
+                )
+
+                # Return response if it succeeded or there are no retries left
+                if delay is None:
+                    return response
+
+            # Wait before retrying, keeping retries within the domain's throttle
+            time.sleep(max(delay, self.yanker.throttle.reserve(url)))
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RETRY ASYNC                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def retry_async(self, fetch, url=None):
+        """ Awaits a fetch function until it succeeds or its retries are exhausted """
+
+        # Get URL, which defaults to that of the target
+        url = url or self.url
+
+        # Get retry exceptions
+        retry_exceptions = self.yanker.retry_policy.exceptions
+
+        # Iterate over attempts
+        for attempt in itertools.count():
+
+            # Raise CircuitOpen if host is failing
+            self.yanker.circuit_breaker.check(url)
+
+            # Get start timestamp
+            started_at = time.monotonic()
+
+            # Initialize try-except block
+            try:
+
+                # Make an HTTP request
+                response = await fetch()
+
+            # Except exceptions that are retried
+            except retry_exceptions as e:
+
+                # Get seconds to wait before retrying
+                delay = self.attempt(
+                    attempt, time.monotonic() - started_at, exception=e, url=url
+                )
+
+                # Re-raise the exception if there are no retries left
+                if delay is None:
+                    raise
+
+            # Except any other exception
+            except Exception:
+
+                # Clear a trial request, which would otherwise keep the circuit open
+                self.yanker.circuit_breaker.release(url)
+
+                # Re-raise the exception
+                raise
+
+            # Handle case of a response
+            else:
+
+                # Get seconds to wait before retrying
+                delay = self.attempt(
+                    attempt, time.monotonic() - started_at, response=response, url=url
+                )
+
+                # Return response if it succeeded or there are no retries left
+                if delay is None:
+                    return response
+
+            # Wait before retrying, keeping retries within the domain's throttle
+            await asyncio.sleep(max(delay, self.yanker.throttle.reserve(url)))
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ IS CONTENT TYPE ALLOWED                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @staticmethod
+    def is_content_type_allowed(response, content_types=None):
+        """ Returns a boolean of whether a response's content type may be read """
+
+        # Return True if content types is null
+        if not content_types:
+            return True
+
+        # Get content type
+        content_type = response.headers.get("Content-Type", "").lower()
+
+        # Return True if content type starts with an allowed content type
+        return any(content_type.startswith(t.lower()) for t in content_types)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SET CACHED                                                                     │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def set_cached(self, response, content_types=None):
+        """ Resets the read state of the target to that of a cached response """
+
+        # Set truncated to False as only complete responses are cached
+        self.truncated = False
+
+        # Set aborted if the content type of the cached response is not allowed
+        self.aborted = not self.is_content_type_allowed(response, content_types)
+
+        # Return response
+        return response
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ READ CHUNK                                                                     │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def read_chunk(self, content, chunk, max_bytes=None, stream_callback=None):
+        """ Adds a chunk to the content read so far and returns True to stop reading """
+
+        # Add chunk to content
+        content += chunk
+
+        # Check if max bytes has been reached
+        if max_bytes and len(content) >= max_bytes:
+
+            # Discard bytes beyond max bytes
+            del content[max_bytes:]
+
+            # Set truncated to True
+            self.truncated = True
+
+        # Otherwise check if stream callback has what it needs
+        elif stream_callback and stream_callback(content):
+
+            # Set truncated to True
+            self.truncated = True
+
+        # Return truncated
+        return self.truncated
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SET CONTENT                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def set_content(self, response, content):
+        """ Sets the content read from a streamed response """
+
+        # Set content
+        response._content = bytes(content)
+
+        # Set truncated so that a partial body is never cached
+        response.truncated = self.truncated or self.aborted
+
+        # Return response
+        return response
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ READ STREAM                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def read_stream(
+        self, response, chunks, max_bytes=None, content_types=None, stream_callback=None
+    ):
+        """ Reads the chunks of a streamed response until a limit is reached """
+
+        # Reset truncated and aborted booleans of any earlier attempt
+        self.truncated = self.aborted = False
+
+        # Initialize content
+        content = bytearray()
+
+        # Check if content type is not allowed
+        # A 304 has no body or content type and is checked once revalidated
+        if response.status_code != 304 and not self.is_content_type_allowed(
+            response, content_types
+        ):
+
+            # Set aborted to True
+            self.aborted = True
+
+            # Return response without content
+            return self.set_content(response, content)
+
+        # Iterate over chunks
+        for chunk in chunks:
+
+            # Add chunk to content and break if should stop reading
+            if self.read_chunk(content, chunk, max_bytes, stream_callback):
+                break
+
+        # Return response
+        return self.set_content(response, content)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ READ STREAM ASYNC                                                              │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def read_stream_async(
+        self, response, chunks, max_bytes=None, content_types=None, stream_callback=None
+    ):
+        """ Reads the chunks of an async streamed response until a limit is reached """
+
+        # Reset truncated and aborted booleans of any earlier attempt
+        self.truncated = self.aborted = False
+
+        # Initialize content
+        content = bytearray()
+
+        # Check if content type is not allowed
+        # A 304 has no body or content type and is checked once revalidated
+        if response.status_code != 304 and not self.is_content_type_allowed(
+            response, content_types
+        ):
+
+            # Set aborted to True
+            self.aborted = True
+
+            # Return response without content
+            return self.set_content(response, content)
+
+        # Iterate over chunks
+        async for chunk in chunks:
+
+            # Add chunk to content and break if should stop reading
+            if self.read_chunk(content, chunk, max_bytes, stream_callback):
+                break
+
+        # Return response
+        return self.set_content(response, content)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ REPLAY                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def replay(self, archive, handoff=None):
+        """ Sets the target's response to its recorded response without any request """
+
+        # Get recorded entry
+        entry = archive.load(_c.GET, self.url)
+
+        # Get metadata
+        meta = entry.meta
+
+        # Set truncated and aborted booleans as they were when recorded
+        # An aborted target then never reaches its yank method, as when recorded
+        self.truncated = meta.get("truncated", False)
+        self.aborted = meta.get("aborted", False)
+
+        # Check if entry is the page of a driver
+        if meta.get("page"):
+
+            # Return after restoring the page and its captured requests
+            return self.replay_page(archive, entry, handoff=handoff)
+
+        # Get URL of the endpoint that was called instead of the target if any
+        handoff_url = meta.get("handoff_url")
+
+        # Initialize request object
+        request = Request(handoff_url or self.url)
+
+        # Append request to requests
+        self.requests.append(request)
+
+        # Set request response to recorded response
+        request.set_response(entry.response)
+
+        # Set handoff request if the target was recorded through a handoff
+        self.handoff_request = request if handoff_url else None
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ REPLAY PAGE                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def replay_page(self, archive, entry, handoff=None):
+        """ Restores a recorded driver page and the requests captured along with it """
+
+        # Get metadata
+        meta = entry.meta
+
+        # Get driver cookies
+        cookies = meta.get("cookies") or []
+
+        # Take a snapshot of the recorded page as a driver fetch would
+        # The page source is then read as a string rather than bytes
+        snapshot = Snapshot(
+            entry.content.decode(),
+            url=meta.get("final_url") or self.url,
+            cookies=cookies if self.yanker.snapshot_cookies else None,
+        )
+
+        # Iterate over requests captured with the page
+        for captured in archive.load_captured(self.url):
+
+            # Initialize request object
+            request = Request(captured.meta["url"], snapshot=snapshot)
+
+            # Set request response to recorded response
+            request.set_response(captured.response)
+
+            # Append request to requests
+            self.requests.append(request)
+
+        # Check if no requests were captured with the page
+        if not self.requests:
+
+            # Initialize request object with the page itself
+            request = Request(self.url, snapshot=snapshot)
+
+            # Set request response to recorded response
+            request.set_response(entry.response)
+
+            # Append request to requests
+            self.requests.append(request)
+
+        # Check if handoff is not null
+        if handoff:
+
+            # Rediscover the endpoint from the captured requests as when recorded
+            self.handoff_request = handoff.discover(
+                self.url, self.requests, cookies=cookies
+            )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ HAND OFF                                                                       │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def hand_off(self, handoff, max_bytes=None):
+        """ Fetches the target's data from a discovered endpoint and returns True """
+
+        # Get endpoint URL
+        endpoint_url = handoff.get_url(self.url)
+
+        # Return False if endpoint URL could not be built
+        if not endpoint_url:
+            return False
+
+        # Get yanker
+        yanker = self.yanker
+
+        # Initialize request kwargs with the endpoint's headers and driver cookies
+        # Cookies are passed per request as a transient requester rejects stored ones
+        request_kwargs = {_c.HEADERS: handoff.headers, "cookies": handoff.cookies}
+
+        # Get cache
+        cache = yanker.cache
+
+        # Get cache entry
+        entry = cache and cache.load(_c.GET, endpoint_url)
+
+        # Initialize try-except block
+        try:
+
+            # Check if cache entry is fresh
+            if entry and entry.is_fresh:
+
+                # Get cached response
+                response = entry.response
+
+            # Otherwise handle case of a missing or stale cache entry
+            else:
+
+                # Check if cache entry is stale
+                if entry:
+
+                    # Add validators so that an unchanged endpoint returns a 304
+                    request_kwargs[_c.HEADERS] = {
+                        **request_kwargs[_c.HEADERS],
+                        **entry.validators,
+                    }
+
+                # Call endpoint with the requester, retrying transient failures
+                response = self.retry(
+                    functools.partial(
+                        self.fetch,
+                        request_kwargs,
+                        max_bytes=max_bytes,
+                        url=endpoint_url,
+                    ),
+                    url=endpoint_url,
+                )
+
+                # Check if cache is not null
+                if cache:
+
+                    # Store response in cache, reusing the cached body if unchanged
+                    response = cache.save(_c.GET, endpoint_url, response, entry)
+
+        # Except failed requests and failing hosts
+        except (RequestException, CircuitOpen):
+
+            # Set response to None
+            response = None
+
+        # Check if response does not look like the original
+        if not handoff.is_valid(response):
+
+            # Increment fallbacks and fall back to the driver
+            handoff.count(hit=False)
+            return False
+
+        # Increment hits
+        handoff.count(hit=True)
+
+        # Record response under the target URL so that a replay needs no discovery
+        archive = yanker.archive
+        archive and archive.record_response(
+            _c.GET, self.url, response, handoff_url=endpoint_url
+        )
+
+        # Initialize request object
+        request = Request(endpoint_url)
+
+        # Set request response
+        request.set_response(response)
+
+        # Append request to requests
+        self.requests.append(request)
+
+        # Set handoff request
+        self.handoff_request = request
+
+        # Return True
+        return True
+
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │ FILTER_REQUESTS                                                                │
     # └────────────────────────────────────────────────────────────────────────────────┘
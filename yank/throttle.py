@@ -0,0 +1,241 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import random
+import threading
+import time
+
+from urllib.parse import urlparse
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ PROJECT IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import yank.constants as _c
+
+from yank.tools import get_domain
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ TOKEN BUCKET                                                                       │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class TokenBucket:
+    """ A thread-safe token bucket that spaces out requests to a single domain """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, throttle_ms, burst=1):
+        """ Init Method """
+
+        # Set throttle ms
+        # This is either a fixed interval or a [min, max] list of a jittered interval
+        self.throttle_ms = throttle_ms
+
+        # Set burst as the number of requests that may be made without waiting
+        self.burst = max(burst or 1, 1)
+
+        # Initialize tokens to a full bucket
+        self.tokens = self.burst
+
+        # Initialize last updated timestamp
+        self.updated_at = time.monotonic()
+
+        # Initialize lock
+        self.lock = threading.Lock()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INTERVAL                                                                       │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @property
+    def interval(self):
+        """ Returns the number of seconds it takes to refill a single token """
+
+        # Get throttle ms
+        throttle_ms = self.throttle_ms
+
+        # Check if throttle ms is a list or tuple
+        if type(throttle_ms) in [list, tuple]:
+
+            # Generate a random integer between min and max
+            throttle_ms = random.randint(min(throttle_ms), max(throttle_ms))
+
+        # Return interval in seconds
+        return throttle_ms / 1000
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RESERVE                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def reserve(self):
+        """ Takes a token and returns the number of seconds to wait before using it """
+
+        # Get interval
+        interval = self.interval
+
+        # Return immediately if interval is null
+        if interval <= 0:
+            return 0
+
+        # Acquire lock
+        with self.lock:
+
+            # Get now
+            now = time.monotonic()
+
+            # Refill tokens for the time elapsed since the last update
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated_at) / interval
+            )
+
+            # Set last updated timestamp
+            self.updated_at = now
+
+            # Take a token
+            self.tokens -= 1
+
+            # Return the time until the token is repaid, if it was borrowed
+            return -self.tokens * interval if self.tokens < 0 else 0
+
+        # NOTE: Tokens may go negative so that concurrent workers queue up behind one
+        # another rather than all waking up at the same time
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ THROTTLE                                                                           │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class Throttle:
+    """ A rate limiter that keeps a token bucket per overridden host or domain """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, throttle_ms=None, burst=1, domain_map=None):
+        """ Init Method """
+
+        # Set default throttle ms
+        self.throttle_ms = throttle_ms
+
+        # Set default burst
+        self.burst = burst
+
+        # Set domain map of per domain overrides
+        self.domain_map = domain_map or {}
+
+        # Initialize buckets
+        self.buckets = {}
+
+        # Initialize lock
+        self.lock = threading.Lock()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET KEY                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_key(self, url):
+        """ Returns the domain map host of a URL or else its registered domain """
+
+        # Get host
+        host = urlparse(url).hostname
+
+        # Return host if it has an override
+        if host and host in self.domain_map:
+            return host
+
+        # NOTE: This lets a subdomain such as api.example.com be throttled on its own
+
+        # Return registered domain
+        return get_domain(url)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET BUCKET                                                                     │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_bucket(self, domain):
+        """ Returns a cached or newly initialized token bucket of a domain """
+
+        # Acquire lock
+        with self.lock:
+
+            # Check if bucket is cached
+            if domain in self.buckets:
+
+                # Return cached bucket
+                return self.buckets[domain]
+
+            # Get throttle ms and burst
+            throttle_ms, burst = self.throttle_ms, self.burst
+
+            # Check if domain has an override
+            if domain in self.domain_map:
+
+                # Get override
+                override = self.domain_map[domain]
+
+                # Check if override is a dict
+                if type(override) is dict:
+
+                    # Get throttle ms and burst from override
+                    throttle_ms = override.get(_c.THROTTLE_MS, throttle_ms)
+                    burst = override.get(_c.BURST, burst)
+
+                # Otherwise handle throttle ms
+                else:
+
+                    # Set throttle ms
+                    throttle_ms = override
+
+            # Initialize bucket if domain is throttled
+            bucket = TokenBucket(throttle_ms, burst=burst) if throttle_ms else None
+
+            # Cache bucket
+            self.buckets[domain] = bucket
+
+            # Return bucket
+            return bucket
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RESERVE                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def reserve(self, url):
+        """ Returns the number of seconds to wait before requesting a URL """
+
+        # Get bucket of URL domain
+        bucket = self.get_bucket(self.get_key(url))
+
+        # Return time to wait or zero if domain is not throttled
+        return bucket.reserve() if bucket else 0
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RECORD                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def record(self, url, latency, status_code=None):
+        """ Records the outcome of a request, which a fixed throttle ignores """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ STATES                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @property
+    def states(self):
+        """ Returns a dict of throttled domains and their throttle ms """
+
+        # Acquire lock
+        with self.lock:
+
+            # Return throttle ms of domains with a bucket
+            return {
+                domain: {_c.THROTTLE_MS: bucket.throttle_ms}
+                for domain, bucket in self.buckets.items()
+                if bucket
+            }
@@ -1 +1,2 @@
 from yank.tools.display import display_commands
+from yank.tools.url import get_domain
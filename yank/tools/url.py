@@ -0,0 +1,24 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import tldextract
+
+from urllib.parse import urlparse
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GET DOMAIN                                                                         │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+def get_domain(url):
+    """ Returns the registered domain of a URL or its netloc if there is none """
+
+    # Extract registered domain from URL
+    domain = tldextract.extract(url).registered_domain
+
+    # NOTE: Hosts such as localhost or raw IP addresses have no registered domain
+
+    # Return registered domain or fall back to netloc
+    return domain or urlparse(url).netloc
@@ -0,0 +1,123 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import hashlib
+import math
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ URL SET                                                                            │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class URLSet(set):
+    """ An exact in-memory set of URLs """
+
+    # Define exact boolean
+    # A URL in the set is certainly in the database
+    exact = True
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ BLOOM FILTER                                                                       │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class BloomFilter:
+    """ A compact probabilistic set of URLs that may report false positives """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CLASS ATTRIBUTES                                                               │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Define exact boolean
+    # A URL in the filter must be confirmed against the database
+    exact = False
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, capacity, error_rate=0.001):
+        """ Init Method """
+
+        # Ensure capacity is at least one
+        capacity = max(int(capacity), 1)
+
+        # Compute optimal number of bits for capacity and error rate
+        bit_count = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+
+        # Set bit count
+        self.bit_count = max(bit_count, 8)
+
+        # Compute optimal number of hashes
+        self.hash_count = max(round(self.bit_count / capacity * math.log(2)), 1)
+
+        # Initialize bits
+        self.bits = bytearray(math.ceil(self.bit_count / 8))
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET POSITIONS                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_positions(self, url):
+        """ Returns the bit positions of a URL using double hashing """
+
+        # Get a single 128-bit digest of the URL
+        digest = hashlib.blake2b(url.encode(), digest_size=16).digest()
+
+        # Split the digest into two 64-bit hashes
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+
+        # Get bit count
+        bit_count = self.bit_count
+
+        # Return bit positions
+        return [(h1 + i * h2) % bit_count for i in range(self.hash_count)]
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ADD                                                                            │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def add(self, url):
+        """ Adds a URL to the filter """
+
+        # Get bits
+        bits = self.bits
+
+        # Iterate over bit positions
+        for position in self.get_positions(url):
+
+            # Set bit
+            bits[position >> 3] |= 1 << (position & 7)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ UPDATE                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def update(self, urls):
+        """ Adds an iterable of URLs to the filter """
+
+        # Iterate over URLs
+        for url in urls:
+
+            # Add URL
+            self.add(url)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CONTAINS                                                                       │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __contains__(self, url):
+        """ Returns False if a URL is certainly not in the filter """
+
+        # Get bits
+        bits = self.bits
+
+        # Return True if every bit of the URL is set
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self.get_positions(url)
+        )
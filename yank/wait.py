@@ -0,0 +1,234 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ SELENIUM IMPORTS                                                                   │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ WAIT CONDITION                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class WaitCondition:
+    """
+    A condition after which a driver stops loading its page
+    Conditions are polled on the driver and may be used with Browser.stop_when or as
+    the wait_for option of a yanker or interface
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CONSTANTS                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Define seconds between polls
+    POLL_FREQUENCY = 0.1
+
+    # Define scripts that mark the document of the page a driver is leaving and that
+    # return whether the driver's document is still that page
+    MARK_SCRIPT = "document.yankPrevious = true;"
+    IS_PREVIOUS_SCRIPT = "return document.yankPrevious === true;"
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, timeout=10):
+        """ Init Method """
+
+        # Set max seconds to wait for the condition
+        self.timeout = timeout
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CALL                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __call__(self, driver):
+        """ Returns a boolean of whether the condition is met """
+
+        # Raise NotImplementedError
+        raise NotImplementedError
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ MARK                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @staticmethod
+    def mark(driver):
+        """ Marks the document of a driver's page before it navigates to another """
+
+        # Mark document so that it is not mistaken for the next page
+        driver.execute_script(WaitCondition.MARK_SCRIPT)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ IS NEW PAGE                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @staticmethod
+    def is_new_page(driver):
+        """ Returns a boolean of whether the driver's document is no longer marked """
+
+        # Return True unless the document is that of the page being left
+        return not driver.execute_script(WaitCondition.IS_PREVIOUS_SCRIPT)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ WAIT                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @staticmethod
+    def wait(driver, condition, timeout):
+        """ Waits for a condition and then stops the driver from loading further """
+
+        # Initialize try-except block
+        try:
+
+            # Wait for the new page to replace a marked one and then for condition
+            # A driver without a page load strategy returns from get while the
+            # previous page is still live, where the condition could already be met
+            WebDriverWait(
+                driver, timeout, poll_frequency=WaitCondition.POLL_FREQUENCY
+            ).until(lambda d: WaitCondition.is_new_page(d) and condition(d))
+
+        # Except conditions that were not met in time
+        except TimeoutException:
+
+            # Pass as whatever has loaded so far is kept rather than failing the page
+            pass
+
+        # Stop further loading
+        driver.execute_script("window.stop();")
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ NETWORK IDLE                                                                       │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class NetworkIdle(WaitCondition):
+    """ Met once the page has parsed and no resource has finished for a while """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CONSTANTS                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Define script that returns the ready state and milliseconds since the last
+    # resource or the document itself finished loading
+    SCRIPT = """
+        var entries = performance.getEntriesByType("resource");
+        var last = entries.reduce(function (m, e) {
+            return Math.max(m, e.responseEnd);
+        }, performance.getEntriesByType("navigation").reduce(function (m, e) {
+            return Math.max(m, e.responseEnd);
+        }, 0));
+        return [document.readyState, performance.now() - last];
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, idle_ms=500, timeout=10):
+        """ Init Method """
+
+        # Initialize wait condition
+        super().__init__(timeout=timeout)
+
+        # Set milliseconds without network activity that count as idle
+        self.idle_ms = idle_ms
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CALL                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __call__(self, driver):
+        """ Returns a boolean of whether the network of the page is idle """
+
+        # Get ready state and milliseconds since the last finished resource
+        ready_state, idle_ms = driver.execute_script(self.SCRIPT)
+
+        # Return False if document is still being parsed or a resource just finished
+        if ready_state == "loading" or idle_ms < self.idle_ms:
+            return False
+
+        # Return True unless Selenium Wire has captured a request without a response
+        # Resource timings only list requests that have already finished
+        return not any(r.response is None for r in getattr(driver, "requests", []))
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ SELECTOR PRESENT                                                                   │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class SelectorPresent(WaitCondition):
+    """ Met once an element matching a CSS selector is in the DOM """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, selector, timeout=10):
+        """ Init Method """
+
+        # Initialize wait condition
+        super().__init__(timeout=timeout)
+
+        # Set CSS selector
+        self.selector = selector
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CALL                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __call__(self, driver):
+        """ Returns a boolean of whether an element matches the selector """
+
+        # Return True if any element matches the selector
+        return bool(driver.find_elements(By.CSS_SELECTOR, self.selector))
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ REQUEST CAPTURED                                                                   │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class RequestCaptured(WaitCondition):
+    """ Met once a request whose URL matches a regular expression has finished """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CONSTANTS                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Define script that returns whether a finished resource matches a pattern
+    SCRIPT = """
+        var pattern = new RegExp(arguments[0]);
+        return performance.getEntriesByType("resource").some(function (e) {
+            return pattern.test(e.name);
+        });
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, pattern, timeout=10):
+        """ Init Method """
+
+        # Initialize wait condition
+        super().__init__(timeout=timeout)
+
+        # Set URL pattern
+        self.pattern = pattern
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CALL                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __call__(self, driver):
+        """ Returns a boolean of whether a matching request has finished """
+
+        # Return True if a finished resource of the page matches the pattern
+        # Resource timings list XHR and fetch requests with or without Selenium Wire
+        return driver.execute_script(self.SCRIPT, self.pattern)
@@ -2,14 +2,22 @@
 # │ GENERAL IMPORTS                                                                    │
 # └────────────────────────────────────────────────────────────────────────────────────┘
 
+import asyncio
 import copy
+import functools
 import inflect
 import inspect
-import random
 import re
 import requests
+import threading
 import time
 
+# Import httpx if installed, which provides the usual async requester
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 # ┌────────────────────────────────────────────────────────────────────────────────────┐
 # │ SQL ALCHEMY IMPORTS                                                                │
 # └────────────────────────────────────────────────────────────────────────────────────┘
@@ -25,10 +33,31 @@ from sqlalchemy.orm import sessionmaker
 
 import yank.constants as _c
 
+from yank.archive import Archive
+from yank.auto_throttle import AutoThrottle
+from yank.block_profile import BlockProfile
 from yank.browser import Browser
-from yank.exceptions import SessionLimitReached
+from yank.cache import ResponseCache
+from yank.capture_scope import CaptureScope
+from yank.checkpoint import Checkpoint
+from yank.driver_manifest import DriverManifest
+from yank.exceptions import (
+    ArchiveMiss,
+    CircuitOpen,
+    SessionLimitReached,
+    UnsupportedDBProfileError,
+)
+from yank.frontier import Frontier
+from yank.handoff import Handoff
+from yank.identity import IdentityStore
+from yank.item_writer import ItemWriter
 from yank.interface import Interface
+from yank.requester import Requester
+from yank.retry import CircuitBreaker, RetryPolicy
+from yank.throttle import Throttle
+from yank.yanker_concurrency_mixin import YankerConcurrencyMixin
 from yank.yanker_display_mixin import YankerDisplayMixin
+from yank.yanker_frontier_mixin import YankerFrontierMixin
 from yank.yanker_util_mixin import YankerUtilMixin
 
 
@@ -52,7 +81,9 @@ DBBase = declarative_base()
 # └────────────────────────────────────────────────────────────────────────────────────┘
 
 
-class Yanker(YankerDisplayMixin, YankerUtilMixin):
+class Yanker(
+    YankerConcurrencyMixin, YankerDisplayMixin, YankerFrontierMixin, YankerUtilMixin
+):
     """ A base class for custom Yanker classes """
 
     # ┌────────────────────────────────────────────────────────────────────────────────┐
@@ -91,6 +122,40 @@ class Yanker(YankerDisplayMixin, YankerUtilMixin):
     SESSION = _c.SESSION
     TRANSIENT = _c.TRANSIENT
 
+    # Database profiles
+    BULK_INGEST = _c.BULK_INGEST
+    READ_HEAVY = _c.READ_HEAVY
+    SAFE = _c.SAFE
+
+    # Define SQLite pragmas by database profile
+    # WAL lets readers such as Yanker.read browse the database while a crawl writes
+    DB_PROFILES = {
+        # Favor write throughput, risking the latest commits on a power loss
+        BULK_INGEST: {
+            "journal_mode": "WAL",
+            "synchronous": "OFF",
+            "mmap_size": 268435456,
+            "cache_size": -65536,
+            "temp_store": "MEMORY",
+        },
+        # Favor durability, syncing every commit to disk
+        SAFE: {
+            "journal_mode": "WAL",
+            "synchronous": "FULL",
+            "mmap_size": 0,
+            "cache_size": -8192,
+            "temp_store": "DEFAULT",
+        },
+        # Favor queries over large databases by mapping and caching more of them
+        READ_HEAVY: {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "mmap_size": 1073741824,
+            "cache_size": -262144,
+            "temp_store": "MEMORY",
+        },
+    }
+
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │ CLASS ATTRIBUTES                                                               │
     # └────────────────────────────────────────────────────────────────────────────────┘
@@ -98,6 +163,12 @@ class Yanker(YankerDisplayMixin, YankerUtilMixin):
     # Define requester
     requester = requests
 
+    # Initialize async requester to None
+    # If set, async yank methods await its get method, e.g. an httpx.AsyncClient
+    # installed through the async extra, i.e. pip install yank[async]
+    # Otherwise the blocking requester is run in the event loop's thread pool
+    requester_async = None
+
     # Initialize Browser class so that users can easily access its constants
     Browser = Browser
 
@@ -115,14 +186,110 @@ class Yanker(YankerDisplayMixin, YankerUtilMixin):
     start_urls = None
 
     # Initialize throttle to None
+    # This is the interval between requests to a domain, or a [min, max] list
     throttle_ms = None
 
+    # Initialize throttle burst to 1
+    # This is the number of requests that may be made to a domain without waiting
+    throttle_burst = 1
+
+    # Initialize throttle map to None
+    # This maps domains to a throttle ms or a dict of throttle_ms and burst
+    # Keys may be registered domains or hosts, such as api.example.com
+    throttle_map = None
+
+    # Initialize auto throttle to False
+    # When True, the delay and concurrency of each domain adapt to its latency and
+    # 429s / 503s, within the bounds below and max_per_domain (or max_workers)
+    auto_throttle = False
+
+    # Initialize starting, min and max delay ms of auto throttle
+    auto_throttle_start_ms = 1000
+    auto_throttle_min_ms = 0
+    auto_throttle_max_ms = 30000
+
+    # Initialize ms by which auto throttle decreases the delay of a healthy domain
+    auto_throttle_step_ms = 100
+
+    # Initialize max workers to None (targets are yanked one at a time)
+    max_workers = None
+
+    # Initialize max concurrent fetches per domain to None (unlimited)
+    max_per_domain = None
+
+    # Initialize number of hosts to keep a connection pool for
+    pool_connections = 10
+
+    # Initialize max number of keep-alive connections per host
+    pool_maxsize = 10
+
+    # Initialize seconds after which idle pooled connections are closed to None
+    pool_idle_timeout = None
+
+    # Initialize max number of retries of a failed request
+    retry_attempts = 3
+
+    # Initialize status codes that are retried
+    retry_statuses = (429, 500, 502, 503, 504)
+
+    # Initialize exceptions that are retried
+    # A connection reset partway through a body raises ChunkedEncodingError
+    # Transport errors of httpx cover connection failures and timeouts of an async
+    # requester such as httpx.AsyncClient
+    retry_exceptions = (
+        requests.ConnectionError,
+        requests.Timeout,
+        requests.exceptions.ChunkedEncodingError,
+        *((httpx.TransportError,) if httpx else ()),
+    )
+
+    # Initialize base ms of the exponential backoff between retries
+    retry_backoff_ms = 500
+
+    # Initialize max ms between retries, including those requested by Retry-After
+    retry_backoff_max_ms = 30000
+
+    # Initialize consecutive failures after which requests to a host are stopped
+    breaker_threshold = 5
+
+    # Initialize seconds after which a stopped host is sent a trial request
+    breaker_cooldown = 30
+
+    # Initialize response cache directory to None (responses are not cached)
+    cache_dir = None
+
+    # Initialize seconds a cached response without a max-age stays fresh
+    # Stale responses are revalidated and reused if the server replies 304
+    cache_ttl = 0
+
+    # Initialize archive path to None (responses are not recorded)
+    archive_path = None
+
+    # Initialize archive mode to record
+    # In replay mode targets are served from the archive without network access
+    archive_mode = Archive.RECORD
+
+    # Initialize max bytes read per response to None (bodies are read in full)
+    max_bytes = None
+
+    # Initialize allowed content types to None (all content types are read)
+    # A response of another content type is not read nor passed to its yank method
+    content_types = None
+
     # Initialize auto headers to False
     auto_headers = False
 
     # Initialize default headers to None
     default_headers = None
 
+    # Initialize identity path to None (harvested identities are not persisted)
+    # Auto headers and, in session mode, the driver's user agent and cookies are
+    # saved to this file and reloaded by later runs so that they need no browser
+    identity_path = None
+
+    # Initialize seconds after which a persisted identity is harvested again
+    identity_ttl = 86400
+
     # Initialize default browser
     default_browser = Browser.CHROME
 
@@ -135,9 +302,69 @@ class Yanker(YankerDisplayMixin, YankerUtilMixin):
     # Initialize driver requests to False
     driver_requests = False
 
+    # Initialize max number of drivers that fetch targets at once
+    driver_pool_size = 1
+
+    # Initialize pages after which a driver is replaced to None (never)
+    driver_recycle_after = None
+
+    # Initialize snapshot cookies to False
+    # Page snapshots then only hold the rendered source and final URL of a page
+    snapshot_cookies = False
+
+    # Initialize directory of webdriver binaries and their manifest to None (default)
+    driver_dir = None
+
+    # Initialize pinned webdriver version to None (latest)
+    driver_version = None
+
+    # Initialize driver offline to False
+    # Offline yankers only launch webdriver binaries that were resolved before
+    driver_offline = False
+
+    # Initialize days after which the latest webdriver version is resolved again
+    driver_max_age_days = 7
+
+    # Initialize resources that drivers do not load to None (all are loaded)
+    # e.g. [BlockProfile.IMAGE, BlockProfile.FONT, "*://ads.example.com/*"]
+    block_resources = None
+
+    # Initialize URL patterns of captured driver requests to None (all are kept)
+    # Requests are only captured when driver requests is True
+    capture_urls = None
+
+    # Initialize content types of captured driver requests to None (all are kept)
+    capture_content_types = None
+
+    # Initialize handoff to None (every target of a driver method loads its page)
+    # Set to True or a URL pattern for driver methods to discover the JSON endpoint
+    # that carries their data and call it with the requester for later targets
+    # Discovery requires driver requests to be True
+    handoff = None
+
+    # Initialize wait condition of driver pages to None (wait for the load event)
+    # e.g. NetworkIdle(500), SelectorPresent(".listing") or RequestCaptured("/api/")
+    wait_for = None
+
     # Initialize database name to None
     db_name = None
 
+    # Initialize database profile to None (SQLite defaults)
+    # e.g. Yanker.BULK_INGEST, Yanker.SAFE or Yanker.READ_HEAVY
+    db_profile = None
+
+    # Initialize seconds between checkpoints of crawl progress
+    checkpoint_interval = 10
+
+    # Initialize number of yielded items written to the database at once
+    db_batch_size = 100
+
+    # Initialize max seconds a yielded item is buffered before it is written
+    db_batch_interval = 5
+
+    # Initialize max number of yielded items waiting for the writer thread
+    db_queue_size = 1000
+
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │ INIT METHOD                                                                    │
     # └────────────────────────────────────────────────────────────────────────────────┘
@@ -147,13 +374,33 @@ class Yanker(YankerDisplayMixin, YankerUtilMixin):
         start_url=None,
         start_urls=None,
         mode="",
+        max_workers=None,
+        max_per_domain=None,
+        cache_dir=None,
+        cache_ttl=None,
+        archive_path=None,
+        archive_mode=None,
+        max_bytes=None,
+        content_types=None,
+        block_resources=None,
+        capture_urls=None,
+        capture_content_types=None,
+        handoff=None,
+        wait_for=None,
         auto_headers=None,
         default_headers=None,
+        identity_path=None,
         default_browser="",
         driver_mode=None,
         driver_headless=None,
         driver_requests=None,
+        driver_pool_size=None,
+        driver_recycle_after=None,
+        driver_dir=None,
+        driver_version=None,
+        driver_offline=None,
         db_name=None,
+        db_profile=None,
     ):
         """ Init Method """
 
@@ -164,6 +411,65 @@ class Yanker(YankerDisplayMixin, YankerUtilMixin):
         # Set inflector
         self.inflector = inflector
 
+        # ┌────────────────────────────────────────────────────────────────────────────┐
+        # │ CONCURRENCY                                                                │
+        # └────────────────────────────────────────────────────────────────────────────┘
+
+        # Set max workers
+        self.max_workers = max_workers or self.max_workers
+
+        # Set max per domain
+        self.max_per_domain = max_per_domain or self.max_per_domain
+
+        # Initialize database lock
+        # The database session is shared and must only be used by one worker at once
+        self.db_lock = threading.RLock()
+
+        # Check if auto throttle is enabled
+        if self.auto_throttle:
+
+            # Initialize auto throttle
+            self.throttle = AutoThrottle(
+                start_ms=self.auto_throttle_start_ms,
+                min_ms=self.auto_throttle_min_ms,
+                max_ms=self.auto_throttle_max_ms,
+                step_ms=self.auto_throttle_step_ms,
+                max_per_domain=self.max_per_domain or self.max_workers,
+            )
+
+        # Otherwise handle case of a fixed throttle
+        else:
+
+            # Initialize throttle
+            self.throttle = Throttle(
+                self.throttle_ms,
+                burst=self.throttle_burst,
+                domain_map=self.throttle_map,
+            )
+
+        # Initialize domain semaphores
+        self._domain_semaphores = {}
+        self._domain_semaphores_lock = threading.Lock()
+        self._domain_semaphores_async = {}
+
+        # ┌────────────────────────────────────────────────────────────────────────────┐
+        # │ RETRY                                                                      │
+        # └────────────────────────────────────────────────────────────────────────────┘
+
+        # Initialize retry policy
+        self.retry_policy = RetryPolicy(
+            attempts=self.retry_attempts,
+            statuses=self.retry_statuses,
+            exceptions=self.retry_exceptions,
+            backoff_ms=self.retry_backoff_ms,
+            backoff_max_ms=self.retry_backoff_max_ms,
+        )
+
+        # Initialize circuit breaker
+        self.circuit_breaker = CircuitBreaker(
+            threshold=self.breaker_threshold, cooldown=self.breaker_cooldown
+        )
+
         # ┌────────────────────────────────────────────────────────────────────────────┐
         # │ MODE                                                                       │
         # └────────────────────────────────────────────────────────────────────────────┘
@@ -171,14 +477,118 @@ class Yanker(YankerDisplayMixin, YankerUtilMixin):
         # Set mode
         self.mode = mode if mode else self.mode
 
+        # Get requester kwargs
+        # The pool holds at least one connection per worker so none are discarded
+        requester_kwargs = {
+            "pool_connections": self.pool_connections,
+            "pool_maxsize": max(self.pool_maxsize, self.max_workers or 1),
+            "pool_idle_timeout": self.pool_idle_timeout,
+        }
+
         # Check if mode is session
         if self.mode == _c.SESSION:
 
             # Set requester to a new requests session
-            self.requester = requests.Session()
+            self.requester = Requester(**requester_kwargs)
 
             # Set default headers
-            self.requester.headers.update(self.default_headers)
+            self.requester.headers.update(self.default_headers or {})
+
+        # Otherwise check if mode is transient and requester is not customized
+        elif self.mode == _c.TRANSIENT and self.requester is requests:
+
+            # Set requester to a session that pools connections but not cookies
+            self.requester = Requester(transient=True, **requester_kwargs)
+
+        # ┌────────────────────────────────────────────────────────────────────────────┐
+        # │ CACHE                                                                      │
+        # └────────────────────────────────────────────────────────────────────────────┘
+
+        # Set cache directory
+        self.cache_dir = cache_dir or self.cache_dir
+
+        # Set cache TTL
+        self.cache_ttl = cache_ttl if cache_ttl is not None else self.cache_ttl
+
+        # Initialize response cache to None
+        self.cache = None
+
+        # Check if cache directory is not null
+        if self.cache_dir:
+
+            # Initialize response cache
+            self.cache = ResponseCache(self.cache_dir, ttl=self.cache_ttl)
+
+        # ┌────────────────────────────────────────────────────────────────────────────┐
+        # │ ARCHIVE                                                                    │
+        # └────────────────────────────────────────────────────────────────────────────┘
+
+        # Set archive path
+        self.archive_path = archive_path or self.archive_path
+
+        # Set archive mode
+        self.archive_mode = archive_mode or self.archive_mode
+
+        # Initialize archive to None
+        self.archive = None
+
+        # Check if archive path is not null
+        if self.archive_path:
+
+            # Initialize archive
+            self.archive = Archive(self.archive_path, self.archive_mode)
+
+        # Check if archive is being replayed
+        if self.archive and self.archive.is_replay:
+
+            # Disable throttle as replayed targets make no requests
+            self.throttle = Throttle()
+
+        # ┌────────────────────────────────────────────────────────────────────────────┐
+        # │ STREAMING                                                                  │
+        # └────────────────────────────────────────────────────────────────────────────┘
+
+        # Set max bytes
+        self.max_bytes = max_bytes or self.max_bytes
+
+        # Set content types
+        self.content_types = content_types or self.content_types
+
+        # ┌────────────────────────────────────────────────────────────────────────────┐
+        # │ RESOURCE BLOCKING                                                          │
+        # └────────────────────────────────────────────────────────────────────────────┘
+
+        # Set block resources
+        self.block_resources = block_resources or self.block_resources
+
+        # ┌────────────────────────────────────────────────────────────────────────────┐
+        # │ CAPTURE SCOPE                                                              │
+        # └────────────────────────────────────────────────────────────────────────────┘
+
+        # Set capture URLs
+        self.capture_urls = capture_urls or self.capture_urls
+
+        # Set capture content types
+        self.capture_content_types = (
+            capture_content_types or self.capture_content_types
+        )
+
+        # ┌────────────────────────────────────────────────────────────────────────────┐
+        # │ HANDOFF                                                                    │
+        # └────────────────────────────────────────────────────────────────────────────┘
+
+        # Set handoff
+        self.handoff = handoff or self.handoff
+
+        # Initialize handoffs by method name
+        self.handoffs = {}
+
+        # ┌────────────────────────────────────────────────────────────────────────────┐
+        # │ WAIT FOR                                                                   │
+        # └────────────────────────────────────────────────────────────────────────────┘
+
+        # Set wait condition
+        self.wait_for = wait_for or self.wait_for
 
         # ┌────────────────────────────────────────────────────────────────────────────┐
         # │ DATABASE                                                                   │
@@ -199,8 +609,29 @@ class Yanker(YankerDisplayMixin, YankerUtilMixin):
             # Set database name as snake case version of class name
             self.db_name = re.sub(r"(?<!^)(?=[A-Z])", "_", class_name).lower()
 
+        # Set database profile
+        self.db_profile = db_profile or self.db_profile
+
+        # Get database profiles
+        db_profiles = self.DB_PROFILES
+
+        # Check if database profile is not supported
+        if self.db_profile and self.db_profile not in db_profiles:
+
+            # Raise UnsupportedDBProfileError
+            raise UnsupportedDBProfileError(
+                f"Database profile '{self.db_profile}' not supported. Please use one "
+                f"of the following: {', '.join(db_profiles)}"
+            )
+
+        # Get pragmas of database profile
+        db_pragmas = db_profiles.get(self.db_profile, {})
+
         # Initialize database engine
-        self.db_engine = create_engine(f"sqlite:///{self.db_name}.db")
+        # Connections may be shared between workers as access is guarded by the lock
+        self.db_engine = create_engine(
+            f"sqlite:///{self.db_name}.db", connect_args={"check_same_thread": False}
+        )
 
         # Setup database engine event listener with SQLite
         @event.listens_for(self.db_engine, "connect")
@@ -209,18 +640,55 @@ class Yanker(YankerDisplayMixin, YankerUtilMixin):
             # Enable case sensitive like / contains
             dbapi_connection.execute("pragma case_sensitive_like=ON")
 
+            # Iterate over pragmas of database profile
+            for pragma, value in db_pragmas.items():
+
+                # Set pragma
+                dbapi_connection.execute(f"pragma {pragma}={value}")
+
             # Register exponent function
             dbapi_connection.create_function("pow", 2, lambda x, y: x ** y)
 
         # Create tables
         DBBase.metadata.create_all(self.db_engine)
 
+        # Iterate over tables
+        for table in DBBase.metadata.sorted_tables:
+
+            # Iterate over indexes of table
+            for index in table.indexes:
+
+                # Create index if missing as create all skips tables that exist
+                index.create(self.db_engine, checkfirst=True)
+
         # Make a database session class
         DBSession = sessionmaker(bind=self.db_engine)
 
         # Initialize database session
         self.db_session = DBSession()
 
+        # Initialize frontier
+        self.frontier = Frontier(self.db_engine, self.db_session, self.db_lock)
+
+        # Initialize names of methods whose frontier entries are stopped
+        self._stopped_methods = set()
+
+        # Initialize item writer
+        self.item_writer = ItemWriter(
+            self.db_session,
+            self.db_lock,
+            batch_size=self.db_batch_size,
+            interval=self.db_batch_interval,
+            queue_size=self.db_queue_size,
+        )
+
+        # Initialize checkpoint
+        self.checkpoint = Checkpoint(
+            self.frontier,
+            interval=self.checkpoint_interval,
+            item_writer=self.item_writer,
+        )
+
         # ┌────────────────────────────────────────────────────────────────────────────┐
         # │ START URLS                                                                 │
         # └────────────────────────────────────────────────────────────────────────────┘
@@ -275,6 +743,54 @@ class Yanker(YankerDisplayMixin, YankerUtilMixin):
             # Update the instance's default headers
             self.default_headers.update(default_headers)
 
+        # ┌────────────────────────────────────────────────────────────────────────────┐
+        # │ IDENTITY                                                                   │
+        # └────────────────────────────────────────────────────────────────────────────┘
+
+        # Set identity path
+        self.identity_path = identity_path or self.identity_path
+
+        # Initialize identity store
+        self.identity = (
+            IdentityStore(self.identity_path, ttl=self.identity_ttl)
+            if self.identity_path
+            else None
+        )
+
+        # Load persisted identity
+        identity = self.identity and self.identity.load()
+
+        # Check if identity is not null
+        if identity:
+
+            # Check if auto headers were persisted
+            if self.auto_headers and identity.get("headers"):
+
+                # Set auto headers cache so that no driver is needed to harvest them
+                self._auto_headers = identity["headers"]
+
+                # Update auto headers by default headers and set default headers
+                self.default_headers = {**self._auto_headers, **self.default_headers}
+
+            # Check if mode is session
+            if self.mode == _c.SESSION:
+
+                # Update session user agent
+                identity.get("user_agent") and self.requester.headers.update(
+                    {"User-Agent": identity["user_agent"]}
+                )
+
+                # Iterate over persisted cookies
+                for c in identity["cookies"]:
+
+                    # Set session cookie
+                    self.requester.cookies.set(
+                        c["name"],
+                        c["value"],
+                        domain=c.get("domain", ""),
+                        path=c.get("path", "/"),
+                    )
+
         # ┌────────────────────────────────────────────────────────────────────────────┐
         # │ WRAP METHODS                                                               │
         # └────────────────────────────────────────────────────────────────────────────┘
@@ -296,8 +812,11 @@ class Yanker(YankerDisplayMixin, YankerUtilMixin):
         self.browser = None
 
         # Determine if Selenium driver is required
+        # Auto headers need no driver if they were loaded from a persisted identity
         driver_is_required = (
-            self.auto_headers or has_driver_callback or has_solve_captcha_callback
+            (self.auto_headers and self._auto_headers is None)
+            or has_driver_callback
+            or has_solve_captcha_callback
         )
 
         # Check if driver is required
@@ -316,62 +835,176 @@ class Yanker(YankerDisplayMixin, YankerUtilMixin):
                 driver_requests if driver_requests is not None else self.driver_requests
             )
 
+            # Set driver pool size and pages after which a driver is replaced
+            self.driver_pool_size = driver_pool_size or self.driver_pool_size
+            self.driver_recycle_after = (
+                driver_recycle_after or self.driver_recycle_after
+            )
+
+            # Get driver offline
+            driver_offline = (
+                driver_offline if driver_offline is not None else self.driver_offline
+            )
+
+            # Initialize manifest of webdriver binaries
+            driver_manifest = DriverManifest(
+                driver_dir=driver_dir or self.driver_dir,
+                version=driver_version or self.driver_version,
+                offline=driver_offline,
+                max_age_days=self.driver_max_age_days,
+            )
+
             # Initialize and set browser
             self.browser = Browser(
                 default_browser,
                 driver_mode=driver_mode,
                 driver_headless=driver_headless,
                 driver_requests=driver_requests,
+                pool_size=self.driver_pool_size,
+                recycle_after=self.driver_recycle_after,
+                driver_manifest=driver_manifest,
             )
 
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │ _YANK                                                                          │
     # └────────────────────────────────────────────────────────────────────────────────┘
 
-    def _yank(self, target=None, **kwargs):
-        """ Runs the yanker on its start URLs """
+    def _yank(self, target=None, resume=False, **kwargs):
+        """
+        Runs the yanker on its start URLs
+        If resume is True, the run continues from the last checkpoint of a stopped run
+        """
 
         # Check if target URL is defined
         if target:
 
-            # Call yank start on target URL and return
-            self.yank_start(target, **kwargs)
-            return
+            # Call yank start on target URL and return its result
+            # This is a coroutine to be awaited in the case of an async yank method
+            return self.yank_start(target, **kwargs)
 
             # NOTE: We do this in case the user calls their initial yank method again
             # which has since been renamed to yank start
 
         # ┌────────────────────────────────────────────────────────────────────────────┐
-        # │ ITERATE OVER START URLS                                                    │
+        # │ CHECKPOINT                                                                 │
         # └────────────────────────────────────────────────────────────────────────────┘
 
-        # Iterate over start URLs
-        for start_url in self.start_urls:
+        # Get start URLs
+        start_urls = self.start_urls
+
+        # Check if resume is True
+        if resume:
+
+            # Restore session counts of interfaces
+            self.checkpoint.restore(self.tables)
+
+            # Get start URLs that were completed by the stopped run
+            done_urls = self.frontier.get_done_urls("yank_start")
+
+            # Skip completed start URLs without fetching or checking them again
+            start_urls = [url for url in start_urls if url not in done_urls]
+
+        # Otherwise handle case of a new run
+        else:
+
+            # Clear session counts of interfaces
+            self.checkpoint.clear(self.tables)
+
+        # Requeue the frontier of a stopped run or clear that of a previous run
+        self.frontier.prepare(resume=resume)
+
+        # Initialize names of methods whose frontier entries are stopped
+        self._stopped_methods = set()
+
+        # Write yielded items from a writer thread for the duration of the run
+        self.item_writer.start()
+
+        # Open archive if it was closed by a previous run
+        self.archive and self.archive.open()
+
+        # Initialize try-except block
+        try:
+
+            # ┌────────────────────────────────────────────────────────────────────────┐
+            # │ YANK ASYNC                                                             │
+            # └────────────────────────────────────────────────────────────────────────┘
+
+            # Check if yank start is a coroutine
+            if inspect.iscoroutinefunction(self.yank_start):
+
+                # Await start URLs and the frontier in a new event loop
+                asyncio.run(self._yank_async(start_urls))
+
+            # ┌────────────────────────────────────────────────────────────────────────┐
+            # │ YANK CONCURRENTLY                                                      │
+            # └────────────────────────────────────────────────────────────────────────┘
+
+            # Otherwise check if yanker is concurrent
+            elif self.is_concurrent:
+
+                # Call yank method on start URLs using a pool of workers
+                self.run_concurrently(self.crawl_start, start_urls)
+
+                # Crawl the frontier
+                self.run_frontier()
+
+            # ┌────────────────────────────────────────────────────────────────────────┐
+            # │ YANK SEQUENTIALLY                                                      │
+            # └────────────────────────────────────────────────────────────────────────┘
+
+            # Otherwise yank start URLs one at a time
+            else:
+
+                # Iterate over start URLs
+                for start_url in start_urls:
+
+                    # Initialize try-except block
+                    try:
+
+                        # Call yank method on start URL
+                        self.crawl_start(start_url)
+
+                        # NOTE: yank_start is actually yank but renamed upon being
+                        # wrapped. This is so that _yank can be renamed to yank,
+                        # which will allow the user to automatigically call
+                        # Yanker.yank() without any arguments
+
+                    # Except session limit reached
+                    except SessionLimitReached:
+
+                        # Continue as the remaining URLs may belong to other interfaces
+                        pass
+
+                # Crawl the frontier
+                self.run_frontier()
+
+        # Except graceful exceptions
+        except KeyboardInterrupt:
 
-            # Initialize try-except block
-            try:
+            # Pass onto end of method
+            pass
 
-                # Call yank method on start URL
-                self.yank_start(start_url)
+        # Except any exception
+        except Exception:
 
-                # NOTE: yank_start is actually yank but renamed upon being wrapped
-                # This is so that _yank can be renamed to yank, which will allow the
-                # user to automatigically call Yanker.yank() without any arguments
+            # Close driver to avoid lingering headless browser instances
+            self.close_driver()
 
-            # Except graceful exceptions
-            except (KeyboardInterrupt, SessionLimitReached):
+            # Re-raise the exception
+            raise
 
-                # Pass onto end of method
-                pass
+        # Write checkpoint however the run ended
+        finally:
 
-            # Except any exception
-            except Exception:
+            # Write queued items and stop the writer thread
+            # This also drains items after a KeyboardInterrupt or SessionLimitReached
+            self.item_writer.stop()
 
-                # Close driver to avoid lingering headless browser instances
-                self.close_driver()
+            # Write completed URLs and session counts
+            self.checkpoint.write(self.tables)
 
-                # Re-raise the exception
-                raise
+            # Close archive so that its records are released
+            self.archive and self.archive.close()
 
         # ┌────────────────────────────────────────────────────────────────────────────┐
         # │ CLOSE DRIVER                                                               │
@@ -380,6 +1013,19 @@ class Yanker(YankerDisplayMixin, YankerUtilMixin):
         # Close driver
         self.close_driver()
 
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ _YANK ASYNC                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def _yank_async(self, start_urls):
+        """ Runs the yanker's async yank method on start URLs and the frontier """
+
+        # Await yank method on start URLs
+        await self.run_async(self.crawl_start_async, start_urls)
+
+        # Crawl the frontier
+        await self.run_frontier_async()
+
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │ YANK                                                                           │
     # └────────────────────────────────────────────────────────────────────────────────┘
@@ -434,6 +1080,7 @@ class Yanker(YankerDisplayMixin, YankerUtilMixin):
             )
 
             # Define wrapper
+            @functools.wraps(method)
             def wrapper(instance, target, *args, **kwargs):
 
                 # Set interface on target
@@ -442,6 +1089,33 @@ class Yanker(YankerDisplayMixin, YankerUtilMixin):
                 # Execute original method
                 return method(instance, target, *args, **kwargs)
 
+            # Check if method is an async generator
+            if inspect.isasyncgenfunction(method):
+
+                # Define async generator wrapper
+                @functools.wraps(method)
+                async def wrapper(instance, target, *args, **kwargs):  # noqa
+
+                    # Set interface on target
+                    target.interface = interface
+
+                    # Iterate over and re-yield items of original method
+                    async for item in method(instance, target, *args, **kwargs):
+                        yield item
+
+            # Otherwise check if method is a coroutine
+            elif inspect.iscoroutinefunction(method):
+
+                # Define coroutine wrapper
+                @functools.wraps(method)
+                async def wrapper(instance, target, *args, **kwargs):  # noqa
+
+                    # Set interface on target
+                    target.interface = interface
+
+                    # Await original method
+                    return await method(instance, target, *args, **kwargs)
+
             # Add the interface as an attribute on the wrapped method
             wrapper.interface = interface
 
@@ -469,6 +1143,7 @@ class Yanker(YankerDisplayMixin, YankerUtilMixin):
             clean_callback,
             has_captcha_callback,
             solve_captcha_callback,
+            stream_callback,
         ):
             """ Wraps a yank method to handle user-defined class logic """
 
@@ -488,6 +1163,9 @@ class Yanker(YankerDisplayMixin, YankerUtilMixin):
                 # Add instance session to interface
                 interface.db_session = self.db_session
 
+                # Reset URL index so that it is built from the instance's database
+                interface._url_index = None
+
                 # Get database table name
                 db_table_name = interface.db_table_name
 
@@ -508,72 +1186,106 @@ class Yanker(YankerDisplayMixin, YankerUtilMixin):
                 # Add interface to tables dict
                 self.tables[db_table_name] = interface
 
-            # Define wrapped method
-            def wrapped(target, *args, **kwargs):
+            # ┌────────────────────────────────────────────────────────────────────────┐
+            # │ FETCH KWARGS                                                           │
+            # └────────────────────────────────────────────────────────────────────────┘
 
-                # ┌────────────────────────────────────────────────────────────────────┐
-                # │ PRE-REQUEST FILTERS                                                │
-                # └────────────────────────────────────────────────────────────────────┘
+            # Get block resources, preferring those of the interface
+            block_resources = (
+                getattr(interface, "block_resources", None) or self.block_resources
+            )
 
-                # Get interface from method if it exists
-                interface = getattr(method, "interface", None)
+            # Get capture URLs and content types, preferring those of the interface
+            capture_urls = getattr(interface, "capture_urls", None) or self.capture_urls
+            capture_content_types = (
+                getattr(interface, "capture_content_types", None)
+                or self.capture_content_types
+            )
 
-                # Check if interface is not null
-                if interface:
+            # Get handoff, preferring that of the interface
+            handoff = getattr(interface, "handoff", None) or self.handoff
 
-                    # ┌────────────────────────────────────────────────────────────────┐
-                    # │ SESSION LIMIT                                                  │
-                    # └────────────────────────────────────────────────────────────────┘
+            # Initialize a handoff if method has a driver callback
+            handoff = Handoff(handoff) if handoff and driver_callback else None
 
-                    # Get interface session limit
-                    session_limit = interface.session_limit
+            # Check if handoff is not null
+            if handoff:
 
-                    # Check if interface session count has reached session limit
-                    if session_limit and interface.session_count >= session_limit:
+                # Add handoff to handoffs by method name
+                self.handoffs[method.__name__] = handoff
 
-                        # Raise SessionLimitReached
-                        raise SessionLimitReached
+            # Get fetch kwargs, preferring those of the interface
+            fetch_kwargs = {
+                "max_bytes": getattr(interface, "max_bytes", None) or self.max_bytes,
+                "content_types": (
+                    getattr(interface, "content_types", None) or self.content_types
+                ),
+                "stream_callback": stream_callback,
+                "block_profile": (
+                    BlockProfile(block_resources) if block_resources else None
+                ),
+                "capture_scope": (
+                    CaptureScope(capture_urls, capture_content_types)
+                    if capture_urls or capture_content_types
+                    else None
+                ),
+                "handoff": handoff,
+                "wait_for": getattr(interface, "wait_for", None) or self.wait_for,
+            }
 
-                    # ┌────────────────────────────────────────────────────────────────┐
-                    # │ SKIP BY URL                                                    │
-                    # └────────────────────────────────────────────────────────────────┘
+            # ┌────────────────────────────────────────────────────────────────────────┐
+            # │ SHOULD SKIP                                                            │
+            # └────────────────────────────────────────────────────────────────────────┘
 
-                    # Get skip by URL boolean
-                    skip_by_url = interface.skip_by_url
+            # Define pre-request filters
+            def should_skip(target):
+                """ Returns a boolean of whether a target URL should not be fetched """
 
-                    # Check if should skip by URL
-                    if skip_by_url:
+                # Return False if interface is null
+                if not interface:
+                    return False
 
-                        # Return None if item with target URL exists
-                        if interface.exists(url=target):
-                            return None
+                # ┌────────────────────────────────────────────────────────────────────┐
+                # │ SESSION LIMIT                                                      │
+                # └────────────────────────────────────────────────────────────────────┘
 
-                # Otherwise handle case of method decorator
-                else:
+                # Get interface session limit
+                session_limit = interface.session_limit
 
-                    pass
+                # Check if interface session count has reached session limit
+                # Items waiting for the writer count as they will be committed
+                if (
+                    session_limit
+                    and self.item_writer.get_session_count(interface) >= session_limit
+                ):
+
+                    # Raise SessionLimitReached
+                    raise SessionLimitReached
 
                 # ┌────────────────────────────────────────────────────────────────────┐
-                # │ MAKE REQUEST                                                       │
+                # │ SKIP BY URL                                                        │
                 # └────────────────────────────────────────────────────────────────────┘
 
-                # Get throttle ms
-                throttle_ms = self.throttle_ms
+                # Return False if should not skip by URL
+                if not interface.skip_by_url:
+                    return False
 
-                # Check if throttle ms is a list or tuple
-                if type(throttle_ms) in [list, tuple]:
+                # Acquire database lock
+                with self.db_lock:
 
-                    # Generate a random integer between min and max
-                    throttle_ms = random.randint(min(throttle_ms), max(throttle_ms))
+                    # Return True if item with target URL exists
+                    # The interface checks its in-memory URL index before the database
+                    return self.item_writer.has_url(
+                        interface, target
+                    ) or interface.has_url(target)
 
-                # Check if throttle ms is not null
-                if throttle_ms:
-
-                    # Implement sleep to throttle the request
-                    time.sleep(throttle_ms / 1000)
+            # ┌────────────────────────────────────────────────────────────────────────┐
+            # │ LOG                                                                    │
+            # └────────────────────────────────────────────────────────────────────────┘
 
-                # Get target object from tarket URL
-                target = self.get(target, driver_callback=driver_callback)
+            # Define request logger
+            def log(target):
+                """ Logs the status code of a fetched target """
 
                 # Get status code
                 status_code = target.status_code
@@ -587,6 +1299,138 @@ class Yanker(YankerDisplayMixin, YankerUtilMixin):
                 # Log request
                 self.console.log(log)
 
+            # Define failed request logger
+            def log_failure(url, exception):
+                """ Logs the exception of a target that could not be fetched """
+
+                # Log request
+                self.console.log(f"GET {url} [bold red]{exception!r}[/]")
+
+            # ┌────────────────────────────────────────────────────────────────────────┐
+            # │ STORE                                                                  │
+            # └────────────────────────────────────────────────────────────────────────┘
+
+            # Define item handler
+            def store(target, item):
+                """ Cleans a yielded item and buffers it to be written """
+
+                # ┌────────────────────────────────────────────────────────────────────┐
+                # │ CLEAN RESULT                                                       │
+                # └────────────────────────────────────────────────────────────────────┘
+
+                # Check if clean callback exists
+                if clean_callback:
+
+                    # Pass result through clean callback
+                    item = clean_callback(target.interface, item) or item
+
+                # ┌────────────────────────────────────────────────────────────────────┐
+                # │ STORE ITEM                                                         │
+                # └────────────────────────────────────────────────────────────────────┘
+
+                # Get interface
+                interface = target.interface
+
+                # Return if interface or item is None
+                if interface is None or item is None:
+                    return
+
+                # Add URL to item
+                item[_c.URL] = target.url
+
+                # Add timestamp to item
+                item[_c.YANKED_AT] = self.now()
+
+                # Convert to a row of cast fields
+                row = interface.new_row(**item)
+
+                # Hand item to the writer, which counts and indexes it once committed
+                # This raises SessionLimitReached if the limit is reached by committed
+                # and pending items, and waits for room if the writer has fallen behind
+                self.item_writer.add(
+                    interface, row, session_limit=interface.session_limit
+                )
+
+            # Define async item handler
+            async def store_async(target, item):
+                """ Cleans and buffers an item in the event loop's thread pool """
+
+                # Get event loop
+                loop = asyncio.get_running_loop()
+
+                # Store item off the event loop as the writer may block under load
+                await loop.run_in_executor(None, store, target, item)
+
+            # ┌────────────────────────────────────────────────────────────────────────┐
+            # │ WRAPPED                                                                │
+            # └────────────────────────────────────────────────────────────────────────┘
+
+            # Define wrapped method
+            @functools.wraps(method)
+            def wrapped(target, *args, **kwargs):
+
+                # Return None if target should be skipped
+                if should_skip(target):
+                    return None
+
+                # ┌────────────────────────────────────────────────────────────────────┐
+                # │ MAKE REQUEST                                                       │
+                # └────────────────────────────────────────────────────────────────────┘
+
+                # Determine if target is served fresh from the cache
+                # A cache hit sends no request, so it neither waits for the throttle
+                # nor takes a fetch slot of the target's domain
+                is_cached = self.is_cached(
+                    target, driver_callback=driver_callback, handoff=handoff
+                )
+
+                # Reserve a request to the target's domain unless it is cached
+                throttle = not is_cached and self.throttle.reserve(target)
+
+                # Check if throttle is not null
+                if throttle:
+
+                    # Implement sleep to throttle the request
+                    time.sleep(throttle)
+
+                # Initialize try-except block
+                try:
+
+                    # Check if target is cached
+                    if is_cached:
+
+                        # Get target object from the cache
+                        target = self.get(
+                            target, driver_callback=driver_callback, **fetch_kwargs
+                        )
+
+                    # Otherwise handle case of a request
+                    else:
+
+                        # Acquire a fetch slot of the target's domain
+                        with self.domain_slot(target):
+
+                            # Get target object from tarket URL
+                            target = self.get(
+                                target, driver_callback=driver_callback, **fetch_kwargs
+                            )
+
+                # Except failures that persisted through retries and replay misses
+                except (ArchiveMiss, CircuitOpen, *self.retry_policy.exceptions) as e:
+
+                    # Log failure
+                    log_failure(target, e)
+
+                    # Return None so that a failing target does not abort the run
+                    return None
+
+                # Log request
+                log(target)
+
+                # Return None if content type of target is not allowed
+                if target.aborted:
+                    return None
+
                 # Check if has captcha callback
                 if has_captcha_callback:
 
@@ -602,63 +1446,164 @@ class Yanker(YankerDisplayMixin, YankerUtilMixin):
                         # Check if solve captcha callback
                         if solve_captcha_callback:
 
-                            # Get the target with captcha callback
-                            target = self.get(
-                                target.url,
-                                driver_callback=driver_callback,
-                                solve_captcha_callback=solve_captcha_callback,
-                            )
+                            # Acquire a fetch slot of the target's domain
+                            with self.domain_slot(target.url):
 
-                            # Get target object from tarket URL
-                            target = self.get(
-                                target.url, driver_callback=driver_callback
-                            )
+                                # Get the target with captcha callback
+                                target = self.get(
+                                    target.url,
+                                    driver_callback=driver_callback,
+                                    solve_captcha_callback=solve_captcha_callback,
+                                    **fetch_kwargs,
+                                )
+
+                                # Get target object from tarket URL
+                                target = self.get(
+                                    target.url,
+                                    driver_callback=driver_callback,
+                                    **fetch_kwargs,
+                                )
 
                 # Iterate over generated items
                 for item in method(target, *args, *kwargs):
 
-                    # ┌────────────────────────────────────────────────────────────────┐
-                    # │ CLEAN RESULT                                                   │
-                    # └────────────────────────────────────────────────────────────────┘
+                    # Clean and store item
+                    store(target, item)
+
+            # ┌────────────────────────────────────────────────────────────────────────┐
+            # │ WRAPPED ASYNC                                                          │
+            # └────────────────────────────────────────────────────────────────────────┘
+
+            # Define wrapped coroutine method
+            @functools.wraps(method)
+            async def wrapped_async(target, *args, **kwargs):
 
-                    # Check if clean callback exists
-                    if clean_callback:
+                # Return None if target should be skipped
+                if should_skip(target):
+                    return None
 
-                        # Pass result through clean callback
-                        item = clean_callback(target.interface, item) or item
+                # ┌────────────────────────────────────────────────────────────────────┐
+                # │ MAKE REQUEST                                                       │
+                # └────────────────────────────────────────────────────────────────────┘
 
-                    # ┌────────────────────────────────────────────────────────────────┐
-                    # │ STORE ITEM                                                     │
-                    # └────────────────────────────────────────────────────────────────┘
+                # Determine if target is served fresh from the cache
+                # A cache hit sends no request, so it neither waits for the throttle
+                # nor takes a fetch slot of the target's domain
+                is_cached = self.is_cached(
+                    target, driver_callback=driver_callback, handoff=handoff
+                )
 
-                    # Get interface
-                    interface = target.interface
+                # Reserve a request to the target's domain unless it is cached
+                throttle = not is_cached and self.throttle.reserve(target)
 
-                    # Check if interface is not None
-                    if interface is not None:
+                # Check if throttle is not null
+                if throttle:
 
-                        # Continue if item is None
-                        if item is None:
-                            continue
+                    # Throttle the request without blocking the event loop
+                    await asyncio.sleep(throttle)
 
-                        # Add URL to item
-                        item[_c.URL] = target.url
+                # Initialize try-except block
+                try:
 
-                        # Add timestamp to item
-                        item[_c.YANKED_AT] = self.now()
+                    # Check if target is cached
+                    if is_cached:
 
-                        # Convert to ORM item
-                        item = interface.new(**item)
+                        # Get target object from the cache
+                        target = await self.get_async(
+                            target, driver_callback=driver_callback, **fetch_kwargs
+                        )
 
-                        # Add anc commit item to database
-                        self.db_session.add(item)
-                        self.db_session.commit()
+                    # Otherwise handle case of a request
+                    else:
 
-                        # Increment interface session count
-                        interface.session_count += 1
+                        # Acquire a fetch slot of the target's domain
+                        async with self.domain_slot_async(target):
+
+                            # Get target object from tarket URL
+                            target = await self.get_async(
+                                target, driver_callback=driver_callback, **fetch_kwargs
+                            )
+
+                # Except failures that persisted through retries and replay misses
+                except (ArchiveMiss, CircuitOpen, *self.retry_policy.exceptions) as e:
+
+                    # Log failure
+                    log_failure(target, e)
+
+                    # Return None so that a failing target does not abort the run
+                    return None
+
+                # Log request
+                log(target)
+
+                # Return None if content type of target is not allowed
+                if target.aborted:
+                    return None
+
+                # Check if has captcha callback
+                if has_captcha_callback:
+
+                    # Check if target has captcha
+                    if has_captcha_callback(target):
+
+                        # Set target has captcha
+                        target.has_captcha = True
+
+                        # Set target captcha solved to False
+                        target.captcha_solved = False
+
+                        # Check if solve captcha callback
+                        if solve_captcha_callback:
+
+                            # Acquire a fetch slot of the target's domain
+                            async with self.domain_slot_async(target.url):
+
+                                # Get the target with captcha callback
+                                target = await self.get_async(
+                                    target.url,
+                                    driver_callback=driver_callback,
+                                    solve_captcha_callback=solve_captcha_callback,
+                                    **fetch_kwargs,
+                                )
+
+                                # Get target object from tarket URL
+                                target = await self.get_async(
+                                    target.url,
+                                    driver_callback=driver_callback,
+                                    **fetch_kwargs,
+                                )
+
+                # Check if method is an async generator
+                if inspect.isasyncgenfunction(method):
+
+                    # Iterate over generated items
+                    async for item in method(target, *args, **kwargs):
+
+                        # Clean and store item
+                        await store_async(target, item)
+
+                    # Return None
+                    return None
+
+                # Await the coroutine's returned items
+                items = await method(target, *args, **kwargs)
+
+                # Convert a single returned item to a list
+                items = [items] if type(items) is dict else items or []
+
+                # Iterate over returned items
+                for item in items:
+
+                    # Clean and store item
+                    await store_async(target, item)
 
             # Return the wrapped method
-            return wrapped
+            return (
+                wrapped_async
+                if inspect.iscoroutinefunction(method)
+                or inspect.isasyncgenfunction(method)
+                else wrapped
+            )
 
         # ┌────────────────────────────────────────────────────────────────────────────┐
         # │ WRAP METHODS                                                               │
@@ -720,6 +1665,9 @@ class Yanker(YankerDisplayMixin, YankerUtilMixin):
                 # Set has has solve captcha callback to True
                 has_solve_captcha_callback = True
 
+            # Get stream callback
+            stream_callback = yank_methods.get(f"{name}__stream")
+
             # Wrap and set yank method
             setattr(
                 self,
@@ -730,6 +1678,7 @@ class Yanker(YankerDisplayMixin, YankerUtilMixin):
                     clean_callback=clean_callback,
                     has_captcha_callback=has_captcha_callback,
                     solve_captcha_callback=solve_captcha_callback,
+                    stream_callback=stream_callback,
                 ),
             )
 
@@ -0,0 +1,212 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import asyncio
+import threading
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import asynccontextmanager, contextmanager
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ PROJECT IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from yank.auto_throttle import AutoThrottle
+from yank.exceptions import SessionLimitReached
+from yank.tools import get_domain
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ YANKER CONCURRENCY MIXIN                                                           │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class YankerConcurrencyMixin:
+    """ Yanker Concurrency Mixin """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ IS CONCURRENT                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @property
+    def is_concurrent(self):
+        """ Returns a boolean of whether the yanker fetches targets concurrently """
+
+        # Return True if more than one worker is allowed
+        return bool(self.max_workers and self.max_workers > 1)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ DOMAIN SLOT                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @contextmanager
+    def domain_slot(self, url):
+        """ Holds one of the limited concurrent fetch slots of a URL's domain """
+
+        # Check if throttle is adaptive
+        if isinstance(self.throttle, AutoThrottle):
+
+            # Hold a slot of the domain's adaptive concurrency and return
+            with self.throttle.slot(url):
+                yield
+            return
+
+        # Get max per domain
+        max_per_domain = self.max_per_domain
+
+        # Yield immediately if there is no per domain limit
+        if not max_per_domain:
+            yield
+            return
+
+        # Get domain
+        domain = get_domain(url)
+
+        # Acquire semaphore lock
+        with self._domain_semaphores_lock:
+
+            # Get or initialize the domain semaphore
+            semaphore = self._domain_semaphores.setdefault(
+                domain, threading.BoundedSemaphore(max_per_domain)
+            )
+
+        # Hold the semaphore for the duration of the fetch
+        with semaphore:
+            yield
+
+        # NOTE: Slots are held around fetches only and not whole yank methods, as
+        # a yank method may call further yank methods on the same domain
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ DOMAIN SLOT ASYNC                                                              │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @asynccontextmanager
+    async def domain_slot_async(self, url):
+        """ Holds one of the limited concurrent fetch slots of a URL's domain """
+
+        # Check if throttle is adaptive
+        if isinstance(self.throttle, AutoThrottle):
+
+            # Hold a slot of the domain's adaptive concurrency and return
+            async with self.throttle.slot_async(url):
+                yield
+            return
+
+        # Get max per domain
+        max_per_domain = self.max_per_domain
+
+        # Yield immediately if there is no per domain limit
+        if not max_per_domain:
+            yield
+            return
+
+        # Get or initialize the domain semaphore
+        # No lock is needed as coroutines only switch at await points
+        semaphore = self._domain_semaphores_async.setdefault(
+            get_domain(url), asyncio.Semaphore(max_per_domain)
+        )
+
+        # Hold the semaphore for the duration of the fetch
+        async with semaphore:
+            yield
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RUN CONCURRENTLY                                                               │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def run_concurrently(self, method, urls):
+        """ Calls a wrapped yank method on a series of URLs using a pool of workers """
+
+        # Get max workers
+        max_workers = self.max_workers
+
+        # Initialize pending futures
+        pending = set()
+
+        # Define a helper to collect finished futures
+        def collect(futures):
+
+            # Iterate over futures
+            for future in futures:
+
+                # Initialize try-except block
+                try:
+
+                    # Raise any exception that occurred in the worker
+                    future.result()
+
+                # Except session limit reached
+                except SessionLimitReached:
+
+                    # Continue as the remaining URLs may belong to other interfaces
+                    pass
+
+        # Initialize a thread pool executor
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+            # Initialize try-except block
+            try:
+
+                # Iterate over URLs
+                for url in urls:
+
+                    # Submit URL to executor
+                    pending.add(executor.submit(method, url))
+
+                    # Check if the pending futures window is full
+                    # This bounds memory on very long lists of URLs
+                    if len(pending) >= max_workers * 2:
+
+                        # Wait for at least one future to finish
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                        # Collect finished futures
+                        collect(done)
+
+                # Wait for remaining futures and collect them
+                collect(wait(pending)[0])
+
+            # Except any exception including KeyboardInterrupt
+            except BaseException:
+
+                # Iterate over pending futures
+                for future in pending:
+
+                    # Cancel future if it has not yet started
+                    future.cancel()
+
+                # Re-raise the exception
+                raise
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RUN ASYNC                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def run_async(self, method, urls):
+        """ Awaits a wrapped async yank method on a series of URLs """
+
+        # Get an iterator of URLs shared by all workers
+        urls = iter(urls)
+
+        # Define worker
+        async def worker():
+
+            # Iterate over URLs not yet taken by another worker
+            for url in urls:
+
+                # Initialize try-except block
+                try:
+
+                    # Await yank method on URL
+                    await method(url)
+
+                # Except session limit reached
+                except SessionLimitReached:
+
+                    # Continue as the remaining URLs may belong to other interfaces
+                    pass
+
+        # Await a worker per allowed URL in flight
+        await asyncio.gather(*[worker() for _ in range(self.max_workers or 1)])
@@ -0,0 +1,229 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import asyncio
+import inspect
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ PROJECT IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from yank.exceptions import SessionLimitReached
+from yank.frontier import Frontier
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ YANKER FRONTIER MIXIN                                                              │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class YankerFrontierMixin:
+    """ Yanker Frontier Mixin """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ENQUEUE                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def enqueue(self, url, method, priority=0):
+        """
+        Schedules a URL to be passed to a yank method once the current work is done
+        Higher priorities are yanked first and duplicate URLs per method are ignored
+        """
+
+        # Get method name if a method was passed in
+        method = method if type(method) is str else method.__name__
+
+        # Convert the initial yank method to its wrapped name
+        method = "yank_start" if method == "yank" else method
+
+        # Add URL to frontier and return whether it was new
+        return self.frontier.push(url, method, priority=priority)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ITER FRONTIER                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def iter_frontier(self):
+        """ Yields frontier entries of methods that have not reached a session limit """
+
+        # Iterate indefinitely
+        while True:
+
+            # Get next entry of a method that has not been stopped
+            entry = self.frontier.pop(excluded_methods=tuple(self._stopped_methods))
+
+            # Return if frontier is empty
+            if entry is None:
+                return
+
+            # Yield entry
+            yield entry
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ COUNT FRONTIER                                                                 │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def count_frontier(self):
+        """ Returns a count of pending frontier entries of methods not stopped """
+
+        # Return count of pending entries
+        return self.frontier.count(
+            Frontier.PENDING, excluded_methods=tuple(self._stopped_methods)
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CRAWL START                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def crawl_start(self, url):
+        """ Passes a start URL to the initial yank method and records its completion """
+
+        # Call yank method on start URL
+        self.yank_start(url)
+
+        # Record start URL as completed
+        self.checkpoint.complete(url, "yank_start", self.tables)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CRAWL START ASYNC                                                              │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def crawl_start_async(self, url):
+        """ Awaits the initial yank method on a start URL and records its completion """
+
+        # Await yank method on start URL
+        await self.yank_start(url)
+
+        # Record start URL as completed
+        self.checkpoint.complete(url, "yank_start", self.tables)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CRAWL                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def crawl(self, entry):
+        """ Passes a frontier entry to its yank method and records its completion """
+
+        # Unpack URL and method name
+        url, method_name = entry
+
+        # Initialize try-except block
+        try:
+
+            # Call yank method on URL
+            getattr(self, method_name)(url)
+
+        # Except any exception including KeyboardInterrupt
+        except BaseException as e:
+
+            # Return entry to the frontier so that it is yanked on resume
+            self.frontier.set_status(url, method_name, Frontier.PENDING)
+
+            # Check if session limit was reached
+            if isinstance(e, SessionLimitReached):
+
+                # Stop handing out further entries of the method only
+                # The entries of other methods may belong to other interfaces
+                self._stopped_methods.add(method_name)
+
+            # Re-raise the exception
+            raise
+
+        # Record entry as completed
+        self.checkpoint.complete(url, method_name, self.tables)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CRAWL ASYNC                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def crawl_async(self, entry):
+        """ Passes a frontier entry to its yank method, awaiting it if async """
+
+        # Unpack URL and method name
+        url, method_name = entry
+
+        # Get method
+        method = getattr(self, method_name)
+
+        # Check if method is blocking
+        if not inspect.iscoroutinefunction(method):
+
+            # Get event loop
+            loop = asyncio.get_running_loop()
+
+            # Crawl entry in the event loop's thread pool so that other coroutines run
+            return await loop.run_in_executor(None, self.crawl, entry)
+
+        # Initialize try-except block
+        try:
+
+            # Await yank method on URL
+            await method(url)
+
+        # Except any exception including cancellation
+        except BaseException as e:
+
+            # Return entry to the frontier so that it is yanked on resume
+            self.frontier.set_status(url, method_name, Frontier.PENDING)
+
+            # Check if session limit was reached
+            if isinstance(e, SessionLimitReached):
+
+                # Stop handing out further entries of the method only
+                # The entries of other methods may belong to other interfaces
+                self._stopped_methods.add(method_name)
+
+            # Re-raise the exception
+            raise
+
+        # Record entry as completed
+        self.checkpoint.complete(url, method_name, self.tables)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RUN FRONTIER                                                                   │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def run_frontier(self):
+        """ Crawls the frontier until it is empty or a session limit is reached """
+
+        # Iterate while entries of methods that have not been stopped are pending
+        # Entries may be enqueued by workers after the iterator has run dry
+        while self.count_frontier():
+
+            # Check if yanker is concurrent
+            if self.is_concurrent:
+
+                # Crawl frontier entries using a pool of workers
+                self.run_concurrently(self.crawl, self.iter_frontier())
+
+                # Continue to check for newly enqueued entries
+                continue
+
+            # Iterate over frontier entries
+            for entry in self.iter_frontier():
+
+                # Initialize try-except block
+                try:
+
+                    # Crawl entry
+                    self.crawl(entry)
+
+                # Except session limit reached
+                except SessionLimitReached:
+
+                    # Pass onto the end of the frontier
+                    pass
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RUN FRONTIER ASYNC                                                             │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def run_frontier_async(self):
+        """ Crawls the frontier with async yank methods until it is empty """
+
+        # Iterate while entries of methods that have not been stopped are pending
+        while self.count_frontier():
+
+            # Crawl frontier entries using a number of async workers
+            await self.run_async(self.crawl_async, self.iter_frontier())
@@ -28,7 +28,20 @@ class YankerUtilMixin:
     # │ REQUEST                                                                        │
     # └────────────────────────────────────────────────────────────────────────────────┘
 
-    def request(self, url, method, driver_callback=None, solve_captcha_callback=None):
+    def request(
+        self,
+        url,
+        method,
+        driver_callback=None,
+        solve_captcha_callback=None,
+        max_bytes=None,
+        content_types=None,
+        stream_callback=None,
+        block_profile=None,
+        capture_scope=None,
+        handoff=None,
+        wait_for=None,
+    ):
         """ Performs an HTTP request on a Target object """
 
         # Initialize target object from URL
@@ -41,6 +54,13 @@ class YankerUtilMixin:
             target.get(
                 driver_callback=driver_callback,
                 solve_captcha_callback=solve_captcha_callback,
+                max_bytes=max_bytes,
+                content_types=content_types,
+                stream_callback=stream_callback,
+                block_profile=block_profile,
+                capture_scope=capture_scope,
+                handoff=handoff,
+                wait_for=wait_for,
             )
 
         # Return target
@@ -50,7 +70,19 @@ class YankerUtilMixin:
     # │ GET                                                                            │
     # └────────────────────────────────────────────────────────────────────────────────┘
 
-    def get(self, url, driver_callback=None, solve_captcha_callback=None):
+    def get(
+        self,
+        url,
+        driver_callback=None,
+        solve_captcha_callback=None,
+        max_bytes=None,
+        content_types=None,
+        stream_callback=None,
+        block_profile=None,
+        capture_scope=None,
+        handoff=None,
+        wait_for=None,
+    ):
         """ Performs an HTTP GET request on a Target object """
 
         # Make GET request and return target
@@ -59,8 +91,179 @@ class YankerUtilMixin:
             method=_c.GET,
             driver_callback=driver_callback,
             solve_captcha_callback=solve_captcha_callback,
+            max_bytes=max_bytes,
+            content_types=content_types,
+            stream_callback=stream_callback,
+            block_profile=block_profile,
+            capture_scope=capture_scope,
+            handoff=handoff,
+            wait_for=wait_for,
         )
 
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ REQUEST ASYNC                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def request_async(
+        self,
+        url,
+        method,
+        driver_callback=None,
+        solve_captcha_callback=None,
+        max_bytes=None,
+        content_types=None,
+        stream_callback=None,
+        block_profile=None,
+        capture_scope=None,
+        handoff=None,
+        wait_for=None,
+    ):
+        """ Performs an awaitable HTTP request on a Target object """
+
+        # Initialize target object from URL
+        target = Target(url=url, yanker=self)
+
+        # Handle case of GET
+        if method == _c.GET:
+
+            # Await GET method on target
+            await target.get_async(
+                driver_callback=driver_callback,
+                solve_captcha_callback=solve_captcha_callback,
+                max_bytes=max_bytes,
+                content_types=content_types,
+                stream_callback=stream_callback,
+                block_profile=block_profile,
+                capture_scope=capture_scope,
+                handoff=handoff,
+                wait_for=wait_for,
+            )
+
+        # Return target
+        return target
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET ASYNC                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def get_async(
+        self,
+        url,
+        driver_callback=None,
+        solve_captcha_callback=None,
+        max_bytes=None,
+        content_types=None,
+        stream_callback=None,
+        block_profile=None,
+        capture_scope=None,
+        handoff=None,
+        wait_for=None,
+    ):
+        """ Performs an awaitable HTTP GET request on a Target object """
+
+        # Make GET request and return target
+        return await self.request_async(
+            url,
+            method=_c.GET,
+            driver_callback=driver_callback,
+            solve_captcha_callback=solve_captcha_callback,
+            max_bytes=max_bytes,
+            content_types=content_types,
+            stream_callback=stream_callback,
+            block_profile=block_profile,
+            capture_scope=capture_scope,
+            handoff=handoff,
+            wait_for=wait_for,
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CONNECTION REUSES                                                              │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @property
+    def connection_reuses(self):
+        """ Returns the number of requests sent over an already open connection """
+
+        # Return connection reuses of requester if it keeps count
+        return getattr(self.requester, "connection_reuses", 0)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CACHE HITS                                                                     │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @property
+    def cache_hits(self):
+        """ Returns the number of responses served or revalidated from the cache """
+
+        # Return cache hits if cache is enabled
+        return self.cache.hits if self.cache else 0
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CACHE MISSES                                                                   │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @property
+    def cache_misses(self):
+        """ Returns the number of responses that had to be downloaded in full """
+
+        # Return cache misses if cache is enabled
+        return self.cache.misses if self.cache else 0
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ IS CACHED                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def is_cached(self, url, driver_callback=None, handoff=None):
+        """ Returns a boolean of whether a URL would be served fresh from the cache """
+
+        # Get cache
+        cache = self.cache
+
+        # Return False if there is no cache
+        if not cache:
+            return False
+
+        # Initialize target object from URL
+        target = Target(url=url, yanker=self)
+
+        # Check if target is fetched with a driver
+        if target.should_use_driver(driver_callback):
+
+            # Get URL of a discovered endpoint, which is fetched instead of the page
+            url = handoff and handoff.get_url(url)
+
+            # Return False if the page is loaded by a driver, which is never cached
+            if not url:
+                return False
+
+        # Return True if a fresh response of the URL is cached
+        return cache.is_fresh(_c.GET, url)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ STATS                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @property
+    def stats(self):
+        """ Returns a dict of counters of the requests made during the run """
+
+        # Return stats
+        return {
+            "connection_reuses": self.connection_reuses,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "retries": self.retry_policy.retries,
+            "failures": self.retry_policy.failures,
+            "circuit_rejections": self.circuit_breaker.rejections,
+            "circuits": self.circuit_breaker.states,
+            "throttles": self.throttle.states,
+            "driver_replacements": self.browser.replaced if self.browser else 0,
+            "handoffs": {
+                name: {"hits": handoff.hits, "fallbacks": handoff.fallbacks}
+                for name, handoff in self.handoffs.items()
+            },
+        }
+
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │ URLJOIN                                                                        │
     # └────────────────────────────────────────────────────────────────────────────────┘
@@ -116,18 +319,13 @@ class YankerUtilMixin:
     # └────────────────────────────────────────────────────────────────────────────────┘
 
     def close_driver(self):
-        """ Closes the yanker's active driver """
+        """ Closes the yanker's active drivers """
 
         # Get browser
         browser = self.browser
 
-        # Get drivers
-        driver = browser and browser.driver
-        driver_quick = browser and browser._driver_quick
-
-        # Close drivers
-        driver and driver.quit()
-        driver_quick and driver_quick.quit()
+        # Close browser drivers without initializing any
+        browser and browser.close()
 
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │ NOW                                                                            │